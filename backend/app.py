@@ -1,19 +1,137 @@
-from flask import Flask, request, jsonify, send_from_directory
+from flask import Flask, request, jsonify, send_from_directory, Response, g
 from flask_cors import CORS
 import os
 import json
+import logging
+import threading
+import time
 from dotenv import load_dotenv
 from processor import NewsProcessingService
-import traceback
+from jobs import JobManager
+from batch import BatchProcessor
+import metrics
+import profiling
+import atexit
 
 # 환경변수 로드
 load_dotenv()
 
+# 로그 레벨 (기본 INFO - 요청마다 반복되는 단계별 로그는 DEBUG에서만 출력)
+logging.basicConfig(
+    level=os.getenv('LOG_LEVEL', 'INFO').upper(),
+    format='%(asctime)s %(levelname)s %(name)s: %(message)s'
+)
+logger = logging.getLogger(__name__)
+
 app = Flask(__name__)
 CORS(app)  # CORS 허용
 
-# 서비스 초기화
-news_service = NewsProcessingService()
+# 서비스 (브라우저 풀, 커넥션 풀, 스레드 풀, SQLite 연결을 가지므로 프로세스마다 따로 만든다)
+news_service = None
+job_manager = None
+batch_processor = None
+_services_lock = threading.Lock()
+# 종료 중이면 새 작업을 받지 않음 (실행 중인 작업은 마저 처리)
+_draining = threading.Event()
+
+def init_services():
+    """이 프로세스의 서비스 생성 (이미 있으면 그대로)
+    
+    gunicorn은 앱을 미리 import 한 뒤 fork 하므로(preload_app), 스레드/브라우저/소켓을
+    부모 프로세스에서 만들면 워커들이 망가진 상태를 물려받는다. 그래서 wsgi.py는
+    LAZY_SERVICES=true 로 import 하고 워커마다 fork 후에 이 함수를 호출한다.
+    """
+    global news_service, job_manager, batch_processor
+    with _services_lock:
+        if news_service is not None:
+            return
+        service = NewsProcessingService()
+        job_manager = JobManager(service)
+        batch_processor = BatchProcessor(service)
+        news_service = service
+        atexit.register(shutdown_services)
+        logger.info("서비스 초기화 완료 (pid %s)", os.getpid())
+
+def begin_draining():
+    """종료를 시작할 때(종료 신호를 받은 즉시) 호출 - 헬스 체크는 draining, 새 작업 등록은 거부"""
+    if not _draining.is_set():
+        _draining.set()
+        logger.info("종료 시작, 새 작업을 받지 않음 (pid %s)", os.getpid())
+
+def shutdown_services(wait: bool = True):
+    """새 작업을 막고, wait=True 이면 실행 중인 작업이 끝날 때까지 기다린 뒤 리소스 정리"""
+    global news_service
+    begin_draining()
+    with _services_lock:
+        service, news_service = news_service, None
+        if service is None:
+            return
+        logger.info("서비스 종료 중 (pid %s, 진행 중인 작업 대기: %s)", os.getpid(), wait)
+        job_manager.shutdown(wait=wait)
+        batch_processor.shutdown(wait=wait)
+        service.shutdown()
+        metrics.flush()
+
+def _init_at_import() -> bool:
+    """import 시점에 서비스를 만들지 여부
+
+    python app.py 로 실행하면
+    - 디버그 리로더의 부모 프로세스는 파일 변경만 감시하고 요청은 자식(WERKZEUG_RUN_MAIN=true)이
+      받으므로 부모에서는 만들지 않는다
+    - 파싱 풀 워커 프로세스(forkserver)가 이 파일을 __mp_main__ 으로 다시 import 하므로
+      그때도 만들지 않는다
+    """
+    if os.getenv('LAZY_SERVICES', 'false').lower() == 'true' or __name__ == '__mp_main__':
+        return False
+    if __name__ == '__main__':
+        return os.environ.get('WERKZEUG_RUN_MAIN') == 'true'
+    return True
+
+if _init_at_import():
+    init_services()
+
+@app.before_request
+def start_request_timer():
+    g.request_started = time.perf_counter()
+    # post_fork 훅 없이 LAZY_SERVICES로 실행한 경우 첫 요청에서 초기화
+    if news_service is None and not _draining.is_set():
+        init_services()
+
+@app.after_request
+def record_request_metrics(response):
+    """엔드포인트별 요청 수/응답 시간 기록 (SSE는 응답 시작까지의 시간)"""
+    started = g.pop('request_started', None)
+    endpoint = request.url_rule.rule if request.url_rule else 'unmatched'
+    metrics.HTTP_REQUESTS.inc(endpoint=endpoint, method=request.method, status=response.status_code)
+    if started is not None:
+        metrics.HTTP_REQUEST_SECONDS.observe(time.perf_counter() - started, endpoint=endpoint)
+    return response
+
+def _profile_mode():
+    """X-Profile 헤더 또는 ?profile= 로 요청한 프로파일러 종류 - (모드, 거부 응답)
+
+    관리자 토큰(X-Admin-Token)이 ADMIN_TOKEN과 같을 때만 허용한다.
+    """
+    mode = profiling.parse_mode(request.headers.get('X-Profile') or request.args.get('profile'))
+    if mode is None:
+        return None, None
+    if not profiling.authorized(request.headers.get('X-Admin-Token')):
+        return None, (jsonify({
+            'success': False,
+            'error': '프로파일링은 관리자만 사용할 수 있습니다'
+        }), 403)
+    return mode, None
+
+def _run_profiled(mode, label: str, fn):
+    """mode가 있으면 fn 실행을 프로파일링해서 결과에 profile을 붙임"""
+    if mode is None:
+        return fn()
+    with profiling.profile(mode, label) as profile:
+        result = fn()
+    return dict(result, profile=profile.report())
+
+# /api/translate 묶음 번역 한 번에 받을 최대 텍스트 수
+TRANSLATE_BATCH_MAX_TEXTS = int(os.getenv('TRANSLATE_BATCH_MAX_TEXTS', '200'))
 
 @app.route('/api/scrape', methods=['POST'])
 def scrape_article():
@@ -28,14 +146,20 @@ def scrape_article():
                 'error': 'URL이 필요합니다'
             }), 400
         
-        # 기사 처리
-        result = news_service.process_article(url)
+        profile_mode, denied = _profile_mode()
+        if denied:
+            return denied
+        
+        # 기사 처리 (refresh=true 이면 캐시를 건너뛰고 다시 처리)
+        result = _run_profiled(
+            profile_mode, f'scrape {url}',
+            lambda: news_service.process_article(url, use_cache=not data.get('refresh', False))
+        )
         
         return jsonify(result)
         
     except Exception as e:
-        print(f"스크래핑 오류: {e}")
-        print(traceback.format_exc())
+        logger.exception("스크래핑 오류: %s", e)
         return jsonify({
             'success': False,
             'error': f'서버 오류: {str(e)}'
@@ -49,6 +173,28 @@ def translate_text():
         text = data.get('text')
         target_lang = data.get('target_lang', 'ko')
         
+        # texts 배열이면 묶어서 한 번에 번역 (뉴스 목록의 제목/설명 등)
+        texts = data.get('texts')
+        if texts is not None:
+            if not isinstance(texts, list) or not texts:
+                return jsonify({
+                    'success': False,
+                    'error': '번역할 텍스트 목록이 필요합니다'
+                }), 400
+            if len(texts) > TRANSLATE_BATCH_MAX_TEXTS:
+                return jsonify({
+                    'success': False,
+                    'error': f'한 번에 최대 {TRANSLATE_BATCH_MAX_TEXTS}개까지 번역할 수 있습니다'
+                }), 400
+            
+            translations = news_service.translator.translate_batch(texts, target_lang)
+            return jsonify({
+                'success': True,
+                'originals': texts,
+                'translations': translations,
+                'failed': sum(1 for original, translated in zip(texts, translations) if original and translated is None)
+            })
+        
         if not text:
             return jsonify({
                 'success': False,
@@ -70,7 +216,7 @@ def translate_text():
             }), 500
             
     except Exception as e:
-        print(f"번역 오류: {e}")
+        logger.exception("번역 오류: %s", e)
         return jsonify({
             'success': False,
             'error': f'서버 오류: {str(e)}'
@@ -105,7 +251,7 @@ def summarize_text():
             }), 500
             
     except Exception as e:
-        print(f"요약 오류: {e}")
+        logger.exception("요약 오류: %s", e)
         return jsonify({
             'success': False,
             'error': f'서버 오류: {str(e)}'
@@ -124,25 +270,217 @@ def process_full_article():
                 'error': 'URL이 필요합니다'
             }), 400
         
-        # 전체 처리
-        result = news_service.process_article(url)
+        # 작업 모드: 작업 ID를 바로 반환하고 백그라운드에서 처리
+        if data.get('async') or request.args.get('mode') == 'job':
+            if _draining.is_set():
+                return jsonify({
+                    'success': False,
+                    'error': '서버가 종료 중입니다. 잠시 후 다시 시도하세요'
+                }), 503
+            job = job_manager.submit(url, use_cache=not data.get('refresh', False))
+            return jsonify({
+                'success': True,
+                'job_id': job.id,
+                'status': job.status,
+                'status_url': f'/api/jobs/{job.id}'
+            }), 202
+        
+        profile_mode, denied = _profile_mode()
+        if denied:
+            return denied
+        
+        # 전체 처리 (refresh=true 이면 캐시를 건너뛰고 다시 처리)
+        result = _run_profiled(
+            profile_mode, f'process {url}',
+            lambda: news_service.process_article(url, use_cache=not data.get('refresh', False))
+        )
         
         return jsonify(result)
         
     except Exception as e:
-        print(f"전체 처리 오류: {e}")
-        print(traceback.format_exc())
+        logger.exception("전체 처리 오류: %s", e)
         return jsonify({
             'success': False,
             'error': f'서버 오류: {str(e)}'
         }), 500
 
+def _sse(event: str, data) -> str:
+    """Server-Sent Events 메시지 형식으로 변환"""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+@app.route('/api/process/stream', methods=['GET'])
+def process_article_stream():
+    """기사 처리 결과 스트리밍 API (Server-Sent Events)"""
+    url = request.args.get('url')
+    
+    if not url:
+        return jsonify({
+            'success': False,
+            'error': 'URL이 필요합니다'
+        }), 400
+    
+    use_cache = request.args.get('refresh', '').lower() not in ('1', 'true')
+    
+    def generate():
+        try:
+            for event, data in news_service.process_article_stream(url, use_cache=use_cache):
+                yield _sse(event, data)
+        except Exception as e:
+            logger.exception("스트리밍 처리 오류: %s", e)
+            yield _sse('error', {
+                'success': False,
+                'error': f'서버 오류: {str(e)}'
+            })
+    
+    return Response(generate(), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'
+    })
+
+@app.route('/api/process/batch', methods=['POST'])
+def process_batch():
+    """여러 기사 일괄 처리 API (끝나는 순서대로 결과 반환)"""
+    try:
+        data = request.get_json()
+        urls = data.get('urls')
+        
+        if not isinstance(urls, list) or not urls:
+            return jsonify({
+                'success': False,
+                'error': 'URL 목록이 필요합니다'
+            }), 400
+        
+        items, invalid = batch_processor.dedupe(urls)
+        duplicates = batch_processor.duplicates(items)
+        # 결과 수 = 중복 제거한 URL 수 + 잘못된 항목 수
+        total = len(items) + len(invalid)
+        if len(items) > batch_processor.max_urls:
+            return jsonify({
+                'success': False,
+                'error': f'한 번에 최대 {batch_processor.max_urls}개까지 처리할 수 있습니다'
+            }), 400
+        
+        use_cache = not data.get('refresh', False)
+        
+        # stream=true 이면 기사 하나가 끝날 때마다 SSE로 전송
+        if data.get('stream') or request.args.get('stream', '').lower() in ('1', 'true'):
+            def generate():
+                yield _sse('start', {'total': total, 'duplicates': duplicates, 'invalid': len(invalid)})
+                completed = 0
+                try:
+                    for result in batch_processor.process(urls, use_cache=use_cache):
+                        completed += 1
+                        yield _sse('result', result)
+                    yield _sse('done', {'total': total, 'completed': completed})
+                except Exception as e:
+                    logger.exception("일괄 처리 스트리밍 오류: %s", e)
+                    yield _sse('error', {
+                        'success': False,
+                        'error': f'서버 오류: {str(e)}'
+                    })
+            
+            return Response(generate(), mimetype='text/event-stream', headers={
+                'Cache-Control': 'no-cache',
+                'X-Accel-Buffering': 'no'
+            })
+        
+        results = list(batch_processor.process(urls, use_cache=use_cache))
+        
+        return jsonify({
+            'success': True,
+            'total': total,
+            'duplicates': duplicates,
+            'invalid': len(invalid),
+            'succeeded': sum(1 for result in results if result.get('success')),
+            'results': results
+        })
+        
+    except Exception as e:
+        logger.exception("일괄 처리 오류: %s", e)
+        return jsonify({
+            'success': False,
+            'error': f'서버 오류: {str(e)}'
+        }), 500
+
+@app.route('/api/jobs/<job_id>', methods=['GET'])
+def get_job(job_id):
+    """작업 진행 상황/부분 결과/최종 결과 조회"""
+    job = job_manager.get(job_id)
+    if job is None:
+        return jsonify({
+            'success': False,
+            'error': '작업을 찾을 수 없습니다'
+        }), 404
+    
+    return jsonify(dict(job.to_dict(), success=True))
+
+@app.route('/api/stats', methods=['GET'])
+def service_stats():
+    """커넥션 풀/브라우저 풀 상태 확인 (응답한 워커 프로세스 기준)"""
+    # 풀/캐시 상태는 워커 프로세스마다 따로 있으므로 응답한 워커의 pid를 함께 보냄
+    return jsonify(dict(news_service.stats(), jobs=job_manager.stats(), batch=batch_processor.stats(),
+                        pid=os.getpid()))
+
+@app.route('/api/stats/selectors', methods=['GET'])
+def selector_stats():
+    """도메인별 선택자 학습 통계 (?domain= 으로 선택자별 점수 조회)"""
+    domain = request.args.get('domain')
+    stats = news_service.selector_stats(domain.lower() if domain else None)
+    if stats is None:
+        return jsonify({
+            'success': False,
+            'error': '선택자 학습이 꺼져 있습니다 (ADAPTIVE_SELECTORS=false)'
+        }), 404
+    
+    return jsonify(dict(stats, success=True))
+
+@app.route('/api/metrics', methods=['GET'])
+def prometheus_metrics():
+    """Prometheus 텍스트 형식 지표 (단계별 지연 시간, 대체 경로 비율, 선택자 적중, 토큰 사용량, 오류)"""
+    if not metrics.ENABLED:
+        return jsonify({
+            'success': False,
+            'error': '지표 수집이 꺼져 있습니다 (METRICS_ENABLED=false)'
+        }), 404
+    
+    return Response(metrics.render(), mimetype='text/plain; version=0.0.4; charset=utf-8')
+
+@app.route('/api/profiles', methods=['GET'])
+@app.route('/api/profiles/<profile_id>', methods=['GET'])
+def get_profile(profile_id=None):
+    """저장된 프로파일 조회 (관리자 전용, ?format=collapsed 이면 flamegraph용 텍스트)"""
+    if not profiling.authorized(request.headers.get('X-Admin-Token')):
+        return jsonify({
+            'success': False,
+            'error': '프로파일링은 관리자만 사용할 수 있습니다'
+        }), 403
+    
+    if profile_id is None:
+        return jsonify({'success': True, 'profiles': profiling.store.list()})
+    
+    profile = profiling.store.get(profile_id)
+    if profile is None:
+        return jsonify({
+            'success': False,
+            'error': '프로파일을 찾을 수 없습니다'
+        }), 404
+    
+    if request.args.get('format') == 'collapsed':
+        return Response(profile.collapsed(), mimetype='text/plain; charset=utf-8')
+    return jsonify(dict(profile.report(), success=True))
+
 @app.route('/api/health', methods=['GET'])
 def health_check():
-    """서버 상태 확인"""
+    """서버 상태 확인 (종료 중이면 503 - 로드밸런서가 새 요청을 다른 워커로 보내도록)"""
+    if _draining.is_set():
+        return jsonify({
+            'status': 'draining',
+            'message': 'News Processing API is shutting down'
+        }), 503
     return jsonify({
         'status': 'healthy',
-        'message': 'News Processing API is running'
+        'message': 'News Processing API is running',
+        'pid': os.getpid()
     })
 
 @app.route('/', methods=['GET'])
@@ -152,9 +490,16 @@ def index():
         'message': 'News Processing API',
         'endpoints': {
             'POST /api/scrape': '기사 스크래핑',
-            'POST /api/translate': '텍스트 번역',
+            'POST /api/translate': '텍스트 번역 ("texts": [...] 이면 묶음 번역)',
             'POST /api/summarize': '텍스트 요약',
-            'POST /api/process': '전체 기사 처리',
+            'POST /api/process': '전체 기사 처리 ("async": true 이면 작업 ID 반환)',
+            'POST /api/process/batch': '여러 기사 일괄 처리 ("stream": true 이면 SSE)',
+            'GET /api/jobs/<job_id>': '작업 진행 상황/결과 조회',
+            'GET /api/process/stream?url=': '기사 처리 결과 스트리밍 (SSE)',
+            'GET /api/stats': '커넥션 풀/캐시/브라우저 풀 상태',
+            'GET /api/stats/selectors?domain=': '도메인별 선택자 학습 통계',
+            'GET /api/metrics': 'Prometheus 지표',
+            'GET /api/profiles/<id>': '저장된 프로파일 조회 (관리자 전용, ?format=collapsed)',
             'GET /api/health': '서버 상태 확인'
         },
         'example': {
@@ -166,11 +511,14 @@ def index():
 
 if __name__ == '__main__':
     # 환경변수 확인
-    print("환경변수 확인:")
-    print(f"Google Translate API Key: {'설정됨' if os.getenv('GOOGLE_TRANSLATE_API_KEY') else '미설정'}")
-    print(f"DeepL API Key: {'설정됨' if os.getenv('DEEPL_API_KEY') else '미설정'}")
-    print(f"OpenAI API Key: {'설정됨' if os.getenv('OPENAI_API_KEY') else '미설정'}")
-    print(f"Claude API Key: {'설정됨' if os.getenv('CLAUDE_API_KEY') else '미설정'}")
+    logger.info("환경변수 확인:")
+    for name, key in [('Google Translate', 'GOOGLE_TRANSLATE_API_KEY'), ('DeepL', 'DEEPL_API_KEY'),
+                      ('OpenAI', 'OPENAI_API_KEY'), ('Claude', 'CLAUDE_API_KEY')]:
+        logger.info("%s API Key: %s", name, '설정됨' if os.getenv(key) else '미설정')
+    
+    # 브라우저 풀 예열 (서비스가 있는 리로더 자식 프로세스에서만)
+    if news_service is not None:
+        news_service.warm_up()
     
-    # 서버 실행
+    # 개발 서버 실행 (운영 환경은 gunicorn -c gunicorn.conf.py wsgi:app)
     app.run(debug=True, host='0.0.0.0', port=5000)
\ No newline at end of file
@@ -0,0 +1,241 @@
+from playwright.async_api import async_playwright
+from browser_pool import BROWSER_ARGS
+from scraper import NewsScraper, IN_PAGE_EXTRACT_SCRIPT, PAGE_READY_SCRIPT
+import metrics
+import asyncio
+import logging
+import os
+import threading
+import time
+from typing import Optional, Dict, Any, List
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncScrapeEngine:
+    """playwright.async_api 기반 스크래핑 엔진
+
+    하나의 브라우저 프로세스에서 여러 페이지를 동시에 렌더링한다.
+    동시 페이지 수는 세마포어로 제한하고, 페이지마다 타임아웃을 적용한다.
+    결과는 NewsScraper.scrape_article과 같은 형태의 딕셔너리다.
+    """
+
+    def __init__(self, scraper: Optional[NewsScraper] = None, concurrency: Optional[int] = None,
+                 page_timeout: Optional[float] = None):
+        self.scraper = scraper or NewsScraper()
+        self.concurrency = concurrency or int(os.getenv('ASYNC_SCRAPER_CONCURRENCY', '8'))
+        self.page_timeout = page_timeout or float(os.getenv('ASYNC_SCRAPER_PAGE_TIMEOUT', '45'))
+
+        self._playwright = None
+        self._browser = None
+        self._semaphore = None
+        self._browser_lock = None
+
+        # 동기 코드(Flask 워커 스레드)에서 사용할 전용 이벤트 루프
+        self._loop = None
+        self._thread = None
+        self._start_lock = threading.Lock()
+
+    # ---- 비동기 API ----
+
+    async def scrape_article(self, url: str) -> Dict[str, Any]:
+        """뉴스 기사 스크래핑 (requests 우선, 실패 시 Playwright)"""
+        logger.debug("비동기 스크래핑 시작: %s", url)
+        loop = asyncio.get_running_loop()
+
+        # 정적 HTML 추출은 블로킹 I/O이므로 스레드 풀에서 실행
+        try:
+            result = await loop.run_in_executor(None, self.scraper._scrape_with_requests, url)
+            metrics.SCRAPES.inc(method='requests', result='success' if result['success'] else 'failure')
+            if result['success']:
+                logger.debug("requests로 스크래핑 성공")
+                return result
+        except Exception as e:
+            metrics.SCRAPES.inc(method='requests', result='failure')
+            logger.warning("requests 스크래핑 실패: %s", e)
+
+        logger.debug("Playwright(async)로 스크래핑 시도...")
+        result = await self.scrape_with_playwright(url)
+        metrics.SCRAPES.inc(method='playwright', result='success' if result['success'] else 'failure')
+        return result
+
+    async def scrape_many(self, urls: List[str]) -> List[Dict[str, Any]]:
+        """여러 기사를 동시에 스크래핑 (입력 순서대로 결과 반환)"""
+        return await asyncio.gather(*(self.scrape_article(url) for url in urls))
+
+    async def scrape_with_playwright(self, url: str) -> Dict[str, Any]:
+        """동시 페이지 수 제한과 페이지 타임아웃을 적용한 렌더링"""
+        try:
+            await self._ensure_browser()
+            async with self._semaphore:
+                return await asyncio.wait_for(self._render_article(url), timeout=self.page_timeout)
+        except asyncio.TimeoutError as e:
+            metrics.record_error('render', e)
+            logger.warning("페이지 처리 시간 초과 (%s초): %s", self.page_timeout, url)
+            return {
+                'success': False,
+                'error': "페이지 로딩 시간이 초과되었습니다. 다시 시도해주세요.",
+                'url': url
+            }
+        except Exception as e:
+            metrics.record_error('render', e)
+            logger.warning("Playwright(async) 오류: %s", e)
+            return {
+                'success': False,
+                'error': self.scraper._playwright_error_message(e),
+                'url': url
+            }
+
+    async def _ensure_browser(self):
+        """브라우저를 한 번만 실행 (연결이 끊겼으면 다시 실행)"""
+        if self._browser_lock is None:
+            self._browser_lock = asyncio.Lock()
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+
+        async with self._browser_lock:
+            if self._browser and self._browser.is_connected():
+                return
+            if self._playwright is None:
+                self._playwright = await async_playwright().start()
+            self._browser = await self._playwright.chromium.launch(headless=True, args=BROWSER_ARGS)
+
+    async def _render_article(self, url: str) -> Dict[str, Any]:
+        """새 BrowserContext에서 페이지를 렌더링하고 기사 추출"""
+        context = await self._browser.new_context(**self.scraper._context_options())
+        try:
+            render_started = time.perf_counter()
+            render = {'requests': 0, 'blocked': 0, 'bytes': 0}
+            policy = self.scraper.resource_policy
+
+            # 본문 추출에 필요 없는 요청은 보내지 않음
+            async def handle_route(route):
+                request = route.request
+                if policy.should_block(request.resource_type, request.url, url):
+                    render['blocked'] += 1
+                    await route.abort()
+                else:
+                    render['requests'] += 1
+                    await route.continue_()
+
+            if policy.enabled:
+                await context.route('**/*', handle_route)
+            page = await context.new_page()
+            await self._track_transfer(context, page, render)
+
+            await page.goto(url, wait_until='domcontentloaded', timeout=30000)
+
+            # 본문이 준비될 때까지 대기 (고정 대기 없음)
+            try:
+                ready = await page.wait_for_function(
+                    PAGE_READY_SCRIPT, arg=self.scraper._ready_script_args(url),
+                    timeout=self.scraper.ready_timeout * 1000, polling=250
+                )
+                render['ready'] = await ready.json_value()
+            except Exception:
+                logger.debug("본문 준비 대기 시간 초과, 계속 진행...")
+                render['ready'] = 'timeout'
+
+            # 제목/본문/메타데이터를 page.evaluate 한 번으로 추출
+            started = time.perf_counter()
+            raw = await page.evaluate(IN_PAGE_EXTRACT_SCRIPT, self.scraper._in_page_script_args(url))
+            extraction = self.scraper._finish_in_page_extraction(raw, started)
+            render['elapsed_ms'] = round((time.perf_counter() - render_started) * 1000, 1)
+        finally:
+            try:
+                await context.close()
+            except Exception:
+                pass
+
+        return self.scraper._build_page_result(extraction, url, render)
+
+    async def _track_transfer(self, context, page, render: Dict[str, Any]):
+        """CDP 네트워크 이벤트로 페이지가 받은 바이트 수 집계 (Chromium 전용)"""
+        def on_loading_finished(event):
+            render['bytes'] += int(event.get('encodedDataLength') or 0)
+
+        try:
+            session = await context.new_cdp_session(page)
+            session.on('Network.loadingFinished', on_loading_finished)
+            await session.send('Network.enable')
+        except Exception as e:
+            logger.debug("전송량 집계 실패: %s", e)
+            render['bytes'] = None
+
+    async def aclose(self):
+        """브라우저와 드라이버 종료"""
+        if self._browser:
+            try:
+                await self._browser.close()
+            except Exception:
+                pass
+            self._browser = None
+        if self._playwright:
+            try:
+                await self._playwright.stop()
+            except Exception:
+                pass
+            self._playwright = None
+
+    # ---- 동기 코드용 래퍼 ----
+
+    def start(self):
+        """전용 이벤트 루프 스레드 시작"""
+        with self._start_lock:
+            if self._thread and self._thread.is_alive():
+                return
+            self._loop = asyncio.new_event_loop()
+            self._thread = threading.Thread(
+                target=self._loop.run_forever, name='async-scraper', daemon=True
+            )
+            self._thread.start()
+
+    def warm(self):
+        """서버 시작 시 브라우저를 미리 실행"""
+        started = time.monotonic()
+        self.start()
+        asyncio.run_coroutine_threadsafe(self._ensure_browser(), self._loop).result()
+        logger.info("비동기 스크래핑 엔진 예열 완료 (%.1f초)", time.monotonic() - started)
+
+    def scrape(self, url: str, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """다른 스레드에서 호출하는 블로킹 스크래핑"""
+        self.start()
+        future = asyncio.run_coroutine_threadsafe(self.scrape_article(url), self._loop)
+        return future.result(timeout=timeout)
+
+    def scrape_batch(self, urls: List[str], timeout: Optional[float] = None) -> List[Dict[str, Any]]:
+        """다른 스레드에서 호출하는 블로킹 일괄 스크래핑"""
+        self.start()
+        future = asyncio.run_coroutine_threadsafe(self.scrape_many(urls), self._loop)
+        return future.result(timeout=timeout)
+
+    def close(self, timeout: float = 10):
+        """이벤트 루프와 브라우저 종료"""
+        if not self._loop or not self._thread or not self._thread.is_alive():
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self.aclose(), self._loop).result(timeout)
+        except Exception:
+            pass
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout)
+
+
+# 사용 예시
+if __name__ == "__main__":
+    test_urls = [
+        "https://www.bbc.com/news/world-europe-67823456",
+        "https://www.npr.org/2024/01/01/example"
+    ]
+
+    async def main():
+        engine = AsyncScrapeEngine()
+        started = time.monotonic()
+        results = await engine.scrape_many(test_urls)
+        await engine.aclose()
+
+        for url, result in zip(test_urls, results):
+            status = f"성공 ({len(result['content'])}자)" if result['success'] else f"실패: {result['error']}"
+            print(f"{url}: {status}")
+        print(f"총 소요 시간: {time.monotonic() - started:.1f}초")
+
+    asyncio.run(main())
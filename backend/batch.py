@@ -0,0 +1,128 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from urllib.parse import urlsplit
+from typing import Optional, Dict, Any, List, Iterator, Tuple
+
+from cache import normalize_url
+
+
+class BatchProcessor:
+    """여러 기사를 공유 워커 풀에서 처리 (전체/도메인별 동시 처리 수 제한)
+
+    전체 동시 처리 수는 워커 풀 크기(BATCH_WORKERS)로, 한 언론사에 동시에 보내는
+    요청 수는 BATCH_PER_DOMAIN으로 제한한다. 도메인별 카운터는 모든 배치 요청이
+    공유하므로 배치가 여러 개 동시에 들어와도 한 사이트에 몰리지 않는다.
+    """
+
+    def __init__(self, service, workers: Optional[int] = None, per_domain: Optional[int] = None):
+        self.service = service
+        self.workers = workers or int(os.getenv('BATCH_WORKERS', '8'))
+        self.per_domain = per_domain or int(os.getenv('BATCH_PER_DOMAIN', '2'))
+        self.max_urls = int(os.getenv('BATCH_MAX_URLS', '50'))
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='batch-worker')
+        self._active_by_domain: Dict[str, int] = {}
+        self._slots = threading.Condition()
+
+    @staticmethod
+    def dedupe(urls: List[Any]) -> Tuple[List[Tuple[str, str, List[int]]], List[Dict[str, Any]]]:
+        """정규화한 URL 기준으로 중복 제거
+
+        반환: ([(원래 URL, 정규화 URL, 입력 위치 목록)], 항목별 검증 오류)
+        빈 값이나 문자열이 아닌 항목은 중복이 아니라 그 위치의 오류 결과로 돌려준다.
+        """
+        unique: Dict[str, Tuple[str, List[int]]] = {}
+        invalid = []
+        for index, url in enumerate(urls):
+            if not isinstance(url, str) or not url.strip():
+                invalid.append({
+                    'success': False,
+                    'error': 'URL은 비어 있지 않은 문자열이어야 합니다',
+                    'url': url,
+                    'index': index,
+                    'indices': [index]
+                })
+                continue
+            key = normalize_url(url)
+            if key not in unique:
+                unique[key] = (url.strip(), [])
+            unique[key][1].append(index)
+        items = [(url, key, indices) for key, (url, indices) in unique.items()]
+        return items, invalid
+
+    @staticmethod
+    def duplicates(items: List[Tuple[str, str, List[int]]]) -> int:
+        """dedupe 결과에서 합쳐진 중복 항목 수"""
+        return sum(len(indices) - 1 for _, _, indices in items)
+
+    def process(self, urls: List[Any], use_cache: bool = True) -> Iterator[Dict[str, Any]]:
+        """기사들을 처리하고 끝나는 순서대로 결과 반환
+
+        각 결과의 index는 입력 목록에서의 위치(중복이면 처음 위치), indices는 그 URL이
+        나온 모든 위치다. 잘못된 항목의 오류 결과를 먼저 반환한다.
+        """
+        items, invalid = self.dedupe(urls)
+        yield from invalid
+        pending = list(items)
+        running = {}
+
+        while pending or running:
+            # 도메인별 여유가 있는 항목만 제출 (전체 제한은 워커 풀이 담당)
+            for entry in list(pending):
+                url, key, indices = entry
+                domain = urlsplit(key).netloc
+                if self._try_acquire(domain):
+                    future = self._executor.submit(self._process_one, url, domain, use_cache)
+                    running[future] = entry
+                    pending.remove(entry)
+
+            if not running:
+                # 다른 배치가 도메인 슬롯을 모두 쓰고 있으면 반납될 때까지 대기
+                with self._slots:
+                    self._slots.wait(timeout=1)
+                continue
+
+            done, _ = wait(list(running), timeout=1, return_when=FIRST_COMPLETED)
+            for future in done:
+                url, key, indices = running.pop(future)
+                try:
+                    result = future.result()
+                except Exception as e:
+                    result = {
+                        'success': False,
+                        'error': f'서버 오류: {str(e)}',
+                        'url': url
+                    }
+                yield dict(result, index=indices[0], indices=indices, url=url, normalized_url=key)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._slots:
+            active = {domain: count for domain, count in self._active_by_domain.items() if count}
+        return {
+            'workers': self.workers,
+            'per_domain': self.per_domain,
+            'active_by_domain': active
+        }
+
+    def shutdown(self, wait: bool = True):
+        self._executor.shutdown(wait=wait, cancel_futures=not wait)
+
+    def _process_one(self, url: str, domain: str, use_cache: bool) -> Dict[str, Any]:
+        try:
+            return self.service.process_article(url, use_cache=use_cache)
+        finally:
+            self._release(domain)
+
+    def _try_acquire(self, domain: str) -> bool:
+        with self._slots:
+            if self._active_by_domain.get(domain, 0) >= self.per_domain:
+                return False
+            self._active_by_domain[domain] = self._active_by_domain.get(domain, 0) + 1
+            return True
+
+    def _release(self, domain: str):
+        with self._slots:
+            self._active_by_domain[domain] -= 1
+            if not self._active_by_domain[domain]:
+                del self._active_by_domain[domain]
+            self._slots.notify_all()
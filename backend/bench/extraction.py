@@ -0,0 +1,138 @@
+"""선택자가 맞지 않는 기사에서 본문 대체 추출 방식 비교 (정확도/속도)
+
+콘텐츠 선택자에 없는 레이아웃(알 수 없는 class, 깊게 중첩된 div, p 없는 본문)에
+메뉴/관련 기사/댓글/쿠키 안내/약관 같은 군더더기를 섞은 기사를 만들고, 정답 문단과
+단어 단위로 비교한다.
+
+- legacy: 기존 p → 가장 긴 div → body 순서 (Playwright 추출 스크립트와 같은 규칙)
+- density: 텍스트 밀도 추출기 (static_extractor.extract_by_density)
+
+    cd backend
+    python -m bench.extraction --pages 300
+"""
+import argparse
+import random
+import re
+import time
+from collections import Counter
+from typing import Dict, Any, List, Tuple
+
+from bench.fake_news import WORDS, _paragraphs, _sentence
+from static_extractor import clean_text, element_text, extract_by_density, parse_html
+
+WORD_RE = re.compile(r'\w+')
+
+
+def _nested(rng: random.Random, inner: str) -> str:
+    """알 수 없는 class 이름의 div로 여러 겹 감싸기"""
+    for _ in range(rng.randint(2, 8)):
+        inner = f'<div class="c-{rng.randint(100, 999)}">{inner}</div>'
+    return inner
+
+
+def _link_list(rng: random.Random, count: int, name: str) -> str:
+    items = ''.join(f'<li><a href="/story/{rng.randint(1, 9999)}">{_sentence(rng)}</a></li>' for _ in range(count))
+    return f'<div class="{name}"><ul>{items}</ul></div>'
+
+
+def render_fixture(index: int) -> Tuple[bytes, List[str]]:
+    """(HTML, 정답 문단 목록) - 같은 번호는 항상 같은 기사"""
+    rng = random.Random(f'fixture-{index}')
+    paragraphs = _paragraphs(rng, rng.randint(3, 25))
+    body_style = index % 3
+    if body_style == 0:
+        body = ''.join(f'<p>{text}</p>' for text in paragraphs)
+    elif body_style == 1:
+        # p 없이 문단마다 div
+        body = ''.join(f'<div class="x{rng.randint(1, 99)}">{text}</div>' for text in paragraphs)
+    else:
+        # 한 div 안에 br로 구분 (중간에 링크 몇 개)
+        body = '<br><br>'.join(
+            text.replace(' said ', ' <a href="/t">said</a> ', 1) for text in paragraphs
+        )
+    article = _nested(rng, f'<div class="k{rng.randint(1, 99)}">{body}</div>')
+
+    nav = ''.join(f'<a href="/section/{word}">{word.capitalize()} news and analysis</a> ' for word in WORDS[:20])
+    comments = ''.join(
+        f'<div class="comment"><p>{" ".join(_sentence(rng) for _ in range(3))}</p></div>' for _ in range(rng.randint(0, 12))
+    )
+    consent = f'<div class="consent-layer"><p>{" ".join(_sentence(rng) for _ in range(4))}</p></div>'
+    legal = f'<div class="legal">{"".join(f"<p>{_sentence(rng)} {_sentence(rng)}</p>" for _ in range(2))}</div>'
+    more = ''.join(f'<p><a href="/story/{i}">{_sentence(rng)} {_sentence(rng)}</a></p>' for i in range(6))
+
+    html = (
+        '<!DOCTYPE html><html><head><meta charset="utf-8"><title>Fixture</title>'
+        '<script>var config = {"a": 1};</script></head><body>'
+        f'<div class="top">{consent}<div class="menu-bar">{nav}</div></div>'
+        f'<h1>{_sentence(rng)}</h1>'
+        f'{_link_list(rng, rng.randint(5, 15), "trending")}'
+        f'<div class="layout">{article}<div class="more">{more}</div></div>'
+        f'<div class="discussion">{comments}</div>'
+        f'<div class="bottom">{legal}</div>'
+        '</body></html>'
+    )
+    return html.encode('utf-8'), paragraphs
+
+
+def legacy_fallback(root) -> str:
+    """기존 대체 추출: p(30자 초과) → 가장 긴 div(100자 초과) → body(200자 초과)"""
+    parts = [text for text in (element_text(p).strip() for p in root.iter('p')) if len(text) > 30]
+    if parts:
+        content = clean_text('\n\n'.join(parts))
+        if len(content) > 50:
+            return content
+
+    longest = ''
+    for div in root.iter('div'):
+        text = element_text(div).strip()
+        if len(text) > 100 and len(text) > len(longest):
+            longest = text
+    if longest and len(clean_text(longest)) > 100:
+        return clean_text(longest)
+
+    body = root.find('body')
+    text = clean_text(element_text(body)) if body is not None else ''
+    return text if len(text) > 200 else ''
+
+
+def score(predicted: str, expected: List[str]) -> Dict[str, float]:
+    """단어 단위 정밀도/재현율/F1"""
+    predicted_words = Counter(WORD_RE.findall(predicted.lower()))
+    expected_words = Counter(WORD_RE.findall(clean_text(' '.join(expected)).lower()))
+    overlap = sum((predicted_words & expected_words).values())
+    precision = overlap / sum(predicted_words.values()) if predicted_words else 0.0
+    recall = overlap / sum(expected_words.values()) if expected_words else 0.0
+    f1 = 2 * precision * recall / (precision + recall) if precision + recall else 0.0
+    return {'precision': precision, 'recall': recall, 'f1': f1}
+
+
+def run(pages: int) -> Dict[str, Any]:
+    fixtures = [render_fixture(i) for i in range(pages)]
+    trees = [(parse_html(html), expected) for html, expected in fixtures]
+    report = {}
+    for name, extract in (('legacy', legacy_fallback), ('density', extract_by_density)):
+        totals = Counter()
+        elapsed = 0.0
+        for root, expected in trees:
+            started = time.perf_counter()
+            content = extract(root)
+            elapsed += time.perf_counter() - started
+            totals.update(score(content, expected))
+        report[name] = {key: round(totals[key] / pages, 3) for key in ('precision', 'recall', 'f1')}
+        report[name]['ms_per_page'] = round(elapsed * 1000 / pages, 2)
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description='본문 대체 추출 방식 비교')
+    parser.add_argument('--pages', type=int, default=300, help='기사 수')
+    args = parser.parse_args()
+
+    report = run(args.pages)
+    print(f"{'방식':<10}{'precision':>12}{'recall':>10}{'f1':>8}{'ms/page':>10}")
+    for name, values in report.items():
+        print(f"{name:<10}{values['precision']:>12}{values['recall']:>10}{values['f1']:>8}{values['ms_per_page']:>10}")
+
+
+if __name__ == '__main__':
+    main()
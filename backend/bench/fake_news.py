@@ -0,0 +1,193 @@
+"""로컬 벤치마크용 가짜 뉴스 사이트
+
+정적 HTML 기사(사이트별 레이아웃)와 JS로 본문을 그리는 기사를 만들어서 제공한다.
+같은 경로는 항상 같은 내용이며 ETag/Last-Modified 조건부 요청(304)도 지원한다.
+
+    python -m bench.fake_news --port 8765 --latency 0.05
+    curl http://127.0.0.1:8765/corpus.json
+"""
+import argparse
+import hashlib
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List
+
+# 레이아웃별 본문 컨테이너 (scraper의 콘텐츠 선택자와 대응)
+LAYOUTS = {
+    'npr': '<div class="storytext">{body}</div>',
+    'bbc': '<div class="story-body__inner">{body}</div>',
+    'reuters': '<div class="StandardArticleBody_body">{body}</div>',
+    'generic': '<div class="article-body">{body}</div>',
+    'plain': '<main>{body}</main>',
+}
+JS_LAYOUT = 'js'
+
+WORDS = (
+    'government market inflation election president minister economy policy report officials '
+    'said percent year week country people city security energy prices growth court company '
+    'trade climate health ministry parliament talks agreement investors analysts rate bank '
+    'according statement spokesperson crisis support region international national local'
+).split()
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>{title}</title>
+<meta property="og:title" content="{title}">
+<link rel="stylesheet" href="/assets/site.css">
+<script src="https://www.googletagmanager.com/gtm.js?id=BENCH"></script>
+</head><body>
+<nav>{nav}</nav>
+<div class="ad-slot"><img src="/assets/ad-{index}.jpg"></div>
+<h1 class="headline">{title}</h1>
+<div class="byline">Bench Reporter</div><div class="date">2025-01-01</div>
+<article><img src="/assets/photo-{index}.jpg">
+{content}
+</article>
+<aside>{related}</aside>
+<footer>Copyright Bench News</footer>
+{script}
+</body></html>"""
+
+JS_RENDER_SCRIPT = """<script>
+window.addEventListener('DOMContentLoaded', () => setTimeout(() => {{
+    const data = {paragraphs};
+    const root = document.getElementById('app');
+    root.className = 'article-body';
+    for (const text of data) {{
+        const p = document.createElement('p');
+        p.textContent = text;
+        root.appendChild(p);
+    }}
+}}, {delay}));
+</script>"""
+
+
+def _sentence(rng: random.Random) -> str:
+    words = [rng.choice(WORDS) for _ in range(rng.randint(8, 22))]
+    return ' '.join(words).capitalize() + '.'
+
+
+def _paragraphs(rng: random.Random, count: int) -> List[str]:
+    return [' '.join(_sentence(rng) for _ in range(rng.randint(2, 6))) for _ in range(count)]
+
+
+def render_article(layout: str, index: int, js_delay_ms: int = 300) -> bytes:
+    """(레이아웃, 번호)에 대해 항상 같은 기사 HTML 생성"""
+    rng = random.Random(f'{layout}-{index}')
+    title = _sentence(rng)[:-1]
+    paragraphs = _paragraphs(rng, rng.randint(4, 40))
+    nav = ''.join(f'<a href="/section/{word}">{word}</a>' for word in WORDS[:15])
+    related = ''.join(f'<p><a href="/articles/{layout}/{index + i}.html">{_sentence(rng)}</a></p>' for i in range(1, 6))
+
+    if layout == JS_LAYOUT:
+        content = '<div id="app"></div>'
+        script = JS_RENDER_SCRIPT.format(paragraphs=json.dumps(paragraphs), delay=js_delay_ms)
+    else:
+        body = ''.join(f'<p>{text}</p>' for text in paragraphs)
+        content = LAYOUTS[layout].format(body=body)
+        script = ''
+
+    return PAGE_TEMPLATE.format(
+        title=title, nav=nav, index=index, content=content, related=related, script=script
+    ).encode('utf-8')
+
+
+def corpus(base_url: str, static_count: int = 20, js_count: int = 5) -> Dict[str, List[str]]:
+    """벤치마크에 쓸 기사 URL 목록"""
+    layouts = list(LAYOUTS)
+    return {
+        'static': [f'{base_url}/articles/{layouts[i % len(layouts)]}/{i}.html' for i in range(static_count)],
+        'js': [f'{base_url}/articles/{JS_LAYOUT}/{i}.html' for i in range(js_count)]
+    }
+
+
+def make_handler(latency: float, max_age: int, js_delay_ms: int, counts: Dict[str, int], lock: threading.Lock):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def do_GET(self):
+            path = self.path.split('?', 1)[0].split('#', 1)[0]
+            if latency:
+                time.sleep(latency)
+
+            if path == '/corpus.json':
+                base_url = f'http://{self.headers.get("Host")}'
+                return self._send(200, json.dumps(corpus(base_url)).encode(), 'application/json')
+
+            if path.startswith('/assets/'):
+                # 차단되지 않으면 전송량에 잡히도록 적당한 크기의 더미 리소스
+                size = 40000 if path.endswith('.jpg') else 4000
+                return self._send(200, b'\0' * size, 'image/jpeg' if path.endswith('.jpg') else 'text/css')
+
+            parts = path.strip('/').split('/')
+            if len(parts) != 3 or parts[0] != 'articles' or not parts[2].endswith('.html'):
+                return self._send(404, b'not found', 'text/plain')
+            layout, name = parts[1], parts[2][:-len('.html')]
+            if (layout not in LAYOUTS and layout != JS_LAYOUT) or not name.isdigit():
+                return self._send(404, b'not found', 'text/plain')
+
+            body = render_article(layout, int(name), js_delay_ms)
+            etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+            headers = {
+                'ETag': etag,
+                'Last-Modified': 'Wed, 01 Jan 2025 00:00:00 GMT',
+                'Cache-Control': f'max-age={max_age}'
+            }
+            if self.headers.get('If-None-Match') == etag:
+                with lock:
+                    counts['not_modified'] += 1
+                return self._send(304, b'', None, headers)
+            with lock:
+                counts['articles'] += 1
+            self._send(200, body, 'text/html; charset=utf-8', headers)
+
+        def _send(self, status: int, body: bytes, content_type, headers: Dict[str, str] = None):
+            self.send_response(status)
+            if content_type:
+                self.send_header('Content-Type', content_type)
+            self.send_header('Content-Length', str(len(body)))
+            for key, value in (headers or {}).items():
+                self.send_header(key, value)
+            self.end_headers()
+            if body:
+                self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    return Handler
+
+
+def start_server(port: int = 0, latency: float = 0.0, max_age: int = 0, js_delay_ms: int = 300) -> ThreadingHTTPServer:
+    """백그라운드 스레드에서 서버 실행 (port=0 이면 빈 포트 사용)"""
+    counts = {'articles': 0, 'not_modified': 0}
+    server = ThreadingHTTPServer(
+        ('127.0.0.1', port), make_handler(latency, max_age, js_delay_ms, counts, threading.Lock())
+    )
+    server.daemon_threads = True
+    server.counts = counts
+    server.base_url = f'http://127.0.0.1:{server.server_port}'
+    threading.Thread(target=server.serve_forever, daemon=True, name='fake-news').start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description='가짜 뉴스 사이트 서버')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--latency', type=float, default=0.0, help='응답 지연(초)')
+    parser.add_argument('--max-age', type=int, default=0, help='Cache-Control max-age(초)')
+    parser.add_argument('--js-delay-ms', type=int, default=300, help='JS 기사 본문이 그려질 때까지의 지연(ms)')
+    args = parser.parse_args()
+
+    server = start_server(args.port, args.latency, args.max_age, args.js_delay_ms)
+    print(f"가짜 뉴스 사이트 실행 중: {server.base_url}/corpus.json")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
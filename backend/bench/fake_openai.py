@@ -0,0 +1,179 @@
+"""로컬 벤치마크용 가짜 OpenAI chat completions 서버
+
+실제 API 대신 지연 시간, 오류, 429(요청 한도 초과)를 흉내 낸다.
+번역 묶음 요청의 <<<번호>>> 표시는 그대로 유지해서 돌려준다.
+
+    python -m bench.fake_openai --port 8766 --latency 0.8 --error-rate 0.02 --rate-limit-rate 0.05
+"""
+import argparse
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Any
+
+SEGMENT_RE = re.compile(r'<<<(\d+)>>>\s*(.*?)(?=\s*<<<\d+>>>|\s*\Z)', re.DOTALL)
+
+
+class FakeOpenAIConfig:
+    def __init__(self, latency: float = 0.5, jitter: float = 0.2, error_rate: float = 0.0,
+                 rate_limit_rate: float = 0.0, tokens_per_second: float = 200, seed: int = 0):
+        # 첫 응답까지의 기본 지연(초)과 무작위 추가 지연 범위
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        # 출력 토큰 생성 속도 (스트리밍/일반 응답 모두 출력 길이에 비례해 지연)
+        self.tokens_per_second = tokens_per_second
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.counts = {'requests': 0, 'errors': 0, 'rate_limited': 0, 'streams': 0}
+
+    def roll(self) -> float:
+        with self.lock:
+            return self.random.random()
+
+    def count(self, key: str):
+        with self.lock:
+            self.counts[key] += 1
+
+
+def fake_completion(messages) -> str:
+    """요청 내용을 바탕으로 만든 가짜 번역/요약 결과"""
+    system = messages[0]['content'] if messages else ''
+    content = messages[-1]['content'] if messages else ''
+    segments = SEGMENT_RE.findall(content)
+    if segments:
+        return '\n\n'.join(f'<<<{number}>>>\n[번역] {body.strip()[:80]}' for number, body in segments)
+    if '요약' in system:
+        return '[요약] ' + content[:200]
+    # 번역은 입력과 비슷한 길이로
+    return '[번역] ' + content
+
+
+def make_handler(config: FakeOpenAIConfig):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def do_POST(self):
+            length = int(self.headers.get('Content-Length') or 0)
+            body = json.loads(self.rfile.read(length) or b'{}')
+            config.count('requests')
+
+            roll = config.roll()
+            if roll < config.rate_limit_rate:
+                config.count('rate_limited')
+                return self._send_json(429, {'error': {'message': 'Rate limit reached', 'type': 'requests'}},
+                                       {'Retry-After': '1'})
+            if roll < config.rate_limit_rate + config.error_rate:
+                config.count('errors')
+                time.sleep(config.latency)
+                return self._send_json(500, {'error': {'message': 'The server had an error', 'type': 'server_error'}})
+
+            text = fake_completion(body.get('messages') or [])
+            output_tokens = max(1, len(text) // 3)
+            max_tokens = body.get('max_tokens')
+            finish_reason = 'stop'
+            if max_tokens and output_tokens > max_tokens:
+                text = text[:max_tokens * 3]
+                output_tokens = max_tokens
+                finish_reason = 'length'
+
+            time.sleep(config.latency + config.roll() * config.jitter)
+            if body.get('stream'):
+                config.count('streams')
+                return self._stream(text, finish_reason)
+
+            time.sleep(output_tokens / config.tokens_per_second)
+            prompt_tokens = sum(len(m.get('content') or '') // 4 for m in body.get('messages') or [])
+            self._send_json(200, {
+                'id': 'chatcmpl-bench',
+                'object': 'chat.completion',
+                'model': body.get('model'),
+                'choices': [{
+                    'index': 0,
+                    'message': {'role': 'assistant', 'content': text},
+                    'finish_reason': finish_reason
+                }],
+                'usage': {
+                    'prompt_tokens': prompt_tokens,
+                    'completion_tokens': output_tokens,
+                    'total_tokens': prompt_tokens + output_tokens
+                }
+            })
+
+        def _stream(self, text: str, finish_reason: str):
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/event-stream')
+            self.send_header('Transfer-Encoding', 'chunked')
+            self.end_headers()
+            words = text.split(' ')
+            delay = 1 / config.tokens_per_second
+            for i, word in enumerate(words):
+                delta = word if i == 0 else ' ' + word
+                self._write_chunk('data: ' + json.dumps(
+                    {'choices': [{'index': 0, 'delta': {'content': delta}, 'finish_reason': None}]},
+                    ensure_ascii=False
+                ) + '\n\n')
+                time.sleep(delay)
+            self._write_chunk('data: ' + json.dumps(
+                {'choices': [{'index': 0, 'delta': {}, 'finish_reason': finish_reason}]}
+            ) + '\n\n')
+            self._write_chunk('data: [DONE]\n\n')
+            self.wfile.write(b'0\r\n\r\n')
+
+        def _write_chunk(self, data: str):
+            encoded = data.encode('utf-8')
+            self.wfile.write(f'{len(encoded):x}\r\n'.encode() + encoded + b'\r\n')
+            self.wfile.flush()
+
+        def _send_json(self, status: int, data: Dict[str, Any], headers: Dict[str, str] = None):
+            encoded = json.dumps(data, ensure_ascii=False).encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(encoded)))
+            for key, value in (headers or {}).items():
+                self.send_header(key, value)
+            self.end_headers()
+            self.wfile.write(encoded)
+
+        def log_message(self, *args):
+            pass
+
+    return Handler
+
+
+def start_server(port: int = 0, config: FakeOpenAIConfig = None) -> ThreadingHTTPServer:
+    """백그라운드 스레드에서 서버 실행 (port=0 이면 빈 포트 사용)"""
+    config = config or FakeOpenAIConfig()
+    server = ThreadingHTTPServer(('127.0.0.1', port), make_handler(config))
+    server.daemon_threads = True
+    server.config = config
+    threading.Thread(target=server.serve_forever, daemon=True, name='fake-openai').start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description='가짜 OpenAI chat completions 서버')
+    parser.add_argument('--port', type=int, default=8766)
+    parser.add_argument('--latency', type=float, default=0.5, help='기본 응답 지연(초)')
+    parser.add_argument('--jitter', type=float, default=0.2, help='무작위 추가 지연 최대값(초)')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='500 오류 비율')
+    parser.add_argument('--rate-limit-rate', type=float, default=0.0, help='429 응답 비율')
+    parser.add_argument('--tokens-per-second', type=float, default=200, help='출력 토큰 생성 속도')
+    args = parser.parse_args()
+
+    server = start_server(args.port, FakeOpenAIConfig(
+        args.latency, args.jitter, args.error_rate, args.rate_limit_rate, args.tokens_per_second
+    ))
+    print(f"가짜 OpenAI 서버 실행 중: http://127.0.0.1:{server.server_port}/v1")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
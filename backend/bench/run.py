@@ -0,0 +1,224 @@
+"""/api/process 오프라인 부하 벤치마크
+
+가짜 OpenAI 서버와 가짜 뉴스 사이트를 로컬에 띄우고, Flask 앱을 같은 프로세스에서
+실행한 뒤 지정한 동시성으로 요청을 보내 지연 시간 분포와 스테이지별 시간을 출력한다.
+네트워크 연결 없이 실행되며 실제 API 비용이 들지 않는다.
+
+    cd backend
+    python -m bench.run --requests 200 --concurrency 16 --json bench/baseline.json
+    python -m bench.run --requests 200 --concurrency 16 --baseline bench/baseline.json
+
+--env KEY=VALUE 로 앱 설정(HTTP_CACHE, PIPELINE_WORKERS 등)을 바꿔가며 비교할 수 있다.
+"""
+import argparse
+import json
+import math
+import os
+import random
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Any, List, Optional
+
+import requests
+
+from bench import fake_news, fake_openai
+
+# 백분위 보고 항목
+PERCENTILES = (50, 95, 99)
+
+
+def percentile(values: List[float], pct: float) -> Optional[float]:
+    """최근접 순위 방식 백분위"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    index = max(0, math.ceil(pct / 100 * len(ordered)) - 1)
+    return round(ordered[index], 1)
+
+
+def summarize(values: List[float]) -> Dict[str, Any]:
+    summary = {f'p{pct}': percentile(values, pct) for pct in PERCENTILES}
+    summary['mean'] = round(statistics.fmean(values), 1) if values else None
+    summary['max'] = round(max(values), 1) if values else None
+    return summary
+
+
+def build_urls(base_url: str, count: int, js_ratio: float, unique: int, seed: int) -> List[str]:
+    """요청할 URL 목록 (unique개를 돌려 쓰며 js_ratio 비율만큼 JS 기사)
+
+    기본값(unique=0)은 요청마다 다른 기사라서 번역/요약 메모 캐시가 맞지 않는다.
+    """
+    rng = random.Random(seed)
+    layouts = list(fake_news.LAYOUTS)
+    pool_size = unique or count
+    pool = []
+    for i in range(pool_size):
+        if rng.random() < js_ratio:
+            pool.append(f'{base_url}/articles/{fake_news.JS_LAYOUT}/{i}.html')
+        else:
+            pool.append(f'{base_url}/articles/{layouts[i % len(layouts)]}/{i}.html')
+    return [pool[i % pool_size] for i in range(count)]
+
+
+def start_app(port: int = 0):
+    """Flask 앱을 별도 스레드의 WSGI 서버로 실행 (환경변수 설정 후 import)"""
+    from werkzeug.serving import make_server
+    import app as app_module
+
+    server = make_server('127.0.0.1', port, app_module.app, threaded=True)
+    threading.Thread(target=server.serve_forever, daemon=True, name='bench-app').start()
+    return server, app_module
+
+
+def run_load(app_url: str, urls: List[str], concurrency: int, timeout: float) -> Dict[str, Any]:
+    """동시에 concurrency개씩 /api/process 요청을 보내고 결과 수집"""
+    latencies: List[float] = []
+    stages: Dict[str, List[float]] = {}
+    errors: Dict[str, int] = {}
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=concurrency)
+    session.mount('http://', adapter)
+    lock = threading.Lock()
+
+    def one(url: str):
+        started = time.perf_counter()
+        try:
+            response = session.post(f'{app_url}/api/process', json={'url': url, 'refresh': True}, timeout=timeout)
+            elapsed = (time.perf_counter() - started) * 1000
+            data = response.json()
+        except Exception as e:
+            elapsed = (time.perf_counter() - started) * 1000
+            data = {'success': False, 'error': type(e).__name__}
+        with lock:
+            latencies.append(elapsed)
+            if not data.get('success'):
+                key = str(data.get('error') or 'unknown')[:80]
+                errors[key] = errors.get(key, 0) + 1
+                return
+            for name, timing in ((data.get('timings') or {}).get('stages') or {}).items():
+                stages.setdefault(name, []).append(timing['duration_ms'])
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        futures = [executor.submit(one, url) for url in urls]
+        for i, future in enumerate(as_completed(futures), 1):
+            future.result()
+            if i % max(1, len(urls) // 10) == 0:
+                print(f"  {i}/{len(urls)} 완료", file=sys.stderr)
+    wall = time.perf_counter() - started
+
+    failed = sum(errors.values())
+    return {
+        'requests': len(urls),
+        'concurrency': concurrency,
+        'wall_s': round(wall, 2),
+        'throughput_rps': round(len(urls) / wall, 2) if wall else None,
+        'succeeded': len(urls) - failed,
+        'failed': failed,
+        'latency_ms': summarize(latencies),
+        'stages_ms': {name: summarize(values) for name, values in sorted(stages.items())},
+        'errors': dict(sorted(errors.items(), key=lambda item: -item[1]))
+    }
+
+
+def _delta(current, base) -> str:
+    if current is None or not base:
+        return ''
+    return f' ({(current - base) / base * 100:+.1f}%)'
+
+
+def print_report(report: Dict[str, Any], baseline: Optional[Dict[str, Any]] = None):
+    base = baseline or {}
+    print(f"\n요청 {report['requests']}개, 동시성 {report['concurrency']}, {report['wall_s']}초")
+    print(f"처리량: {report['throughput_rps']} req/s"
+          f"{_delta(report['throughput_rps'], base.get('throughput_rps'))}")
+    print(f"성공 {report['succeeded']} / 실패 {report['failed']}")
+
+    print(f"\n{'구간':<20}" + ''.join(f'{f"p{pct}":>18}' for pct in PERCENTILES))
+    rows = [('전체', report['latency_ms'], base.get('latency_ms') or {})]
+    rows += [(name, values, (base.get('stages_ms') or {}).get(name) or {})
+             for name, values in report['stages_ms'].items()]
+    for name, values, base_values in rows:
+        cells = ''
+        for pct in PERCENTILES:
+            key = f'p{pct}'
+            cell = f"{values[key]}{_delta(values[key], base_values.get(key))}"
+            cells += f'{cell:>18}'
+        print(f'{name:<20}{cells}')
+
+    if report['errors']:
+        print("\n오류:")
+        for error, count in report['errors'].items():
+            print(f"  {count:>5}  {error}")
+    if report.get('fake_openai'):
+        print(f"\n가짜 OpenAI 요청: {report['fake_openai']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='/api/process 오프라인 부하 벤치마크')
+    parser.add_argument('--requests', type=int, default=100, help='전체 요청 수')
+    parser.add_argument('--concurrency', type=int, default=8, help='동시 요청 수')
+    parser.add_argument('--js-ratio', type=float, default=0.0, help='JS로 본문을 그리는 기사 비율 (Playwright 필요)')
+    parser.add_argument('--unique', type=int, default=0, help='서로 다른 기사 수 (0이면 요청마다 다른 기사)')
+    parser.add_argument('--timeout', type=float, default=300, help='요청 하나의 제한 시간(초)')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--site-latency', type=float, default=0.05, help='가짜 뉴스 사이트 응답 지연(초)')
+    parser.add_argument('--site-max-age', type=int, default=0, help='가짜 뉴스 사이트 Cache-Control max-age(초)')
+    parser.add_argument('--llm-latency', type=float, default=0.5, help='가짜 OpenAI 첫 응답 지연(초)')
+    parser.add_argument('--llm-jitter', type=float, default=0.2, help='가짜 OpenAI 무작위 추가 지연(초)')
+    parser.add_argument('--llm-tokens-per-second', type=float, default=200, help='가짜 OpenAI 출력 속도')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='가짜 OpenAI 500 오류 비율')
+    parser.add_argument('--rate-limit-rate', type=float, default=0.0, help='가짜 OpenAI 429 응답 비율')
+    parser.add_argument('--env', action='append', default=[], metavar='KEY=VALUE', help='앱 환경변수 (여러 번 지정 가능)')
+    parser.add_argument('--json', metavar='PATH', help='결과를 JSON 파일로 저장')
+    parser.add_argument('--baseline', metavar='PATH', help='비교할 이전 결과 JSON')
+    args = parser.parse_args()
+
+    news = fake_news.start_server(latency=args.site_latency, max_age=args.site_max_age)
+    llm = fake_openai.start_server(config=fake_openai.FakeOpenAIConfig(
+        args.llm_latency, args.llm_jitter, args.error_rate, args.rate_limit_rate,
+        args.llm_tokens_per_second, args.seed
+    ))
+
+    # 앱을 import 하기 전에 설정 (.env 값보다 우선)
+    workdir = tempfile.mkdtemp(prefix='news-bench-')
+    os.environ['OPENAI_API_KEY'] = 'bench'
+    os.environ['OPENAI_BASE_URL'] = f'http://127.0.0.1:{llm.server_port}/v1'
+    os.environ['CACHE_DB_PATH'] = os.path.join(workdir, 'cache.sqlite3')
+    for item in args.env:
+        key, _, value = item.partition('=')
+        os.environ[key] = value
+
+    server, app_module = start_app()
+    app_url = f'http://127.0.0.1:{server.server_port}'
+    urls = build_urls(news.base_url, args.requests, args.js_ratio, args.unique, args.seed)
+    print(f"벤치마크 시작: 앱 {app_url}, 뉴스 {news.base_url}, 작업 디렉터리 {workdir}", file=sys.stderr)
+
+    try:
+        report = run_load(app_url, urls, args.concurrency, args.timeout)
+    finally:
+        server.shutdown()
+    report['fake_openai'] = dict(llm.config.counts)
+    report['fake_news'] = dict(news.counts)
+    report['config'] = {key: value for key, value in vars(args).items() if key not in ('json', 'baseline')}
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+    print_report(report, baseline)
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\n결과 저장: {args.json}")
+
+    app_module.news_service.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,327 @@
+from playwright.sync_api import sync_playwright
+import logging
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from typing import Optional, Dict, Any, Callable, List
+
+logger = logging.getLogger(__name__)
+
+# Chromium 실행 옵션
+BROWSER_ARGS = [
+    '--no-sandbox',
+    '--disable-setuid-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-accelerated-2d-canvas',
+    '--no-first-run',
+    '--no-zygote',
+    '--disable-gpu'
+]
+
+# 드라이버 프로세스 식별용 (여러 워커가 동시에 시작할 때 PID가 섞이지 않도록)
+_driver_start_lock = threading.Lock()
+
+
+def _parent_pids() -> Dict[int, int]:
+    """/proc를 한 번 훑어서 PID → 부모 PID (Linux 전용, 없으면 빈 딕셔너리)"""
+    parents = {}
+    try:
+        entries = os.listdir('/proc')
+    except OSError:
+        return parents
+
+    for entry in entries:
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f'/proc/{entry}/stat') as f:
+                stat = f.read()
+            # comm 필드에 공백/괄호가 들어갈 수 있으므로 마지막 ')' 이후를 파싱
+            parents[int(entry)] = int(stat.rsplit(')', 1)[1].split()[1])
+        except (OSError, ValueError, IndexError):
+            continue
+    return parents
+
+
+def _child_pids(pid: int) -> List[int]:
+    """지정한 프로세스의 자식 PID 목록"""
+    return [child for child, parent in _parent_pids().items() if parent == pid]
+
+
+def _process_tree(pid: int) -> List[int]:
+    """프로세스와 모든 자손 프로세스의 PID (/proc 한 번만 훑음)"""
+    children: Dict[int, List[int]] = {}
+    for child, parent in _parent_pids().items():
+        children.setdefault(parent, []).append(child)
+
+    tree = []
+    stack = [pid]
+    while stack:
+        current = stack.pop()
+        tree.append(current)
+        stack.extend(children.get(current, ()))
+    return tree
+
+
+def _rss_kb(pid: int) -> Optional[int]:
+    """프로세스 RSS(KB) - 프로세스가 없으면 None"""
+    try:
+        with open(f'/proc/{pid}/status') as f:
+            for line in f:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1])
+    except (OSError, ValueError):
+        return None
+    return 0
+
+
+class _BrowserWorker(threading.Thread):
+    """브라우저 하나를 소유하고 스크래핑 작업을 순서대로 처리하는 스레드
+
+    Playwright sync API 객체는 생성한 스레드에서만 사용할 수 있으므로
+    드라이버와 브라우저는 이 스레드 안에서만 만들고 닫는다.
+    """
+
+    def __init__(self, pool: 'BrowserPool', index: int):
+        super().__init__(name=f'browser-pool-{index}', daemon=True)
+        self.pool = pool
+        self.playwright = None
+        self.browser = None
+        self.driver_pid = None
+        self.pages_served = 0
+        self.launch_count = 0
+        self.ready = threading.Event()
+        # 마지막으로 잰 메모리(MB)와 그 시각, 그때의 프로세스 트리 PID (다음 측정에 재사용)
+        self.last_memory_mb: Optional[float] = None
+        self.memory_sampled_at: Optional[float] = None
+        self._tree_pids: List[int] = []
+
+    def run(self):
+        try:
+            self._start_driver()
+            self._launch_browser()
+        except Exception as e:
+            logger.warning("브라우저 풀 워커 시작 실패 (%s): %s", self.name, e)
+        finally:
+            self.ready.set()
+
+        while True:
+            task = self.pool._tasks.get()
+            if task is None:
+                break
+
+            fn, context_options, future = task
+            if not future.set_running_or_notify_cancel():
+                continue
+
+            try:
+                if self.playwright is None:
+                    # 시작할 때 드라이버를 띄우지 못했으면 작업이 올 때마다 다시 시도
+                    self._restart_driver()
+                if self.browser is None or not self.browser.is_connected():
+                    self._launch_browser()
+                result = self._run_in_context(fn, context_options)
+                future.set_result(result)
+            except BaseException as e:
+                future.set_exception(e)
+            finally:
+                self.pages_served += 1
+                self._maybe_recycle()
+
+        self._shutdown()
+
+    def _start_driver(self):
+        """Playwright 드라이버 시작 및 드라이버 PID 기록"""
+        with _driver_start_lock:
+            before = set(_child_pids(os.getpid()))
+            self.playwright = sync_playwright().start()
+            new_children = set(_child_pids(os.getpid())) - before
+            self.driver_pid = new_children.pop() if len(new_children) == 1 else None
+
+    def _restart_driver(self):
+        try:
+            self._start_driver()
+        except Exception as e:
+            logger.warning("Playwright 드라이버 재시작 실패 (%s): %s", self.name, e)
+            raise
+        logger.info("Playwright 드라이버 재시작 (%s)", self.name)
+
+    def _launch_browser(self):
+        """브라우저 실행 (기존 브라우저는 닫음)"""
+        self._close_browser()
+        self.browser = self.playwright.chromium.launch(
+            headless=True,
+            args=self.pool.launch_args
+        )
+        self.pages_served = 0
+        self.launch_count += 1
+        self._tree_pids = []
+
+    def _run_in_context(self, fn: Callable, context_options: Dict[str, Any]):
+        """스크래핑마다 격리된 새 BrowserContext에서 작업 실행"""
+        context = self.browser.new_context(**context_options)
+        try:
+            return fn(context)
+        finally:
+            try:
+                context.close()
+            except Exception:
+                pass
+
+    def memory_mb(self) -> Optional[float]:
+        """드라이버와 브라우저 프로세스의 메모리 사용량(MB)을 재서 기록
+
+        지난번 측정의 PID 목록을 재사용하고, 그중 종료된 프로세스가 있으면
+        (렌더러는 페이지마다 바뀜) /proc를 한 번 훑어서 트리를 다시 구한다.
+        """
+        if not self.driver_pid or not os.path.isdir('/proc'):
+            return None
+
+        sizes = [_rss_kb(pid) for pid in self._tree_pids]
+        if not sizes or None in sizes:
+            self._tree_pids = _process_tree(self.driver_pid)
+            sizes = [_rss_kb(pid) for pid in self._tree_pids]
+        self.last_memory_mb = sum(size or 0 for size in sizes) / 1024
+        self.memory_sampled_at = time.time()
+        return self.last_memory_mb
+
+    def _maybe_recycle(self):
+        """페이지 수 또는 메모리 상한을 넘으면 브라우저 재시작 (메모리는 N페이지마다 측정)"""
+        reason = None
+        if self.pool.max_pages and self.pages_served >= self.pool.max_pages:
+            reason = f'{self.pages_served}페이지 처리'
+        elif self.pool.max_memory_mb and self.pages_served % self.pool.memory_check_pages == 0:
+            memory = self.memory_mb()
+            if memory is not None and memory > self.pool.max_memory_mb:
+                reason = f'메모리 {memory:.0f}MB 사용'
+
+        if reason:
+            logger.warning("브라우저 재시작 (%s): %s", self.name, reason)
+            try:
+                self._launch_browser()
+            except Exception as e:
+                logger.warning("브라우저 재시작 실패 (%s): %s", self.name, e)
+                self.browser = None
+
+    def _close_browser(self):
+        if self.browser:
+            try:
+                self.browser.close()
+            except Exception:
+                pass
+            self.browser = None
+
+    def _shutdown(self):
+        self._close_browser()
+        if self.playwright:
+            try:
+                self.playwright.stop()
+            except Exception:
+                pass
+            self.playwright = None
+
+
+class BrowserPool:
+    """서비스가 소유하는 상시 실행 Chromium 풀
+
+    브라우저는 미리 띄워 두고, 스크래핑마다 새 BrowserContext만 만들어
+    쿠키/스토리지를 격리한다. 브라우저는 일정 페이지 수 또는 메모리 상한을
+    넘으면 재시작된다.
+    """
+
+    def __init__(self, size: Optional[int] = None, max_pages: Optional[int] = None,
+                 max_memory_mb: Optional[int] = None, launch_args: Optional[List[str]] = None):
+        self.size = size or int(os.getenv('BROWSER_POOL_SIZE', '2'))
+        self.max_pages = max_pages if max_pages is not None else int(os.getenv('BROWSER_MAX_PAGES', '100'))
+        self.max_memory_mb = max_memory_mb if max_memory_mb is not None else int(os.getenv('BROWSER_MAX_MEMORY_MB', '1024'))
+        # 메모리는 이 페이지 수마다 측정 (/proc 조회 비용을 페이지마다 내지 않도록)
+        self.memory_check_pages = max(1, int(os.getenv('BROWSER_MEMORY_CHECK_PAGES', '10')))
+        # run()에 timeout을 주지 않았을 때 기다리는 최대 시간(초, 대기열 + 실행)
+        self.task_timeout = float(os.getenv('BROWSER_TASK_TIMEOUT', '120'))
+        self.launch_args = launch_args or BROWSER_ARGS
+
+        self._tasks = queue.Queue()
+        self._workers: List[_BrowserWorker] = []
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def start(self, wait: bool = True, timeout: float = 60):
+        """워커 스레드와 브라우저 시작 (이미 시작된 경우 무시)"""
+        with self._lock:
+            if self._closed:
+                raise RuntimeError('브라우저 풀이 이미 종료되었습니다')
+            if not self._workers:
+                for i in range(self.size):
+                    worker = _BrowserWorker(self, i)
+                    worker.start()
+                    self._workers.append(worker)
+
+        if wait:
+            deadline = time.monotonic() + timeout
+            for worker in self._workers:
+                worker.ready.wait(max(0, deadline - time.monotonic()))
+
+    def warm(self, timeout: float = 60):
+        """서버 시작 시 브라우저를 미리 실행"""
+        started = time.monotonic()
+        self.start(wait=True, timeout=timeout)
+        ready = sum(1 for w in self._workers if w.browser is not None)
+        logger.info("브라우저 풀 예열 완료: %s/%s개 (%.1f초)", ready, self.size, time.monotonic() - started)
+
+    def submit(self, fn: Callable, **context_options) -> Future:
+        """fn(context)를 풀의 브라우저에서 실행하도록 예약"""
+        self.start(wait=False)
+        future = Future()
+        self._tasks.put((fn, context_options, future))
+        return future
+
+    def run(self, fn: Callable, timeout: Optional[float] = None, **context_options):
+        """fn(context)를 풀의 브라우저에서 실행하고 결과 반환
+
+        timeout(기본 task_timeout)초 안에 끝나지 않으면 작업을 취소하고 TimeoutError를 낸다.
+        아직 대기열에 있던 작업은 실행되지 않고, 이미 실행 중인 작업은 결과만 버린다.
+        """
+        future = self.submit(fn, **context_options)
+        try:
+            return future.result(timeout=self.task_timeout if timeout is None else timeout)
+        except FutureTimeoutError:
+            if not future.cancel():
+                logger.warning("브라우저 작업 시간 초과, 실행 중인 작업의 결과는 버림")
+            raise
+
+    def stats(self) -> Dict[str, Any]:
+        """풀 상태 (메모리는 워커가 마지막으로 측정한 값)"""
+        return {
+            'size': self.size,
+            'queued': self._tasks.qsize(),
+            'max_pages': self.max_pages,
+            'max_memory_mb': self.max_memory_mb,
+            'memory_check_pages': self.memory_check_pages,
+            'workers': [
+                {
+                    'name': w.name,
+                    'alive': w.is_alive(),
+                    'browser_ready': w.browser is not None,
+                    'pages_served': w.pages_served,
+                    'launch_count': w.launch_count,
+                    'memory_mb': round(w.last_memory_mb, 1) if w.last_memory_mb is not None else None,
+                    'memory_sampled_at': w.memory_sampled_at
+                }
+                for w in self._workers
+            ]
+        }
+
+    def close(self, timeout: float = 10):
+        """모든 브라우저와 드라이버 종료"""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            workers = list(self._workers)
+
+        for _ in workers:
+            self._tasks.put(None)
+        for worker in workers:
+            worker.join(timeout)
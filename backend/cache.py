@@ -0,0 +1,224 @@
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+from typing import Optional, Dict, Any, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 기본 캐시 DB 위치 (CACHE_DB_PATH가 빈 문자열이면 디스크 캐시 사용 안 함)
+DEFAULT_CACHE_DB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'cache.sqlite3')
+
+# 같은 기사인데 URL만 달라지는 추적용 파라미터
+TRACKING_PARAMS = frozenset([
+    'fbclid', 'gclid', 'dclid', 'msclkid', 'yclid', 'igshid', 'mc_cid', 'mc_eid',
+    'ocid', 'cmpid', 'smid', 'smtyp', 'ref', 'ref_src', 'referrer', 'ito',
+    'ns_mchannel', 'ns_source', 'ns_campaign', 'ns_linkname', 'taid',
+    'guccounter', 'guce_referrer', 'guce_referrer_sig', '_ga'
+])
+TRACKING_PREFIXES = ('utm_', 'at_', 'pk_', 'mtm_', 'hsa_')
+
+
+def normalize_url(url: str) -> str:
+    """캐시 키용 URL 정규화 (추적 파라미터/프래그먼트 제거, 파라미터 정렬)"""
+    url = url.strip()
+    parts = urlsplit(url)
+    scheme = parts.scheme.lower() or 'http'
+    host = (parts.hostname or '').lower()
+
+    # 기본 포트 제거
+    port = parts.port
+    if port and not ((scheme == 'http' and port == 80) or (scheme == 'https' and port == 443)):
+        host = f'{host}:{port}'
+
+    query = [
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith(TRACKING_PREFIXES)
+    ]
+    query.sort()
+
+    return urlunsplit((scheme, host, parts.path or '/', urlencode(query), ''))
+
+
+def text_cache_key(text: str, *parts: Any) -> str:
+    """텍스트 내용 해시와 부가 조건(언어, 모델, 프롬프트 버전 등)으로 만든 캐시 키"""
+    digest = hashlib.sha256(text.encode('utf-8')).hexdigest()
+    return '|'.join([digest] + [str(part) for part in parts])
+
+
+class TTLCache:
+    """TTL과 LRU 제거를 지원하는 캐시 (메모리 + 선택적 SQLite 계층)
+
+    메모리 계층은 max_entries 개까지만 유지하고 가장 오래 사용하지 않은 항목부터
+    제거한다. db_path가 있으면 SQLite에도 저장해 서버를 재시작해도 유지된다.
+    값은 JSON으로 직렬화할 수 있어야 한다.
+    """
+
+    def __init__(self, namespace: str, ttl: float, max_entries: int,
+                 db_path: Optional[str] = None, max_disk_entries: Optional[int] = None):
+        self.namespace = namespace
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_disk_entries = max_disk_entries or max_entries * 20
+
+        self._memory: 'OrderedDict[str, Tuple[float, Any]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+        self._writes_since_prune = 0
+
+        self._db = None
+        self.db_path = db_path
+        if db_path:
+            try:
+                self._db = sqlite3.connect(db_path, check_same_thread=False, timeout=10)
+                self._db.execute('PRAGMA journal_mode=WAL')
+                self._db.execute(
+                    'CREATE TABLE IF NOT EXISTS cache_entries ('
+                    ' namespace TEXT NOT NULL, key TEXT NOT NULL, created_at REAL NOT NULL,'
+                    ' value TEXT NOT NULL, PRIMARY KEY (namespace, key))'
+                )
+                self._db.execute(
+                    'CREATE INDEX IF NOT EXISTS cache_entries_created ON cache_entries (namespace, created_at)'
+                )
+                self._db.commit()
+            except sqlite3.Error as e:
+                logger.warning("캐시 DB 초기화 실패 (%s): %s", db_path, e)
+                self._db = None
+
+    def get(self, key: str) -> Optional[Tuple[Any, float]]:
+        """(값, 저장 후 경과 초) 반환, 없거나 만료되면 None"""
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                created_at, value = entry
+                if now - created_at < self.ttl:
+                    self._memory.move_to_end(key)
+                    self._hits += 1
+                    return value, now - created_at
+                del self._memory[key]
+
+            if self._db is not None:
+                entry = self._db_get(key)
+                if entry is not None:
+                    created_at, value = entry
+                    if now - created_at < self.ttl:
+                        self._remember(key, created_at, value)
+                        self._hits += 1
+                        self._disk_hits += 1
+                        return value, now - created_at
+
+            self._misses += 1
+            return None
+
+    def set(self, key: str, value: Any):
+        """값 저장"""
+        created_at = time.time()
+        with self._lock:
+            self._remember(key, created_at, value)
+            if self._db is not None:
+                self._db_set(key, created_at, value)
+
+    def delete(self, key: str):
+        """항목 삭제"""
+        with self._lock:
+            self._memory.pop(key, None)
+            if self._db is not None:
+                try:
+                    self._db.execute(
+                        'DELETE FROM cache_entries WHERE namespace = ? AND key = ?', (self.namespace, key)
+                    )
+                    self._db.commit()
+                except sqlite3.Error as e:
+                    logger.warning("캐시 삭제 실패: %s", e)
+
+    def clear(self):
+        """네임스페이스의 모든 항목 삭제"""
+        with self._lock:
+            self._memory.clear()
+            if self._db is not None:
+                try:
+                    self._db.execute('DELETE FROM cache_entries WHERE namespace = ?', (self.namespace,))
+                    self._db.commit()
+                except sqlite3.Error as e:
+                    logger.warning("캐시 초기화 실패: %s", e)
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 적중/실패 통계"""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                'namespace': self.namespace,
+                'ttl': self.ttl,
+                'max_entries': self.max_entries,
+                'memory_entries': len(self._memory),
+                'persistent': self._db is not None,
+                'hits': self._hits,
+                'disk_hits': self._disk_hits,
+                'misses': self._misses,
+                'hit_rate': round(self._hits / lookups, 3) if lookups else None
+            }
+
+    def _remember(self, key: str, created_at: float, value: Any):
+        """메모리 계층에 저장하고 크기 상한을 넘으면 LRU 항목 제거"""
+        self._memory[key] = (created_at, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _db_get(self, key: str) -> Optional[Tuple[float, Any]]:
+        try:
+            row = self._db.execute(
+                'SELECT created_at, value FROM cache_entries WHERE namespace = ? AND key = ?',
+                (self.namespace, key)
+            ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning("캐시 조회 실패: %s", e)
+            return None
+        if row is None:
+            return None
+        try:
+            return row[0], json.loads(row[1])
+        except ValueError:
+            return None
+
+    def _db_set(self, key: str, created_at: float, value: Any):
+        try:
+            self._db.execute(
+                'INSERT OR REPLACE INTO cache_entries (namespace, key, created_at, value) VALUES (?, ?, ?, ?)',
+                (self.namespace, key, created_at, json.dumps(value, ensure_ascii=False))
+            )
+            self._writes_since_prune += 1
+            if self._writes_since_prune >= 100:
+                self._db_prune(created_at)
+            self._db.commit()
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            logger.warning("캐시 저장 실패: %s", e)
+
+    def _db_prune(self, now: float):
+        """만료 항목과 디스크 상한을 넘는 오래된 항목 정리"""
+        self._writes_since_prune = 0
+        self._db.execute(
+            'DELETE FROM cache_entries WHERE namespace = ? AND created_at < ?',
+            (self.namespace, now - self.ttl)
+        )
+        self._db.execute(
+            'DELETE FROM cache_entries WHERE namespace = ? AND key IN ('
+            ' SELECT key FROM cache_entries WHERE namespace = ?'
+            ' ORDER BY created_at DESC LIMIT -1 OFFSET ?)',
+            (self.namespace, self.namespace, self.max_disk_entries)
+        )
+
+
+def cache_db_path() -> Optional[str]:
+    """환경변수로 지정한 캐시 DB 경로 (빈 문자열이면 디스크 캐시 비활성화)"""
+    path = os.getenv('CACHE_DB_PATH', DEFAULT_CACHE_DB_PATH)
+    return path or None
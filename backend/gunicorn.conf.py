@@ -0,0 +1,86 @@
+"""gunicorn 설정 (운영 환경)
+
+    gunicorn -c gunicorn.conf.py wsgi:app
+
+- 앱을 미리 import 한 뒤(preload_app) fork 해서 워커 시작이 빠르고 코드 페이지를 공유한다
+- 브라우저 풀/HTTP 커넥션 풀/스레드 풀/SQLite 연결은 fork 후 워커마다 만든다 (post_fork)
+- /api/metrics 지표는 워커마다 캐시 DB에 기록해서 합산하므로 어느 워커가 응답해도 같다
+- SIGTERM을 받으면 바로 draining 상태가 되어 새 요청을 받지 않고 (post_worker_init),
+  진행 중인 요청과 백그라운드 작업이 끝날 때까지 GRACEFUL_TIMEOUT 초 동안 기다린 뒤
+  종료한다 (worker_exit)
+"""
+import multiprocessing
+import os
+import signal
+
+bind = os.getenv('BIND', '0.0.0.0:5000')
+
+# 요청 처리는 대부분 스크래핑/LLM 응답 대기(I/O)라서 워커마다 스레드를 여러 개 둔다
+workers = int(os.getenv('WEB_CONCURRENCY', str(multiprocessing.cpu_count())))
+# 워커별 리소스 크기(파싱 풀 등)를 워커 수에 맞춰 나누도록 알려 줌
+os.environ['WEB_CONCURRENCY'] = str(workers)
+worker_class = 'gthread'
+threads = int(os.getenv('WEB_THREADS', '8'))
+
+preload_app = True
+
+# 긴 기사 처리(렌더링 + 번역 + 요약)가 끝날 수 있을 만큼
+timeout = int(os.getenv('WORKER_TIMEOUT', '180'))
+graceful_timeout = int(os.getenv('GRACEFUL_TIMEOUT', '120'))
+keepalive = 5
+
+# 브라우저 등 장시간 실행으로 늘어나는 메모리를 주기적으로 정리 (0이면 재시작 안 함)
+max_requests = int(os.getenv('MAX_REQUESTS', '1000'))
+max_requests_jitter = max_requests // 10
+
+accesslog = '-'
+errorlog = '-'
+loglevel = os.getenv('LOG_LEVEL', 'info').lower()
+
+
+def on_starting(server):
+    """이전 실행에서 워커들이 공유 DB에 남긴 지표 삭제 (마스터에서 한 번)"""
+    import metrics
+
+    metrics.clear_shared()
+
+
+def post_fork(server, worker):
+    """워커 프로세스에서 무거운 리소스 생성"""
+    import app
+
+    app.init_services()
+    if os.getenv('WARM_UP', 'true').lower() == 'true':
+        app.news_service.warm_up()
+
+
+def post_worker_init(worker):
+    """SIGTERM 처리기를 감싸서 신호를 받은 순간 draining 상태로 전환
+
+    gunicorn은 post_fork 이후에 워커의 신호 처리기를 다시 등록하므로 여기서 감싼다.
+    worker_exit는 진행 중인 요청이 모두 끝난 뒤에야 호출되므로 그 전까지
+    /api/health가 draining을 보고하려면 신호 시점에 표시해야 한다.
+    """
+    import app
+
+    handle_exit = worker.handle_exit
+
+    def handle_term(sig, frame):
+        app.begin_draining()
+        handle_exit(sig, frame)
+
+    signal.signal(signal.SIGTERM, handle_term)
+
+
+def worker_int(worker):
+    """SIGINT/SIGQUIT (즉시 종료) 때도 draining으로 표시"""
+    import app
+
+    app.begin_draining()
+
+
+def worker_exit(server, worker):
+    """진행 중인 작업을 마저 처리하고 리소스 정리"""
+    import app
+
+    app.shutdown_services(wait=True)
@@ -0,0 +1,101 @@
+import logging
+from typing import Optional, Dict, Any, Tuple
+import lxml.etree
+from static_extractor import SelectorPlan, clean_text, element_text
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 64 * 1024
+
+
+class ContainerWatcher:
+    """받은 청크를 lxml 증분 파서에 넣으면서 본문 추출 결과가 확정됐는지 확인
+
+    추출기는 선택자를 우선순위대로 시도하고 처음 맞는 선택자의 매칭 요소를 모두 이어 붙이므로,
+    이 요청의 선택자 순서에서 첫 번째 선택자 하나만 본다 (뒤에 나오는 다른 선택자의 매칭은
+    결과를 바꾸지 못함). 본문이 같은 선택자의 여러 조각으로 나뉜 경우를 놓치지 않도록 매칭
+    요소를 감싸는 부모가 닫힐 때까지 기다렸다가, 지금까지 모인 본문이 min_chars 이상이면
+    더 읽지 않아도 된다고 판단한다. 트리는 판단에만 쓰고, 추출은 받은 바이트로 다시 한다
+    (정적 추출기와 인코딩 판별/결과를 똑같이 유지하기 위해).
+    """
+
+    def __init__(self, plan: SelectorPlan, min_chars: int):
+        # 요청마다 새로 만들고, 선택자 계획(첫 번째 본문 선택자 하나)은 스크래퍼가 컴파일해 둔 것을 공유
+        self.plan = plan
+        self.min_chars = min_chars
+        self._parser = lxml.etree.HTMLPullParser(events=('end',))
+        # 추출기와 같은 규칙으로 모은 매칭 요소 텍스트 (50자 초과만)
+        self._parts = []
+        # 마지막 매칭 요소의 부모와 그 요소 (부모가 닫히면 판단)
+        self._parent = None
+        self._first = None
+        self.container = None
+
+    def feed(self, chunk: bytes) -> bool:
+        """청크를 파싱하고 본문이 충분히 모인 채로 본문 영역이 닫혔으면 True"""
+        if self.plan is None:
+            return False
+        try:
+            self._parser.feed(chunk)
+            for _, element in self._parser.read_events():
+                if element is self._parent:
+                    self._parent = None
+                    if len(clean_text('\n\n'.join(self._parts))) >= self.min_chars:
+                        self.container = self._describe(self._first)
+                        return True
+                elif self.plan.matches_any(element) and not self._inside_match(element):
+                    text = element_text(element).strip()
+                    if len(text) > 50:
+                        self._parts.append(text)
+                    if self._parent is None:
+                        self._parent = element.getparent()
+                        self._first = element
+        except lxml.etree.LxmlError as e:
+            # 판단용 파서가 실패해도 본문은 끝까지 받으면 되므로 감시만 중단
+            logger.debug("증분 파싱 실패 (조기 종료 사용 안 함): %s", e)
+            self.plan = None
+        return False
+
+    def _inside_match(self, element) -> bool:
+        """바깥 요소도 같은 선택자에 매칭되면 바깥 요소가 닫힐 때 처리"""
+        return any(self.plan.matches_any(ancestor) for ancestor in element.iterancestors())
+
+    @staticmethod
+    def _describe(element) -> str:
+        classes = (element.get('class') or '').split()
+        if element.get('id'):
+            return f"{element.tag}#{element.get('id')}"
+        return element.tag + ''.join(f'.{cls}' for cls in classes[:2])
+
+
+def read_html(response, max_bytes: int,
+              watcher: Optional[ContainerWatcher] = None) -> Tuple[bytes, Dict[str, Any]]:
+    """stream=True 로 받은 응답 본문을 크기 제한과 조기 종료를 적용해 읽음
+
+    반환: (본문 바이트, {'bytes', 'truncated', 'early_stop'})
+    max_bytes는 압축 해제 후 크기 기준이며, 넘으면 그 지점까지만 사용한다.
+    """
+    chunks = []
+    size = 0
+    truncated = False
+    early_stop = None
+    try:
+        for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+            if not chunk:
+                continue
+            if size + len(chunk) > max_bytes:
+                chunk = chunk[:max_bytes - size]
+                truncated = True
+            chunks.append(chunk)
+            size += len(chunk)
+            if truncated:
+                break
+            if watcher is not None and watcher.feed(chunk):
+                early_stop = watcher.container
+                break
+    finally:
+        # 끝까지 읽지 않은 연결은 재사용할 수 없으므로 닫는다
+        response.close()
+
+    return b''.join(chunks), {'bytes': size, 'truncated': truncated, 'early_stop': early_stop}
+
@@ -0,0 +1,207 @@
+import hashlib
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Optional, Dict, Any
+
+from cache import cache_db_path
+
+logger = logging.getLogger(__name__)
+
+MAX_AGE_RE = re.compile(r'(?:^|,)\s*max-age\s*=\s*"?(\d+)"?', re.IGNORECASE)
+
+
+def body_hash(body: bytes) -> str:
+    return hashlib.sha256(body).hexdigest()
+
+
+class CachedResponse:
+    """디스크에 저장된 응답 하나 (검증자 + 본문 + 추출 결과)"""
+
+    def __init__(self, url: str, etag: Optional[str], last_modified: Optional[str], body: bytes,
+                 body_hash: str, fetched_at: float, max_age: float, result: Optional[Dict[str, Any]]):
+        self.url = url
+        self.etag = etag
+        self.last_modified = last_modified
+        self.body = body
+        self.body_hash = body_hash
+        self.fetched_at = fetched_at
+        self.max_age = max_age
+        self.result = result
+
+    @property
+    def fresh(self) -> bool:
+        """Cache-Control max-age 안이면 서버에 다시 묻지 않고 사용"""
+        return time.time() - self.fetched_at < self.max_age
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """재요청 시 보낼 조건부 요청 헤더"""
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+class HttpCache:
+    """가져온 기사 HTML을 검증자(ETag/Last-Modified)와 함께 SQLite에 저장
+
+    재요청 때 조건부 요청을 보내 304면 저장된 본문을 쓰고, 본문 해시가 같으면
+    저장해 둔 추출 결과를 그대로 써서 파싱을 건너뛴다. 본문은 zlib으로 압축해 저장한다.
+    """
+
+    def __init__(self, db_path: str, max_entries: Optional[int] = None,
+                 default_max_age: Optional[float] = None):
+        self.db_path = db_path
+        self.max_entries = max_entries or int(os.getenv('HTTP_CACHE_MAX_ENTRIES', '500'))
+        # Cache-Control max-age가 없을 때 쓸 유효 시간 (0이면 매번 재검증)
+        self.default_max_age = default_max_age if default_max_age is not None else float(
+            os.getenv('HTTP_CACHE_DEFAULT_MAX_AGE', '0')
+        )
+        self._lock = threading.Lock()
+        self._counts = {'fresh': 0, 'revalidated': 0, 'modified': 0, 'miss': 0, 'extraction_skipped': 0}
+        self._writes_since_prune = 0
+
+        self._db = sqlite3.connect(db_path, check_same_thread=False, timeout=10)
+        self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.execute(
+            'CREATE TABLE IF NOT EXISTS http_responses ('
+            ' url TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, body BLOB NOT NULL,'
+            ' body_hash TEXT NOT NULL, fetched_at REAL NOT NULL, max_age REAL NOT NULL, result TEXT)'
+        )
+        self._db.commit()
+
+    def get(self, url: str) -> Optional[CachedResponse]:
+        with self._lock:
+            try:
+                row = self._db.execute(
+                    'SELECT url, etag, last_modified, body, body_hash, fetched_at, max_age, result'
+                    ' FROM http_responses WHERE url = ?', (url,)
+                ).fetchone()
+            except sqlite3.Error as e:
+                logger.warning("HTTP 캐시 조회 실패: %s", e)
+                return None
+        if row is None:
+            return None
+        try:
+            body = zlib.decompress(row[3])
+            result = json.loads(row[7]) if row[7] else None
+        except (zlib.error, ValueError):
+            return None
+        return CachedResponse(row[0], row[1], row[2], body, row[4], row[5], row[6], result)
+
+    def store(self, url: str, response, body: bytes) -> Optional[CachedResponse]:
+        """200 응답 저장 (no-store 이거나 검증자/유효 시간이 모두 없으면 저장하지 않음)"""
+        cache_control = response.headers.get('Cache-Control', '')
+        if 'no-store' in cache_control.lower():
+            self.delete(url)
+            return None
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        max_age = self._max_age(cache_control)
+        if not etag and not last_modified and max_age <= 0:
+            self.delete(url)
+            return None
+
+        entry = CachedResponse(url, etag, last_modified, body, body_hash(body), time.time(), max_age, None)
+        with self._lock:
+            try:
+                self._db.execute(
+                    'INSERT OR REPLACE INTO http_responses'
+                    ' (url, etag, last_modified, body, body_hash, fetched_at, max_age, result)'
+                    ' VALUES (?, ?, ?, ?, ?, ?, ?, NULL)',
+                    (url, etag, last_modified, zlib.compress(body), entry.body_hash, entry.fetched_at, max_age)
+                )
+                self._writes_since_prune += 1
+                if self._writes_since_prune >= 50:
+                    self._prune()
+                self._db.commit()
+            except sqlite3.Error as e:
+                logger.warning("HTTP 캐시 저장 실패: %s", e)
+        return entry
+
+    def touch(self, entry: CachedResponse, response):
+        """304 응답으로 재검증된 항목의 유효 시간/검증자 갱신"""
+        entry.fetched_at = time.time()
+        entry.max_age = self._max_age(response.headers.get('Cache-Control', ''))
+        entry.etag = response.headers.get('ETag') or entry.etag
+        entry.last_modified = response.headers.get('Last-Modified') or entry.last_modified
+        with self._lock:
+            try:
+                self._db.execute(
+                    'UPDATE http_responses SET fetched_at = ?, max_age = ?, etag = ?, last_modified = ?'
+                    ' WHERE url = ?',
+                    (entry.fetched_at, entry.max_age, entry.etag, entry.last_modified, entry.url)
+                )
+                self._db.commit()
+            except sqlite3.Error as e:
+                logger.warning("HTTP 캐시 갱신 실패: %s", e)
+
+    def delete(self, url: str):
+        with self._lock:
+            try:
+                self._db.execute('DELETE FROM http_responses WHERE url = ?', (url,))
+                self._db.commit()
+            except sqlite3.Error as e:
+                logger.warning("HTTP 캐시 삭제 실패: %s", e)
+
+    def save_result(self, url: str, hash_value: str, result: Dict[str, Any]):
+        """본문 해시에 해당하는 추출 결과 저장 (본문이 바뀌었으면 무시)"""
+        with self._lock:
+            try:
+                self._db.execute(
+                    'UPDATE http_responses SET result = ? WHERE url = ? AND body_hash = ?',
+                    (json.dumps(result, ensure_ascii=False), url, hash_value)
+                )
+                self._db.commit()
+            except (sqlite3.Error, TypeError, ValueError) as e:
+                logger.warning("HTTP 캐시 추출 결과 저장 실패: %s", e)
+
+    def count(self, outcome: str):
+        with self._lock:
+            self._counts[outcome] = self._counts.get(outcome, 0) + 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            try:
+                entries = self._db.execute('SELECT COUNT(*) FROM http_responses').fetchone()[0]
+            except sqlite3.Error:
+                entries = None
+            return dict(self._counts, entries=entries, max_entries=self.max_entries)
+
+    def _max_age(self, cache_control: str) -> float:
+        if 'no-cache' in cache_control.lower():
+            return 0
+        match = MAX_AGE_RE.search(cache_control)
+        if match:
+            return float(match.group(1))
+        return self.default_max_age
+
+    def _prune(self):
+        """오래된 항목부터 max_entries를 넘는 만큼 삭제 (잠금을 잡은 상태에서 호출)"""
+        self._writes_since_prune = 0
+        self._db.execute(
+            'DELETE FROM http_responses WHERE url IN ('
+            ' SELECT url FROM http_responses ORDER BY fetched_at DESC LIMIT -1 OFFSET ?)',
+            (self.max_entries,)
+        )
+
+
+def create_http_cache() -> Optional[HttpCache]:
+    """HTTP_CACHE=false 이거나 캐시 DB 경로가 없으면 None"""
+    if os.getenv('HTTP_CACHE', 'true').lower() != 'true':
+        return None
+    db_path = cache_db_path()
+    if not db_path:
+        return None
+    try:
+        return HttpCache(db_path)
+    except sqlite3.Error as e:
+        logger.warning("HTTP 캐시 초기화 실패 (%s): %s", db_path, e)
+        return None
@@ -0,0 +1,122 @@
+import requests
+from requests.adapters import HTTPAdapter
+import os
+import threading
+from urllib.parse import urlsplit
+from typing import Optional, Dict, Any
+
+
+class HttpClient:
+    """스크래핑과 LLM 호출이 함께 쓰는 HTTP 클라이언트
+
+    호스트별 커넥션 풀을 유지하고 keep-alive로 연결을 재사용한다.
+    requests.Session은 스레드 간 공유가 안전하지 않으므로 스레드마다 Session을
+    두되, 모든 Session이 같은 HTTPAdapter(같은 커넥션 풀)를 마운트한다.
+    """
+
+    def __init__(self, pool_connections: Optional[int] = None, pool_maxsize: Optional[int] = None,
+                 connect_timeout: Optional[float] = None, pool_block: Optional[bool] = None):
+        # 커넥션 풀을 유지할 호스트 수
+        self.pool_connections = pool_connections or int(os.getenv('HTTP_POOL_CONNECTIONS', '20'))
+        # 호스트당 최대 연결 수
+        self.pool_maxsize = pool_maxsize or int(os.getenv('HTTP_POOL_MAXSIZE', '20'))
+        self.connect_timeout = connect_timeout or float(os.getenv('HTTP_CONNECT_TIMEOUT', '5'))
+        if pool_block is None:
+            pool_block = os.getenv('HTTP_POOL_BLOCK', 'false').lower() == 'true'
+
+        self._adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=pool_block
+        )
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._requests_by_host: Dict[str, int] = {}
+        self._errors_by_host: Dict[str, int] = {}
+
+    @property
+    def session(self) -> requests.Session:
+        """현재 스레드의 Session (공유 어댑터 사용)"""
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = requests.Session()
+            session.mount('http://', self._adapter)
+            session.mount('https://', self._adapter)
+            self._local.session = session
+        return session
+
+    def request(self, method: str, url: str, read_timeout: float = 30, **kwargs) -> requests.Response:
+        """요청 전송 (연결/읽기 타임아웃을 따로 적용)"""
+        kwargs.setdefault('timeout', (self.connect_timeout, read_timeout))
+        host = urlsplit(url).netloc
+        try:
+            return self.session.request(method, url, **kwargs)
+        except requests.RequestException:
+            with self._lock:
+                self._errors_by_host[host] = self._errors_by_host.get(host, 0) + 1
+            raise
+        finally:
+            with self._lock:
+                self._requests_by_host[host] = self._requests_by_host.get(host, 0) + 1
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request('POST', url, **kwargs)
+
+    def stats(self) -> Dict[str, Any]:
+        """호스트별 커넥션 풀 상태와 연결 재사용률"""
+        pools = {}
+        manager = self._adapter.poolmanager
+        for key in list(manager.pools.keys()):
+            pool = manager.pools.get(key)
+            if pool is None:
+                continue
+            host = f'{pool.host}:{pool.port}' if pool.port else pool.host
+            served = pool.num_requests
+            opened = pool.num_connections
+            pools[host] = {
+                'scheme': pool.scheme,
+                'requests': served,
+                'connections_opened': opened,
+                # 큐의 None은 아직 열리지 않은 연결 자리
+                'idle_connections': sum(1 for conn in list(pool.pool.queue) if conn is not None) if pool.pool else 0,
+                'reuse_rate': round(1 - opened / served, 3) if served else None
+            }
+
+        total_requests = sum(p['requests'] for p in pools.values())
+        total_opened = sum(p['connections_opened'] for p in pools.values())
+        with self._lock:
+            requests_by_host = dict(self._requests_by_host)
+            errors_by_host = dict(self._errors_by_host)
+
+        return {
+            'pool_connections': self.pool_connections,
+            'pool_maxsize': self.pool_maxsize,
+            'connect_timeout': self.connect_timeout,
+            'requests': total_requests,
+            'connections_opened': total_opened,
+            'reuse_rate': round(1 - total_opened / total_requests, 3) if total_requests else None,
+            'pools': pools,
+            'requests_by_host': requests_by_host,
+            'errors_by_host': errors_by_host
+        }
+
+    def close(self):
+        """모든 커넥션 풀 정리"""
+        self._adapter.close()
+
+
+_default_client: Optional[HttpClient] = None
+_default_client_lock = threading.Lock()
+
+
+def get_http_client() -> HttpClient:
+    """프로세스 전체에서 공유하는 HTTP 클라이언트"""
+    global _default_client
+    if _default_client is None:
+        with _default_client_lock:
+            if _default_client is None:
+                _default_client = HttpClient()
+    return _default_client
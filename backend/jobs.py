@@ -0,0 +1,213 @@
+import copy
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any
+from cache import cache_db_path
+
+logger = logging.getLogger(__name__)
+
+
+class Job:
+    """백그라운드에서 실행되는 기사 처리 작업"""
+
+    def __init__(self, url: str):
+        self.id = uuid.uuid4().hex
+        self.url = url
+        self.status = 'queued'  # queued → running → done / failed
+        self.progress = 0
+        self.current_step = '대기 중'
+        self.partial: Dict[str, Any] = {}
+        self.result: Optional[Dict[str, Any]] = None
+        self.error: Optional[str] = None
+        self.created_at = time.time()
+        self.updated_at = self.created_at
+        self.finished_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def update(self, progress: int, current_step: str, partial: Optional[Dict[str, Any]] = None):
+        """진행 상황 갱신 (파이프라인 스테이지 스레드에서 호출)"""
+        with self._lock:
+            self.progress = max(self.progress, progress)
+            self.current_step = current_step
+            if partial:
+                for key, value in partial.items():
+                    if isinstance(value, dict):
+                        self.partial.setdefault(key, {}).update(value)
+                    else:
+                        self.partial[key] = value
+            self.updated_at = time.time()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """API 응답용 스냅샷"""
+        with self._lock:
+            data = {
+                'job_id': self.id,
+                'url': self.url,
+                'status': self.status,
+                'progress': self.progress,
+                'current_step': self.current_step,
+                'partial': copy.deepcopy(self.partial),
+                'created_at': self.created_at,
+                'updated_at': self.updated_at,
+                'elapsed': round((self.finished_at or time.time()) - self.created_at, 2)
+            }
+            if self.result is not None:
+                data['result'] = self.result
+            if self.error is not None:
+                data['error'] = self.error
+            if self.finished_at is not None:
+                data['finished_at'] = self.finished_at
+            return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Job':
+        """저장된 스냅샷으로 작업 복원 (다른 워커 프로세스의 작업 조회용)"""
+        job = cls(data['url'])
+        job.id = data['job_id']
+        job.status = data['status']
+        job.progress = data['progress']
+        job.current_step = data['current_step']
+        job.partial = data.get('partial') or {}
+        job.result = data.get('result')
+        job.error = data.get('error')
+        job.created_at = data['created_at']
+        job.updated_at = data['updated_at']
+        job.finished_at = data.get('finished_at')
+        return job
+
+
+class JobManager:
+    """기사 처리 작업을 백그라운드 워커에서 실행하고 상태를 보관
+
+    완료된 작업은 JOB_RETENTION 초 동안 조회할 수 있다.
+    캐시 DB가 있으면 작업 상태를 SQLite에도 저장해서, 여러 워커 프로세스로 실행할 때
+    작업을 등록한 워커가 아닌 다른 워커에서도 조회할 수 있다.
+    """
+
+    def __init__(self, service, workers: Optional[int] = None, retention: Optional[float] = None,
+                 db_path: Optional[str] = None):
+        self.service = service
+        self.workers = workers or int(os.getenv('JOB_WORKERS', '4'))
+        self.retention = retention or float(os.getenv('JOB_RETENTION', '3600'))
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='job-worker')
+        self._jobs: Dict[str, Job] = {}
+        self._lock = threading.Lock()
+        
+        self._db = None
+        self._db_lock = threading.Lock()
+        db_path = db_path if db_path is not None else cache_db_path()
+        if db_path:
+            try:
+                self._db = sqlite3.connect(db_path, check_same_thread=False, timeout=10)
+                self._db.execute('PRAGMA journal_mode=WAL')
+                self._db.execute(
+                    'CREATE TABLE IF NOT EXISTS jobs ('
+                    ' id TEXT PRIMARY KEY, data TEXT NOT NULL, finished_at REAL)'
+                )
+                self._db.commit()
+            except sqlite3.Error as e:
+                logger.warning("작업 DB 초기화 실패 (%s): %s", db_path, e)
+                self._db = None
+
+    def submit(self, url: str, use_cache: bool = True) -> Job:
+        """작업 등록 후 즉시 반환"""
+        self._prune()
+        job = Job(url)
+        with self._lock:
+            self._jobs[job.id] = job
+        self._save(job)
+        self._executor.submit(self._run, job, use_cache)
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """작업 조회 (이 프로세스에 없으면 공유 DB에서)"""
+        with self._lock:
+            job = self._jobs.get(job_id)
+        if job is not None or self._db is None:
+            return job
+        try:
+            with self._db_lock:
+                row = self._db.execute('SELECT data FROM jobs WHERE id = ?', (job_id,)).fetchone()
+        except sqlite3.Error as e:
+            logger.warning("작업 조회 실패: %s", e)
+            return None
+        return Job.from_dict(json.loads(row[0])) if row else None
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            counts: Dict[str, int] = {}
+            for job in self._jobs.values():
+                counts[job.status] = counts.get(job.status, 0) + 1
+        return {'workers': self.workers, 'jobs': counts}
+
+    def shutdown(self, wait: bool = True):
+        """새 작업을 받지 않고, wait=True 이면 실행 중인 작업이 끝날 때까지 대기"""
+        self._executor.shutdown(wait=wait, cancel_futures=not wait)
+
+    def _run(self, job: Job, use_cache: bool):
+        with job._lock:
+            job.status = 'running'
+            job.updated_at = time.time()
+        self._save(job)
+        
+        def on_progress(progress: int, current_step: str, partial: Optional[Dict[str, Any]] = None):
+            job.update(progress, current_step, partial)
+            self._save(job)
+        
+        try:
+            result = self.service.process_article(job.url, use_cache=use_cache, on_progress=on_progress)
+            with job._lock:
+                job.result = result
+                job.status = 'done' if result.get('success') else 'failed'
+                job.error = result.get('error')
+                job.progress = result.get('progress', job.progress)
+                job.current_step = result.get('current_step', job.current_step)
+        except Exception as e:
+            logger.exception("작업 처리 오류 (%s): %s", job.id, e)
+            with job._lock:
+                job.status = 'failed'
+                job.error = f'서버 오류: {str(e)}'
+        finally:
+            with job._lock:
+                job.finished_at = job.updated_at = time.time()
+            self._save(job)
+
+    def _save(self, job: Job):
+        """작업 상태를 공유 DB에 저장"""
+        if self._db is None:
+            return
+        data = job.to_dict()
+        try:
+            with self._db_lock:
+                self._db.execute(
+                    'INSERT OR REPLACE INTO jobs (id, data, finished_at) VALUES (?, ?, ?)',
+                    (job.id, json.dumps(data, ensure_ascii=False), data.get('finished_at'))
+                )
+                self._db.commit()
+        except sqlite3.Error as e:
+            logger.warning("작업 저장 실패: %s", e)
+
+    def _prune(self):
+        """보관 기간이 지난 완료 작업 삭제"""
+        cutoff = time.time() - self.retention
+        with self._lock:
+            expired = [
+                job_id for job_id, job in self._jobs.items()
+                if job.finished_at is not None and job.finished_at < cutoff
+            ]
+            for job_id in expired:
+                del self._jobs[job_id]
+        
+        if self._db is not None:
+            try:
+                with self._db_lock:
+                    self._db.execute('DELETE FROM jobs WHERE finished_at < ?', (cutoff,))
+                    self._db.commit()
+            except sqlite3.Error as e:
+                logger.warning("작업 정리 실패: %s", e)
@@ -0,0 +1,445 @@
+import bisect
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+from dotenv import load_dotenv
+from cache import cache_db_path
+
+# 환경변수 로드 (ENABLED를 import 시점에 읽으므로)
+load_dotenv()
+
+# 지연 시간 히스토그램 구간(초) - 정적 파싱(ms 단위)부터 LLM 호출/렌더링(수십 초)까지
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+# METRICS_ENABLED=false 이면 기록하지 않고 /api/metrics도 비활성화
+ENABLED = os.getenv('METRICS_ENABLED', 'true').lower() == 'true'
+
+# 워커가 여러 개일 때 각 프로세스의 지표를 공유 DB에 기록하는 간격(초)
+FLUSH_INTERVAL = float(os.getenv('METRICS_FLUSH_INTERVAL', '5'))
+
+logger = logging.getLogger(__name__)
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: Sequence[Tuple[str, str]] = ()) -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    pairs.extend(f'{name}="{value}"' for name, value in extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+def _copy(value: Any) -> Any:
+    """카운터 값 또는 히스토그램 [구간별 개수, 합계, 개수]의 사본"""
+    return [list(value[0]), value[1], value[2]] if isinstance(value, list) else value
+
+
+def _format_value(value: float) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+class _Metric:
+    kind = ''
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = (),
+                 registry: Optional['Registry'] = None):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.registry = registry
+        self._lock = threading.Lock()
+        self._values: Dict[Tuple[str, ...], Any] = {}
+        # 공유 DB에 아직 기록하지 않은 시계열
+        self._dirty = set()
+
+    def _key(self, labels: Dict[str, Any]) -> Tuple[str, ...]:
+        return tuple(str(labels.get(name, '')) for name in self.labelnames)
+
+    def _changed(self, key: Tuple[str, ...]):
+        """값을 바꾼 뒤 호출 (_lock 안에서)"""
+        self._dirty.add(key)
+        if self.registry is not None and self.registry.shared is not None:
+            self.registry.start_flusher()
+
+    def take_dirty(self) -> List[Tuple[Tuple[str, ...], Any]]:
+        """마지막 기록 이후 바뀐 시계열의 현재 값"""
+        with self._lock:
+            items = [(key, _copy(self._values[key])) for key in self._dirty]
+            self._dirty.clear()
+        return items
+
+    def mark_dirty(self, keys: Iterable[Tuple[str, ...]]):
+        """기록에 실패한 시계열을 다음 기록 때 다시 보냄"""
+        with self._lock:
+            self._dirty.update(keys)
+
+    def local_values(self) -> Dict[Tuple[str, ...], Any]:
+        with self._lock:
+            return {key: _copy(value) for key, value in self._values.items()}
+
+    def reset(self):
+        """fork 직후 자식 프로세스에서 호출 (부모의 값과 잠금 상태를 버림)"""
+        self._lock = threading.Lock()
+        self._values = {}
+        self._dirty = set()
+
+    def render(self, values: Optional[Dict[Tuple[str, ...], Any]] = None,
+               extra: Sequence[Tuple[str, str]] = ()) -> List[str]:
+        """values를 주면 그 값(여러 워커 합계)을, 없으면 이 프로세스의 값을 출력"""
+        lines = [f'# HELP {self.name} {self.documentation}', f'# TYPE {self.name} {self.kind}']
+        if values is None:
+            values = self.local_values()
+        for key, value in sorted(values.items()):
+            lines.extend(self._render_series(key, value, extra))
+        return lines
+
+    @staticmethod
+    def merge(total: Any, value: Any) -> Any:
+        raise NotImplementedError
+
+    def _render_series(self, key: Tuple[str, ...], value: Any, extra: Sequence[Tuple[str, str]]) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """단조 증가 카운터"""
+    kind = 'counter'
+
+    def inc(self, amount: float = 1, **labels):
+        if not ENABLED:
+            return
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+            self._changed(key)
+
+    def value(self, **labels) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0)
+
+    @staticmethod
+    def merge(total, value):
+        return value if total is None else total + value
+
+    def _render_series(self, key, value, extra):
+        return [f'{self.name}{_format_labels(self.labelnames, key, extra)} {_format_value(value)}']
+
+
+class Histogram(_Metric):
+    """구간별 관측 수 + 합계 + 개수 (Prometheus histogram)"""
+    kind = 'histogram'
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS, registry: Optional['Registry'] = None):
+        super().__init__(name, documentation, labelnames, registry)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels):
+        if not ENABLED:
+            return
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._values.get(key)
+            if series is None:
+                # 구간별 개수(마지막은 +Inf), 합계, 개수
+                series = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+            self._changed(key)
+
+    @contextmanager
+    def time(self, **labels) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    @staticmethod
+    def merge(total, value):
+        if total is None:
+            return value
+        return [[a + b for a, b in zip(total[0], value[0])], total[1] + value[1], total[2] + value[2]]
+
+    def _render_series(self, key, value, extra):
+        counts, total, count = value
+        lines = []
+        cumulative = 0
+        for bound, bucket_count in zip(self.buckets + (float('inf'),), counts):
+            cumulative += bucket_count
+            labels = _format_labels(self.labelnames, key, tuple(extra) + (('le', _format_value(bound)),))
+            lines.append(f'{self.name}_bucket{labels} {cumulative}')
+        labels = _format_labels(self.labelnames, key, extra)
+        lines.append(f'{self.name}_sum{labels} {_format_value(round(total, 6))}')
+        lines.append(f'{self.name}_count{labels} {count}')
+        return lines
+
+
+class SharedStore:
+    """워커 프로세스별 지표 값을 SQLite에 모아 두는 저장소
+
+    각 프로세스는 자기 행(process 열)만 덮어쓰고, 출력할 때 모든 프로세스의 값을 합산한다.
+    재시작된 워커의 행도 남겨 두므로 카운터가 줄어들지 않는다 (서버 시작 때 clear).
+    """
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        self._db_pid: Optional[int] = None
+        self.process = ''
+
+    def _connection(self) -> Optional[sqlite3.Connection]:
+        """이 프로세스의 DB 연결 (_lock 안에서 호출, 실패하면 None)"""
+        if self._db_pid != os.getpid():
+            self._db_pid = os.getpid()
+            # pid는 재사용될 수 있으므로 프로세스마다 고유한 이름을 씀
+            self.process = f'{os.getpid()}-{uuid.uuid4().hex[:8]}'
+            try:
+                self._db = sqlite3.connect(self.db_path, check_same_thread=False, timeout=10)
+                self._db.execute('PRAGMA journal_mode=WAL')
+                self._db.execute(
+                    'CREATE TABLE IF NOT EXISTS metric_values ('
+                    ' process TEXT NOT NULL, name TEXT NOT NULL, labels TEXT NOT NULL, value TEXT NOT NULL,'
+                    ' PRIMARY KEY (process, name, labels))'
+                )
+                self._db.commit()
+            except sqlite3.Error as e:
+                logger.warning("지표 DB 초기화 실패 (%s): %s", self.db_path, e)
+                self._db = None
+        return self._db
+
+    def reset(self):
+        """fork 직후 자식 프로세스에서 호출"""
+        self._lock = threading.Lock()
+        self._db_pid = None
+
+    def write(self, rows: List[Tuple[str, str, str]]) -> bool:
+        """(지표 이름, 레이블 JSON, 값 JSON) 목록을 이 프로세스의 값으로 기록"""
+        with self._lock:
+            db = self._connection()
+            if db is None:
+                return False
+            try:
+                db.executemany(
+                    'INSERT OR REPLACE INTO metric_values (process, name, labels, value) VALUES (?, ?, ?, ?)',
+                    [(self.process, name, labels, value) for name, labels, value in rows]
+                )
+                db.commit()
+                return True
+            except sqlite3.Error as e:
+                logger.warning("지표 저장 실패: %s", e)
+                return False
+
+    def read(self) -> Optional[List[Tuple[str, str, str]]]:
+        with self._lock:
+            db = self._connection()
+            if db is None:
+                return None
+            try:
+                return db.execute('SELECT name, labels, value FROM metric_values').fetchall()
+            except sqlite3.Error as e:
+                logger.warning("지표 조회 실패: %s", e)
+                return None
+
+    def clear(self):
+        with self._lock:
+            db = self._connection()
+            if db is None:
+                return
+            try:
+                db.execute('DELETE FROM metric_values')
+                db.commit()
+            except sqlite3.Error as e:
+                logger.warning("지표 초기화 실패: %s", e)
+
+
+class Registry:
+    """등록된 지표를 Prometheus 텍스트 형식으로 출력
+
+    share()로 공유 저장소를 지정하면 FLUSH_INTERVAL 초마다 이 프로세스의 값을 기록하고,
+    render()는 모든 워커의 값을 합산한다. 공유 저장소 없이 워커가 여러 개면 각 시계열에
+    pid 레이블을 붙인다 (워커마다 따로 수집해야 함).
+    """
+
+    def __init__(self):
+        self._metrics: List[_Metric] = []
+        self.shared: Optional[SharedStore] = None
+        self._flusher_pid: Optional[int] = None
+        self._flush_lock = threading.Lock()
+
+    def counter(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> Counter:
+        metric = Counter(name, documentation, labelnames, registry=self)
+        self._metrics.append(metric)
+        return metric
+
+    def histogram(self, name: str, documentation: str, labelnames: Iterable[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        metric = Histogram(name, documentation, labelnames, buckets, registry=self)
+        self._metrics.append(metric)
+        return metric
+
+    def share(self, store: SharedStore):
+        """여러 워커 프로세스의 지표를 store에 모아 합산"""
+        self.shared = store
+        os.register_at_fork(after_in_child=self._after_fork)
+
+    def _after_fork(self):
+        # preload 된 마스터의 값이 워커마다 중복으로 더해지지 않도록 버림
+        self._flush_lock = threading.Lock()
+        self._flusher_pid = None
+        self.shared.reset()
+        for metric in self._metrics:
+            metric.reset()
+
+    def start_flusher(self):
+        """이 프로세스의 주기적 기록 스레드 시작 (이미 있으면 무시)"""
+        if self._flusher_pid == os.getpid():
+            return
+        with self._flush_lock:
+            if self._flusher_pid == os.getpid():
+                return
+            self._flusher_pid = os.getpid()
+            threading.Thread(target=self._flush_loop, name='metrics-flush', daemon=True).start()
+
+    def _flush_loop(self):
+        pid = os.getpid()
+        while self._flusher_pid == pid:
+            time.sleep(FLUSH_INTERVAL)
+            self.flush()
+
+    def flush(self):
+        """바뀐 시계열을 공유 저장소에 기록"""
+        if self.shared is None:
+            return
+        rows = []
+        taken = []
+        for metric in self._metrics:
+            items = metric.take_dirty()
+            taken.append((metric, items))
+            rows.extend((metric.name, json.dumps(list(key), ensure_ascii=False), json.dumps(value))
+                        for key, value in items)
+        if rows and not self.shared.write(rows):
+            # 실패하면 다음 기록 때 다시 시도
+            for metric, items in taken:
+                metric.mark_dirty(key for key, _ in items)
+
+    def _merged(self) -> Optional[Dict[str, Dict[Tuple[str, ...], Any]]]:
+        """모든 워커의 값을 지표/시계열별로 합산 (저장소를 읽지 못하면 None)"""
+        self.flush()
+        rows = self.shared.read()
+        if rows is None:
+            return None
+        metrics = {metric.name: metric for metric in self._metrics}
+        merged: Dict[str, Dict[Tuple[str, ...], Any]] = {name: {} for name in metrics}
+        for name, labels, value in rows:
+            metric = metrics.get(name)
+            if metric is None:
+                continue
+            key = tuple(json.loads(labels))
+            merged[name][key] = metric.merge(merged[name].get(key), json.loads(value))
+        return merged
+
+    def render(self) -> str:
+        merged = self._merged() if self.shared is not None else None
+        extra = ()
+        if merged is None and _worker_count() > 1:
+            extra = (('pid', str(os.getpid())),)
+        lines: List[str] = []
+        for metric in self._metrics:
+            lines.extend(metric.render(merged[metric.name] if merged is not None else None, extra))
+        return '\n'.join(lines) + '\n'
+
+
+def _worker_count() -> int:
+    """웹 서버 워커 프로세스 수 (gunicorn.conf.py가 설정)"""
+    return int(os.getenv('WEB_CONCURRENCY', '') or 1)
+
+
+REGISTRY = Registry()
+
+# gunicorn 워커가 여러 개면 캐시 DB에 모아서 합산 (어느 워커가 /api/metrics에 응답해도 같은 값)
+if ENABLED and _worker_count() > 1 and cache_db_path():
+    REGISTRY.share(SharedStore(cache_db_path()))
+
+# 단계별 지연 시간: fetch(HTTP 다운로드), parse(정적 HTML 추출), render(Playwright 페이지 렌더링+추출),
+# translate/summarize(LLM API 요청 한 번)
+OPERATION_SECONDS = REGISTRY.histogram(
+    'news_operation_duration_seconds', '작업 단계별 소요 시간(초)', ['operation']
+)
+PIPELINE_STAGE_SECONDS = REGISTRY.histogram(
+    'news_pipeline_stage_duration_seconds', '처리 파이프라인 스테이지별 소요 시간(초)', ['stage', 'status']
+)
+SCRAPES = REGISTRY.counter(
+    'news_scrapes_total', '스크래핑 시도 수 (method: requests/playwright)', ['method', 'result']
+)
+FETCH_CUTOFFS = REGISTRY.counter(
+    'news_fetch_cutoffs_total', 'HTML 수신을 끝까지 하지 않은 횟수 (reason: early_stop/size_limit)', ['reason']
+)
+SELECTOR_HITS = REGISTRY.counter(
+    'news_selector_hits_total', '본문/제목 추출에 쓰인 선택자', ['kind', 'strategy', 'selector']
+)
+LLM_REQUESTS = REGISTRY.counter(
+    'news_llm_requests_total', 'LLM API 요청 수', ['operation', 'status']
+)
+LLM_TOKENS = REGISTRY.counter(
+    'news_llm_tokens_total', 'LLM 토큰 사용량 (응답에 usage가 없으면 추정치)', ['operation', 'type']
+)
+ERRORS = REGISTRY.counter(
+    'news_errors_total', '구성 요소별 오류 수 (error: 예외 클래스 또는 HTTP 상태)', ['component', 'error']
+)
+HTTP_REQUESTS = REGISTRY.counter(
+    'news_http_requests_total', 'API 요청 수', ['endpoint', 'method', 'status']
+)
+HTTP_REQUEST_SECONDS = REGISTRY.histogram(
+    'news_http_request_duration_seconds', 'API 응답 시간(초)', ['endpoint']
+)
+
+
+@contextmanager
+def timed(operation: str) -> Iterator[None]:
+    """with 블록 소요 시간을 작업 단계 히스토그램에 기록"""
+    with OPERATION_SECONDS.time(operation=operation):
+        yield
+
+
+def observe(operation: str, seconds: float):
+    OPERATION_SECONDS.observe(seconds, operation=operation)
+
+
+def record_error(component: str, error: Union[BaseException, str]):
+    """오류 수 기록 (예외는 클래스 이름, 문자열은 그대로)"""
+    ERRORS.inc(component=component, error=error if isinstance(error, str) else type(error).__name__)
+
+
+def record_tokens(operation: str, prompt_tokens: Optional[int], completion_tokens: Optional[int]):
+    if prompt_tokens:
+        LLM_TOKENS.inc(prompt_tokens, operation=operation, type='prompt')
+    if completion_tokens:
+        LLM_TOKENS.inc(completion_tokens, operation=operation, type='completion')
+
+
+def render() -> str:
+    return REGISTRY.render()
+
+
+def flush():
+    """종료 전에 남은 값을 공유 저장소에 기록"""
+    REGISTRY.flush()
+
+
+def clear_shared():
+    """서버 시작 때 이전 실행의 워커 값 삭제 (gunicorn 마스터에서 호출)"""
+    if REGISTRY.shared is not None:
+        REGISTRY.shared.clear()
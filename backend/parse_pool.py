@@ -0,0 +1,191 @@
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional, Dict, Any, List
+from static_extractor import StaticExtractor
+
+logger = logging.getLogger(__name__)
+
+# 워커 프로세스 안의 추출기 (초기화 때 한 번 만들어 선택자 컴파일 결과를 재사용)
+_extractor: Optional[StaticExtractor] = None
+
+
+def _init_worker(selectors: Dict[str, List[str]]):
+    global _extractor
+    _extractor = StaticExtractor(
+        selectors['content'], selectors['title'], selectors['author'], selectors['date']
+    )
+
+
+def _ping() -> int:
+    return os.getpid()
+
+
+def default_pool_size() -> int:
+    """PARSE_WORKERS 기본값 - CPU 코어를 웹 워커 프로세스 수(WEB_CONCURRENCY)로 나눈 값
+
+    gunicorn 워커마다 파싱 풀이 따로 생기므로 코어 수 그대로 쓰면 전체 프로세스가
+    코어 수의 제곱이 된다. 개발 서버처럼 프로세스가 하나면 코어 수 전체를 쓴다.
+    """
+    workers = max(1, int(os.getenv('WEB_CONCURRENCY', '1') or 1))
+    return max(1, (os.cpu_count() or 1) // workers)
+
+
+def _mp_context():
+    """워커 생성 방식 - forkserver (지원하지 않는 플랫폼은 spawn)
+
+    서비스 프로세스는 이미 스레드(브라우저 풀, HTTP 커넥션 풀 등)를 가지고 있어서
+    그대로 fork 하면 다른 스레드가 잡고 있던 락이 자식에서 풀리지 않을 수 있다.
+    forkserver는 스레드가 없는 별도 프로세스에서 fork 하며, 이 모듈만 미리 불러 두어
+    app 모듈을 다시 import 하지 않는다.
+    """
+    if 'forkserver' in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context('forkserver')
+        context.set_forkserver_preload([__name__])
+        return context
+    return multiprocessing.get_context('spawn')
+
+
+def _truncate(value: Optional[str], limit: int) -> Optional[str]:
+    if value is None or len(value) <= limit:
+        return value
+    return value[:limit]
+
+
+def _extract_in_worker(html: bytes, title_order: Optional[List[str]], content_order: Optional[List[str]],
+                       max_chars: int) -> Dict[str, Any]:
+    """워커 프로세스에서 추출하고, 돌려보낼 결과는 문자열 필드만 남겨 크기 제한"""
+    started = time.perf_counter()
+    extraction = _extractor.extract(html, title_order=title_order, content_order=content_order)
+    content = extraction['content']
+    extraction['content'] = _truncate(content, max_chars)
+    extraction['title'] = _truncate(extraction['title'], 1000)
+    extraction['metadata'] = {key: _truncate(value, 2000) for key, value in extraction['metadata'].items()}
+    extraction['truncated'] = len(content) > max_chars
+    extraction['worker_ms'] = round((time.perf_counter() - started) * 1000, 1)
+    return extraction
+
+
+class ParsePool:
+    """정적 HTML 추출(lxml 파싱 + 선택자 + 텍스트 정리)을 실행하는 프로세스 풀
+
+    추출은 GIL을 잡는 순수 CPU 작업이라 스레드로 실행하면 같은 프로세스의 다른 요청
+    스레드(네트워크 대기 중인 것 포함)까지 느려진다. 워커 프로세스에는 HTML 바이트만
+    보내고 추출 결과(문자열)만 돌려받으며, 양쪽 모두 크기를 제한한다.
+
+    워커는 forkserver로 만들어서 (워커가 죽어 풀을 다시 만들 때도) 스레드가 있는 서비스
+    프로세스를 fork 하지 않으며, 서비스 초기화 시점에 모두 띄워 둔다 (start).
+    """
+
+    def __init__(self, selectors: Dict[str, List[str]], size: Optional[int] = None,
+                 max_bytes: Optional[int] = None, max_chars: Optional[int] = None,
+                 timeout: Optional[float] = None):
+        self.selectors = selectors
+        self.size = size if size is not None else int(os.getenv('PARSE_WORKERS', '') or default_pool_size())
+        # 워커로 보내는 HTML 최대 크기 (넘는 부분은 잘라서 보냄 - 본문은 대부분 앞쪽에 있음)
+        self.max_bytes = max_bytes or int(os.getenv('PARSE_MAX_BYTES', str(5 * 1024 * 1024)))
+        # 돌려받는 본문 최대 길이(문자)
+        self.max_chars = max_chars or int(os.getenv('PARSE_MAX_CHARS', '200000'))
+        self.timeout = timeout or float(os.getenv('PARSE_TIMEOUT', '30'))
+
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._warming = []
+        self._lock = threading.Lock()
+        self._closed = False
+        self._counts = {'tasks': 0, 'truncated_input': 0, 'truncated_output': 0, 'restarts': 0}
+
+    def start(self, wait: bool = False, timeout: float = 30):
+        """워커 프로세스 시작 (이미 시작된 경우 무시)"""
+        with self._lock:
+            if self._closed:
+                raise RuntimeError('파싱 풀이 이미 종료되었습니다')
+            if self._executor is None:
+                self._executor = self._create_executor()
+                # 첫 작업을 제출할 때 워커를 모두 띄운다
+                self._warming = [self._executor.submit(_ping) for _ in range(self.size)]
+            warming = self._warming
+
+        if wait:
+            for future in warming:
+                future.result(timeout)
+
+    def _create_executor(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(
+            max_workers=self.size,
+            mp_context=_mp_context(),
+            initializer=_init_worker,
+            initargs=(self.selectors,)
+        )
+
+    def warm(self, timeout: float = 30):
+        """서버 시작 시 워커를 미리 띄우고 추출기 초기화까지 끝내 둠"""
+        started = time.monotonic()
+        self.start(wait=True, timeout=timeout)
+        logger.info("파싱 풀 예열 완료: %s개 (%.1f초)", self.size, time.monotonic() - started)
+
+    def extract(self, html: bytes, title_order: Optional[List[str]] = None,
+                content_order: Optional[List[str]] = None) -> Dict[str, Any]:
+        """워커 프로세스에서 StaticExtractor.extract 실행 (결과 형식 동일 + truncated, worker_ms)"""
+        if isinstance(html, str):
+            html = html.encode('utf-8')
+        if len(html) > self.max_bytes:
+            html = html[:self.max_bytes]
+            self._count('truncated_input')
+
+        with self._lock:
+            executor = self._executor
+        if executor is None:
+            self.start()
+            with self._lock:
+                executor = self._executor
+        try:
+            future = executor.submit(_extract_in_worker, html, title_order, content_order, self.max_chars)
+            extraction = future.result(self.timeout)
+        except BrokenProcessPool:
+            # 워커가 죽으면(메모리 부족 등) 풀을 새로 만들고 이번 요청은 실패로 처리
+            self._restart(executor)
+            raise
+        self._count('tasks')
+        if extraction['truncated']:
+            self._count('truncated_output')
+        return extraction
+
+    def _restart(self, broken: ProcessPoolExecutor):
+        with self._lock:
+            if self._closed or self._executor is not broken:
+                return
+            logger.warning("파싱 풀 워커가 비정상 종료되어 다시 시작합니다")
+            self._executor = self._create_executor()
+            self._warming = [self._executor.submit(_ping) for _ in range(self.size)]
+            self._counts['restarts'] += 1
+        broken.shutdown(wait=False, cancel_futures=True)
+
+    def _count(self, key: str):
+        with self._lock:
+            self._counts[key] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """풀 상태"""
+        with self._lock:
+            return dict(self._counts, size=self.size, started=self._executor is not None,
+                        max_bytes=self.max_bytes, max_chars=self.max_chars)
+
+    def close(self, wait: bool = True):
+        """워커 프로세스 종료"""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+
+def create_parse_pool(selectors: Dict[str, List[str]]) -> Optional[ParsePool]:
+    """PARSE_WORKERS=0 이면 None (요청 스레드에서 직접 추출)"""
+    pool = ParsePool(selectors)
+    return pool if pool.size > 0 else None
@@ -0,0 +1,131 @@
+import logging
+import time
+from concurrent.futures import Executor, FIRST_COMPLETED, wait
+from typing import Optional, Dict, Any, Callable, Iterable, List
+import metrics
+import profiling
+
+logger = logging.getLogger(__name__)
+
+
+class StageFailed(Exception):
+    """의존하는 스테이지가 실패해서 실행할 수 없는 경우"""
+
+    def __init__(self, stage: str, error: BaseException):
+        super().__init__(f"'{stage}' 스테이지 실패: {error}")
+        self.stage = stage
+        self.error = error
+
+
+class Stage:
+    """파이프라인 스테이지 하나
+
+    fn은 의존 스테이지들의 결과 딕셔너리를 받아 결과를 반환한다.
+    fallback이 있으면 fn이 예외를 던져도 fallback(예외) 값을 결과로 쓰고 계속 진행한다.
+    """
+
+    def __init__(self, name: str, fn: Callable[[Dict[str, Any]], Any], deps: Iterable[str] = (),
+                 fallback: Optional[Callable[[BaseException], Any]] = None):
+        self.name = name
+        self.fn = fn
+        self.deps = list(deps)
+        self.fallback = fallback
+
+
+class StageGraph:
+    """의존 관계가 없는 스테이지들을 동시에 실행하는 작은 스테이지 그래프"""
+
+    def __init__(self, executor: Executor):
+        self.executor = executor
+        self.stages: Dict[str, Stage] = {}
+        self._listeners: List[Callable[[str, str, Dict[str, Any]], None]] = []
+
+    def add(self, name: str, fn: Callable[[Dict[str, Any]], Any], deps: Iterable[str] = (),
+            fallback: Optional[Callable[[BaseException], Any]] = None) -> 'StageGraph':
+        """스테이지 추가 (의존 스테이지는 먼저 추가되어 있어야 함)"""
+        for dep in deps:
+            if dep not in self.stages:
+                raise ValueError(f"'{name}' 스테이지의 의존 스테이지 '{dep}'가 없습니다")
+        self.stages[name] = Stage(name, fn, deps, fallback)
+        return self
+
+    def on_stage_event(self, listener: Callable[[str, str, Dict[str, Any]], None]):
+        """스테이지 시작/완료 이벤트 수신자 등록 - listener(이벤트, 스테이지 이름, 결과)"""
+        self._listeners.append(listener)
+
+    def run(self) -> Dict[str, Any]:
+        """모든 스테이지 실행 후 {'results': ..., 'timings': ...} 반환
+
+        fallback이 없는 스테이지가 실패하면 남은 스테이지를 취소하고 StageFailed를 던진다.
+        """
+        started = time.perf_counter()
+        results: Dict[str, Any] = {}
+        timings: Dict[str, Dict[str, Any]] = {}
+        pending = dict(self.stages)
+        running = {}
+
+        def elapsed_ms() -> float:
+            return round((time.perf_counter() - started) * 1000, 1)
+
+        def execute(stage: Stage, inputs: Dict[str, Any]):
+            stage_started = elapsed_ms()
+            self._emit('start', stage.name, results)
+            try:
+                with profiling.span(f'stage:{stage.name}'):
+                    return stage.fn(inputs), 'ok', None, stage_started
+            except Exception as e:
+                if stage.fallback is None:
+                    return None, 'failed', e, stage_started
+                metrics.record_error(stage.name, e)
+                logger.warning("'%s' 스테이지 오류: %s", stage.name, e)
+                return stage.fallback(e), 'fallback', None, stage_started
+
+        try:
+            while pending or running:
+                # 의존 스테이지가 모두 끝난 스테이지 제출
+                for name, stage in list(pending.items()):
+                    if all(dep in results for dep in stage.deps):
+                        inputs = {dep: results[dep] for dep in stage.deps}
+                        running[self.executor.submit(profiling.bind(execute), stage, inputs)] = name
+                        del pending[name]
+
+                if not running:
+                    raise ValueError(f"실행할 수 없는 스테이지가 있습니다: {', '.join(pending)}")
+
+                done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    value, status, error, stage_started = future.result()
+                    finished = elapsed_ms()
+                    timings[name] = {
+                        'start_ms': stage_started,
+                        'duration_ms': round(finished - stage_started, 1),
+                        'status': status
+                    }
+                    metrics.PIPELINE_STAGE_SECONDS.observe(
+                        (finished - stage_started) / 1000, stage=name, status=status
+                    )
+                    if error is not None:
+                        metrics.record_error(name, error)
+                        raise StageFailed(name, error)
+                    results[name] = value
+                    self._emit('done', name, results)
+        except StageFailed:
+            for future in running:
+                future.cancel()
+            raise
+
+        return {
+            'results': results,
+            'timings': {
+                'total_ms': elapsed_ms(),
+                'stages': timings
+            }
+        }
+
+    def _emit(self, event: str, name: str, results: Dict[str, Any]):
+        for listener in self._listeners:
+            try:
+                listener(event, name, results)
+            except Exception as e:
+                logger.warning("스테이지 이벤트 처리 오류: %s", e)
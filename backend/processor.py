@@ -1,12 +1,146 @@
-import requests
 import json
-from typing import Optional, Dict, Any
+import logging
+from typing import Optional, Dict, Any, Callable, Iterator, Tuple, List
 import os
+import queue
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
+from http_client import get_http_client
+from cache import TTLCache, normalize_url, cache_db_path, text_cache_key
+from pipeline import StageGraph, StageFailed
+from singleflight import SingleFlight
+from tokens import TokenBudget, estimate_tokens, message_tokens, model_limits, truncate_to_tokens, chunk_text
+import metrics
+import profiling
+
+logger = logging.getLogger(__name__)
 
 # 환경변수 로드
 load_dotenv()
 
+# 프롬프트를 바꾸면 버전을 올려서 이전 프롬프트로 만든 캐시 항목이 쓰이지 않도록 한다
+TRANSLATION_PROMPT_VERSION = 1
+TRANSLATION_SYSTEM_PROMPT = '다음 영어 텍스트를 한국어로 번역해주세요. 중요한 점:\n1. 원문의 모든 내용을 빠뜨리지 말고 그대로 번역하세요\n2. 요약하지 말고 전체 내용을 번역하세요\n3. 자연스럽고 정확한 한국어로 번역하세요\n4. 문장 구조와 의미를 그대로 유지하세요'
+
+# 여러 텍스트를 <<<번호>>> 표시로 묶어서 한 번에 번역
+TRANSLATION_BATCH_SYSTEM_PROMPT = '다음은 <<<번호>>> 표시로 구분된 여러 개의 영어 텍스트입니다. 각 텍스트를 한국어로 번역해주세요. 중요한 점:\n1. 각 번역 앞에 원문과 같은 <<<번호>>> 표시를 그대로 붙이세요\n2. 텍스트를 합치거나 빠뜨리지 말고 번호마다 하나씩 번역하세요\n3. 번역문 외의 설명은 덧붙이지 마세요'
+BATCH_SEGMENT_RE = re.compile(r'<<<(\d+)>>>\s*(.*?)(?=\s*<<<\d+>>>|\s*\Z)', re.DOTALL)
+
+SUMMARY_PROMPT_VERSION = 1
+SUMMARY_SYSTEM_PROMPT = '다음 뉴스 기사를 {max_length}자 이내로 한국어로 요약해주세요. 핵심 내용만 간결하게 정리해주세요.'
+
+# 파이프라인 스테이지 표시 이름
+STAGE_LABELS = {
+    'scrape': '기사 스크래핑',
+    'translate_content': '본문 번역',
+    'translate_title': '제목 번역',
+    'summarize': '기사 요약'
+}
+STREAM_LABELS = {
+    'translated_title': '제목 번역',
+    'translated_content': '본문 번역',
+    'summary': '기사 요약'
+}
+
+# 번역/요약 대신 들어가는 시뮬레이션/실패 표시 (이런 결과는 캐시하지 않음)
+PLACEHOLDER_RE = re.compile(r'\[(?:번역 시뮬레이션|요약 시뮬레이션|번역 실패|요약 실패|청크 \d+ 번역 실패)\]')
+
+
+def openai_chat_url() -> str:
+    """chat completions 엔드포인트 (OPENAI_BASE_URL로 로컬 테스트 서버 지정 가능)"""
+    base_url = os.getenv('OPENAI_BASE_URL', 'https://api.openai.com/v1').rstrip('/')
+    return f'{base_url}/chat/completions'
+
+
+def openai_headers(api_key: str) -> Dict[str, str]:
+    return {
+        'Authorization': f'Bearer {api_key}',
+        'Content-Type': 'application/json'
+    }
+
+
+def stream_chat_completion(http, url: str, api_key: str, payload: Dict[str, Any],
+                           read_timeout: float = 60, operation: str = 'llm') -> Iterator[str]:
+    """chat completions 스트리밍(stream=True) 응답의 텍스트 조각을 도착하는 대로 반환"""
+    started = time.perf_counter()
+    status = 'error'
+    usage = None
+    parts = []
+    response = http.post(
+        url, headers=openai_headers(api_key), json=dict(payload, stream=True),
+        read_timeout=read_timeout, stream=True
+    )
+    try:
+        if response.status_code != 200:
+            status = str(response.status_code)
+            raise RuntimeError(f'스트리밍 API 오류: {response.status_code} {response.text[:200]}')
+        
+        # Server-Sent Events: "data: {...}" 줄 단위, 마지막은 "data: [DONE]"
+        for raw_line in response.iter_lines():
+            line = raw_line.decode('utf-8').strip()
+            if not line.startswith('data:'):
+                continue
+            data = line[len('data:'):].strip()
+            if data == '[DONE]':
+                break
+            event = json.loads(data)
+            usage = event.get('usage') or usage
+            choices = event.get('choices') or []
+            if choices:
+                delta = (choices[0].get('delta') or {}).get('content')
+                if delta:
+                    parts.append(delta)
+                    yield delta
+        status = '200'
+    finally:
+        response.close()
+        record_llm_request(operation, status, started, payload, usage, ''.join(parts))
+
+
+def failed_stages(result: Dict[str, Any]) -> List[str]:
+    """처리 결과에서 실제 번역/요약 대신 시뮬레이션/실패 표시가 들어간 단계 이름 목록"""
+    outputs = {
+        'translate_title': result['translated']['title'],
+        'translate_content': result['translated']['content'],
+        'summarize': result['summarized']['content']
+    }
+    return [stage for stage, value in outputs.items()
+            if isinstance(value, str) and PLACEHOLDER_RE.search(value)]
+
+
+def record_llm_request(operation: str, status: str, started: float, payload: Dict[str, Any],
+                       usage: Optional[Dict[str, Any]] = None, output: str = ''):
+    """LLM 요청 지표 기록 (소요 시간, 상태, 토큰 - usage가 없으면 추정치)"""
+    metrics.observe(operation, time.perf_counter() - started)
+    metrics.LLM_REQUESTS.inc(operation=operation, status=status)
+    if status != '200':
+        return
+    usage = usage or {}
+    metrics.record_tokens(
+        operation,
+        usage.get('prompt_tokens') or message_tokens(*(m['content'] for m in payload['messages'])),
+        usage.get('completion_tokens') or estimate_tokens(output)
+    )
+
+
+class LLMRequestError(Exception):
+    """LLM API 요청 자체가 실패함 (HTTP 오류, 연결/타임아웃) - 같은 요청을 나눠 보내도 소용없음"""
+
+
+def create_memo_cache(namespace: str) -> TTLCache:
+    """번역/요약 결과 메모 캐시"""
+    persist = os.getenv('MEMO_CACHE_PERSIST', 'true').lower() == 'true'
+    return TTLCache(
+        namespace=namespace,
+        ttl=float(os.getenv('MEMO_CACHE_TTL', str(7 * 24 * 3600))),
+        max_entries=int(os.getenv('MEMO_CACHE_SIZE', '2048')),
+        db_path=cache_db_path() if persist else None
+    )
+
+
 class TranslationService:
     def __init__(self):
         # 환경변수 다시 로드
@@ -22,37 +156,216 @@ class TranslationService:
         
         # OpenAI API 키 (GPT 번역용)
         self.openai_api_key = os.getenv('OPENAI_API_KEY')
-        self.openai_url = 'https://api.openai.com/v1/chat/completions'
+        self.openai_url = openai_chat_url()
+        self.openai_model = os.getenv('OPENAI_MODEL', 'gpt-3.5-turbo')
+        
+        # 공유 HTTP 클라이언트 (호스트별 커넥션 재사용)
+        self.http = get_http_client()
+        
+        # 같은 텍스트는 다시 번역하지 않도록 결과를 메모
+        self.memo = create_memo_cache('translations')
+        # 같은 텍스트 번역이 동시에 들어오면 API 호출은 한 번만
+        self.inflight = SingleFlight('translations')
+        
+        # 모델 컨텍스트/출력 한도에 맞춘 청크 크기와 max_tokens (영어 → 한국어는 출력 토큰이 더 많음)
+        self.budget = TokenBudget(
+            self.openai_model, TRANSLATION_SYSTEM_PROMPT,
+            output_ratio=float(os.getenv('TRANSLATION_OUTPUT_RATIO', '2.0'))
+        )
+        
+        # 묶음 번역 요청 하나에 넣을 최대 텍스트 수
+        self.batch_size = int(os.getenv('TRANSLATION_BATCH_SIZE', '40'))
         
-        print(f"TranslationService 초기화 - OpenAI API 키: {'설정됨' if self.openai_api_key else '미설정'}")
+        # 긴 텍스트의 청크를 동시에 번역할 워커 수
+        self.chunk_workers = int(os.getenv('TRANSLATION_WORKERS', '4'))
+        self._chunk_executor = ThreadPoolExecutor(
+            max_workers=self.chunk_workers, thread_name_prefix='translate-chunk'
+        )
+        
+        logger.info("TranslationService 초기화 - OpenAI API 키: %s", '설정됨' if self.openai_api_key else '미설정')
 
     def translate_text(self, text: str, target_lang: str = 'ko', source_lang: str = 'auto') -> Optional[str]:
         """텍스트 번역 (GPT 사용)"""
         if not text or len(text.strip()) < 10:
             return None
             
-        # 텍스트가 너무 길면 청크 단위로 나누어 번역
-        if len(text) > 6000:
+        # 요청 하나의 토큰 예산을 넘으면 청크 단위로 나누어 번역
+        if not self.budget.fits(text):
             return self._translate_long_text(text, target_lang)
         
-        print(f"번역 시도: {len(text)}자 텍스트")
+        logger.debug("번역 시도: %s자 텍스트", len(text))
         
         # GPT로 번역
         if self.openai_api_key:
             try:
                 result = self._translate_with_gpt(text, target_lang)
                 if result:
-                    print("GPT 번역 성공")
+                    logger.debug("GPT 번역 성공")
                     return result
                 else:
-                    print("GPT 번역 결과가 비어있음")
+                    logger.warning("GPT 번역 결과가 비어있음")
             except Exception as e:
-                print(f"GPT 번역 실패: {e}")
+                logger.warning("GPT 번역 실패: %s", e)
         
         # API 키가 없으면 간단한 번역 시뮬레이션
-        print("GPT 번역 실패, 시뮬레이션 사용")
+        logger.warning("GPT 번역 실패, 시뮬레이션 사용")
         return self._simulate_translation(text)
 
+    def translate_batch(self, texts: List[str], target_lang: str = 'ko') -> List[Optional[str]]:
+        """여러 텍스트를 번역 요청 몇 번으로 묶어서 번역 (입력 순서대로 결과, 실패한 항목은 None)
+
+        제목/설명처럼 짧은 텍스트도 번역하며, 같은 텍스트는 한 번만 번역한다.
+        """
+        results: List[Optional[str]] = [None] * len(texts)
+        positions: Dict[str, List[int]] = {}
+        for i, text in enumerate(texts):
+            if isinstance(text, str) and text.strip():
+                positions.setdefault(text.strip(), []).append(i)
+            elif isinstance(text, str):
+                results[i] = text
+        
+        def assign(text: str, translated: Optional[str]):
+            for i in positions[text]:
+                results[i] = translated
+        
+        if not self.openai_api_key:
+            for text in positions:
+                assign(text, self._simulate_translation(text))
+            return results
+        
+        # 메모된 번역은 그대로 사용
+        misses = []
+        for text in positions:
+            cached = self.memo.get(self._memo_key(text, target_lang))
+            if cached is not None:
+                assign(text, cached[0])
+            else:
+                misses.append(text)
+        
+        # 요청 하나의 토큰 예산을 넘는 텍스트는 따로 (청크 번역)
+        oversized = [text for text in misses if not self.budget.fits(text)]
+        groups = self._pack_batch([text for text in misses if self.budget.fits(text)])
+        logger.debug("묶음 번역: %s개 중 %s개 번역 필요, 요청 %s번", len(texts), len(misses), len(groups) + len(oversized))
+        
+        futures = [self._chunk_executor.submit(profiling.bind(self._translate_group), group, target_lang) for group in groups]
+        for text in oversized:
+            assign(text, self.translate_text(text, target_lang))
+        for group, future in zip(groups, futures):
+            for text, translated in zip(group, future.result()):
+                assign(text, translated)
+        return results
+
+    def _pack_batch(self, texts: List[str]) -> List[List[str]]:
+        """텍스트들을 토큰 예산과 batch_size 안에서 요청 단위로 묶음"""
+        limit = self.budget.max_input_tokens
+        groups: List[List[str]] = []
+        current: List[str] = []
+        current_tokens = 0
+        for text in texts:
+            # <<<번호>>> 표시와 줄바꿈 몫
+            tokens = estimate_tokens(text) + 8
+            if current and (current_tokens + tokens > limit or len(current) >= self.batch_size):
+                groups.append(current)
+                current, current_tokens = [], 0
+            current.append(text)
+            current_tokens += tokens
+        if current:
+            groups.append(current)
+        return groups
+
+    def _translate_group(self, group: List[str], target_lang: str) -> List[Optional[str]]:
+        """묶음 하나 번역 - 결과 개수가 맞지 않거나 출력이 잘리면 반으로 나눠서 다시 시도"""
+        if len(group) == 1:
+            try:
+                return [self._translate_with_gpt(group[0], target_lang)]
+            except Exception as e:
+                logger.warning("번역 오류: %s", e)
+                return [None]
+        
+        packed = '\n\n'.join(f'<<<{i + 1}>>>\n{text}' for i, text in enumerate(group))
+        try:
+            output = self._request_gpt_translation(packed, target_lang, TRANSLATION_BATCH_SYSTEM_PROMPT,
+                                                   raise_errors=True)
+        except LLMRequestError as e:
+            # API 오류/장애는 나눠서 다시 보내면 요청만 늘어나므로 묶음 전체를 실패로 처리
+            logger.warning("묶음 번역 요청 실패 (%s개): %s", len(group), e)
+            return [None] * len(group)
+        translations = self._parse_batch(output, len(group)) if output else None
+        
+        if translations is None:
+            logger.warning("묶음 번역 결과가 %s개와 맞지 않음, 나눠서 재시도", len(group))
+            middle = len(group) // 2
+            return (self._translate_group(group[:middle], target_lang)
+                    + self._translate_group(group[middle:], target_lang))
+        
+        for text, translated in zip(group, translations):
+            self.memo.set(self._memo_key(text, target_lang), translated)
+        return translations
+
+    def _parse_batch(self, output: str, count: int) -> Optional[List[str]]:
+        """<<<번호>>> 표시로 번역 결과 분리 (번호가 1..count 모두 한 번씩 있어야 함)"""
+        translations: Dict[int, str] = {}
+        for number, body in BATCH_SEGMENT_RE.findall(output):
+            index = int(number)
+            if index in translations or not 1 <= index <= count or not body.strip():
+                return None
+            translations[index] = body.strip()
+        if len(translations) != count:
+            return None
+        return [translations[i + 1] for i in range(count)]
+
+    def stream_translation(self, text: str, target_lang: str = 'ko') -> Iterator[str]:
+        """번역 결과를 도착하는 대로 조각 단위로 반환
+
+        짧은 텍스트는 GPT 스트리밍으로 토큰을 그대로 내보내고,
+        긴 텍스트는 청크를 동시에 번역하면서 원래 순서대로 내보낸다.
+        """
+        if not text or len(text.strip()) < 10:
+            return
+        
+        if not self.budget.fits(text):
+            chunks = self._split_into_chunks(text)
+            for i, future in enumerate(self._submit_chunks(chunks, target_lang)):
+                yield (" " if i else "") + future.result()
+            return
+        
+        if not self.openai_api_key:
+            yield self._simulate_translation(text)
+            return
+        
+        memo_key = self._memo_key(text, target_lang)
+        cached = self.memo.get(memo_key)
+        if cached is not None:
+            yield cached[0]
+            return
+        
+        parts = []
+        try:
+            payload = self._gpt_translation_payload(text)
+            for delta in stream_chat_completion(self.http, self.openai_url, self.openai_api_key, payload,
+                                                operation='translate'):
+                parts.append(delta)
+                yield delta
+        except Exception as e:
+            metrics.record_error('translate', e)
+            logger.warning("GPT 스트리밍 번역 오류: %s", e)
+            if parts:
+                yield " [번역 실패]"
+            else:
+                # 아직 아무것도 보내지 않았으면 일반 번역으로 대체
+                translated = self.translate_text(text, target_lang)
+                if translated:
+                    yield translated
+            return
+        
+        result = ''.join(parts).strip()
+        if result:
+            self.memo.set(memo_key, result)
+
+    def _memo_key(self, text: str, target_lang: str) -> str:
+        """번역 메모 캐시 키 (텍스트 해시 + 언어 + 모델 + 프롬프트 버전)"""
+        return text_cache_key(text, target_lang, self.openai_model, TRANSLATION_PROMPT_VERSION)
+
     def _translate_with_deepl(self, text: str, target_lang: str, source_lang: str) -> Optional[str]:
         """DeepL API 사용"""
         try:
@@ -67,17 +380,17 @@ class TranslationService:
                 'source_lang': source_lang.upper() if source_lang != 'auto' else None
             }
             
-            response = requests.post(self.deepl_url, headers=headers, data=data, timeout=30)
+            response = self.http.post(self.deepl_url, headers=headers, data=data, read_timeout=30)
             
             if response.status_code == 200:
                 result = response.json()
                 return result['translations'][0]['text']
             else:
-                print(f"DeepL API 오류: {response.status_code}")
+                logger.warning("DeepL API 오류: %s", response.status_code)
                 return None
                 
         except Exception as e:
-            print(f"DeepL 번역 오류: {e}")
+            logger.warning("DeepL 번역 오류: %s", e)
             return None
 
     def _translate_with_google(self, text: str, target_lang: str, source_lang: str) -> Optional[str]:
@@ -90,59 +403,98 @@ class TranslationService:
                 'source': source_lang if source_lang != 'auto' else None
             }
             
-            response = requests.post(self.google_translate_url, params=params, timeout=30)
+            response = self.http.post(self.google_translate_url, params=params, read_timeout=30)
             
             if response.status_code == 200:
                 result = response.json()
                 return result['data']['translations'][0]['translatedText']
             else:
-                print(f"Google Translate API 오류: {response.status_code}")
+                logger.warning("Google Translate API 오류: %s", response.status_code)
                 return None
                 
         except Exception as e:
-            print(f"Google 번역 오류: {e}")
+            logger.warning("Google 번역 오류: %s", e)
             return None
 
     def _translate_with_gpt(self, text: str, target_lang: str) -> Optional[str]:
-        """GPT로 번역"""
+        """GPT로 번역 (같은 텍스트/언어/모델/프롬프트 버전이면 메모된 결과 사용)"""
+        memo_key = self._memo_key(text, target_lang)
+        cached = self.memo.get(memo_key)
+        if cached is not None:
+            logger.debug("번역 메모 캐시 적중")
+            return cached[0]
+        
+        def request():
+            result = self._request_gpt_translation(text, target_lang)
+            if result:
+                self.memo.set(memo_key, result)
+            return result
+        
+        result, shared = self.inflight.do(memo_key, request)
+        if shared:
+            logger.debug("진행 중인 같은 번역 요청의 결과 사용")
+        return result
+
+    def _gpt_translation_payload(self, text: str, system_prompt: str = TRANSLATION_SYSTEM_PROMPT) -> Dict[str, Any]:
+        """GPT 번역 요청 본문 (max_tokens는 입력 길이에 맞춰 계산)"""
+        return {
+            'model': self.openai_model,
+            'messages': [
+                {
+                    'role': 'system',
+                    'content': system_prompt
+                },
+                {
+                    'role': 'user',
+                    'content': text
+                }
+            ],
+            'max_tokens': self.budget.max_tokens_for(text),
+            'temperature': 0.1
+        }
+
+    def _request_gpt_translation(self, text: str, target_lang: str,
+                                 system_prompt: str = TRANSLATION_SYSTEM_PROMPT,
+                                 raise_errors: bool = False) -> Optional[str]:
+        """GPT 번역 API 호출 (출력이 잘리면 None, raise_errors=True 이면 요청 실패는 LLMRequestError)"""
+        started = time.perf_counter()
+        data = self._gpt_translation_payload(text, system_prompt)
         try:
-            print(f"GPT 번역 API 호출 - API 키 길이: {len(self.openai_api_key) if self.openai_api_key else 'None'}")
+            logger.debug("GPT 번역 API 호출: 입력 약 %d토큰", estimate_tokens(text))
             
-            headers = {
-                'Authorization': f'Bearer {self.openai_api_key}',
-                'Content-Type': 'application/json'
-            }
+            headers = openai_headers(self.openai_api_key)
+            with profiling.span('llm:translate'):
+                response = self.http.post(self.openai_url, headers=headers, json=data, read_timeout=60)
             
-            data = {
-                'model': 'gpt-3.5-turbo',
-                'messages': [
-                    {
-                        'role': 'system',
-                        'content': '다음 영어 텍스트를 한국어로 번역해주세요. 중요한 점:\n1. 원문의 모든 내용을 빠뜨리지 말고 그대로 번역하세요\n2. 요약하지 말고 전체 내용을 번역하세요\n3. 자연스럽고 정확한 한국어로 번역하세요\n4. 문장 구조와 의미를 그대로 유지하세요'
-                    },
-                    {
-                        'role': 'user',
-                        'content': text
-                    }
-                ],
-                'max_tokens': 4000,
-                'temperature': 0.1
-            }
-            
-            response = requests.post(self.openai_url, headers=headers, json=data, timeout=60)
-            
-            print(f"GPT 번역 응답 상태: {response.status_code}")
+            logger.debug("GPT 번역 응답 상태: %s", response.status_code)
             
             if response.status_code == 200:
-                result = response.json()
-                return result['choices'][0]['message']['content'].strip()
+                body = response.json()
+                choice = body['choices'][0]
+                output = choice['message']['content'].strip()
+                record_llm_request('translate', '200', started, data, body.get('usage'), output)
+                if choice.get('finish_reason') == 'length':
+                    # 출력이 잘린 번역은 쓰지 않음 (청크를 나눠서 다시 시도)
+                    logger.warning("GPT 번역 출력이 max_tokens에서 잘림: 입력 약 %d토큰", estimate_tokens(text))
+                    metrics.record_error('translate', 'truncated')
+                    return None
+                return output
             else:
-                print(f"GPT 번역 API 오류: {response.status_code}")
-                print(f"오류 응답: {response.text[:200]}")
+                record_llm_request('translate', str(response.status_code), started, data)
+                metrics.record_error('translate', f'HTTP {response.status_code}')
+                logger.warning("GPT 번역 API 오류: %s %s", response.status_code, response.text[:200])
+                if raise_errors:
+                    raise LLMRequestError(f'HTTP {response.status_code}')
                 return None
                 
+        except LLMRequestError:
+            raise
         except Exception as e:
-            print(f"GPT 번역 오류: {e}")
+            record_llm_request('translate', 'error', started, data)
+            metrics.record_error('translate', e)
+            logger.warning("GPT 번역 오류: %s", e)
+            if raise_errors:
+                raise LLMRequestError(str(e)) from e
             return None
 
     def _simulate_translation(self, text: str) -> str:
@@ -154,47 +506,54 @@ class TranslationService:
             return f"[번역 시뮬레이션] {first_sentence}... (번역 API 키가 필요합니다. 원문을 확인해주세요.)"
         return f"[번역 시뮬레이션] {text[:100]}... (번역 API 키가 필요합니다. 원문을 확인해주세요.)"
 
+    def _translate_chunk(self, chunk: str, target_lang: str, index: int, total: int) -> str:
+        """청크 하나 번역 (실패 시 실패 표시 문자열 반환)"""
+        logger.debug("청크 %s/%s 번역 중...", index+1, total)
+        try:
+            translated_chunk = self._translate_with_gpt(chunk, target_lang)
+            if translated_chunk:
+                return translated_chunk
+            
+            # 출력이 잘렸을 수 있으므로 절반 크기로 나눠서 한 번 더 시도
+            chunk_tokens = estimate_tokens(chunk)
+            if chunk_tokens > 200:
+                halves = chunk_text(chunk, chunk_tokens // 2 + 1)
+                translated_halves = [self._translate_with_gpt(half, target_lang) for half in halves]
+                if all(translated_halves):
+                    return " ".join(translated_halves)
+            return f"[청크 {index+1} 번역 실패]"
+        except Exception as e:
+            logger.warning("청크 %s 번역 오류: %s", index+1, e)
+            return f"[청크 {index+1} 번역 실패]"
+
     def _translate_long_text(self, text: str, target_lang: str) -> str:
         """긴 텍스트를 청크 단위로 나누어 번역"""
-        print(f"긴 텍스트 번역 시작: {len(text)}자")
-        
-        # 문장 단위로 나누기
-        sentences = text.split('. ')
-        chunks = []
-        current_chunk = ""
-        
-        for sentence in sentences:
-            if len(current_chunk + sentence) > 5000:
-                if current_chunk:
-                    chunks.append(current_chunk.strip())
-                current_chunk = sentence
-            else:
-                current_chunk += sentence + ". "
+        logger.debug("긴 텍스트 번역 시작: %s자", len(text))
         
-        if current_chunk:
-            chunks.append(current_chunk.strip())
+        chunks = self._split_into_chunks(text)
         
-        print(f"텍스트를 {len(chunks)}개 청크로 분할")
-        
-        # 각 청크를 번역
-        translated_chunks = []
-        for i, chunk in enumerate(chunks):
-            print(f"청크 {i+1}/{len(chunks)} 번역 중...")
-            try:
-                translated_chunk = self._translate_with_gpt(chunk, target_lang)
-                if translated_chunk:
-                    translated_chunks.append(translated_chunk)
-                else:
-                    translated_chunks.append(f"[청크 {i+1} 번역 실패]")
-            except Exception as e:
-                print(f"청크 {i+1} 번역 오류: {e}")
-                translated_chunks.append(f"[청크 {i+1} 번역 실패]")
+        # 청크들을 동시에 번역 (결과는 원래 순서대로 모음)
+        futures = self._submit_chunks(chunks, target_lang)
+        translated_chunks = [future.result() for future in futures]
         
         # 번역된 청크들을 합치기
         result = " ".join(translated_chunks)
-        print(f"긴 텍스트 번역 완료: {len(result)}자")
+        logger.debug("긴 텍스트 번역 완료: %s자", len(result))
         return result
 
+    def _submit_chunks(self, chunks, target_lang: str):
+        """청크들을 번역 스레드 풀에 제출 (청크 순서대로 Future 반환)"""
+        return [
+            self._chunk_executor.submit(profiling.bind(self._translate_chunk), chunk, target_lang, i, len(chunks))
+            for i, chunk in enumerate(chunks)
+        ]
+
+    def _split_into_chunks(self, text: str):
+        """긴 텍스트를 문단/문장 경계에서 요청당 토큰 예산만큼 채운 청크로 분할"""
+        chunks = self.budget.chunk(text)
+        logger.debug("텍스트를 %s개 청크로 분할 (청크당 최대 약 %s토큰)", len(chunks), self.budget.max_input_tokens)
+        return chunks
+
 class SummarizationService:
     def __init__(self):
         # 환경변수 다시 로드
@@ -202,81 +561,177 @@ class SummarizationService:
         
         # OpenAI API 키
         self.openai_api_key = os.getenv('OPENAI_API_KEY')
-        self.openai_url = 'https://api.openai.com/v1/chat/completions'
+        self.openai_url = openai_chat_url()
+        self.openai_model = os.getenv('OPENAI_MODEL', 'gpt-3.5-turbo')
         
         # Claude API 키 (대안)
         self.claude_api_key = os.getenv('CLAUDE_API_KEY')
         self.claude_url = 'https://api.anthropic.com/v1/messages'
         
-        print(f"SummarizationService 초기화 - OpenAI API 키: {'설정됨' if self.openai_api_key else '미설정'}")
+        # 공유 HTTP 클라이언트 (호스트별 커넥션 재사용)
+        self.http = get_http_client()
+        
+        # 같은 텍스트는 다시 요약하지 않도록 결과를 메모
+        self.memo = create_memo_cache('summaries')
+        # 같은 텍스트 요약이 동시에 들어오면 API 호출은 한 번만
+        self.inflight = SingleFlight('summaries')
+        
+        # 요약 입력 토큰 상한 (모델 컨텍스트와 이 값 중 작은 쪽, 넘으면 문장 경계에서 자름)
+        self.context_tokens, self.max_output_tokens = model_limits(self.openai_model)
+        self.max_input_tokens = int(os.getenv('SUMMARY_MAX_INPUT_TOKENS', '6000'))
+        
+        logger.info("SummarizationService 초기화 - OpenAI API 키: %s", '설정됨' if self.openai_api_key else '미설정')
 
     def summarize_text(self, text: str, max_length: int = 300) -> Optional[str]:
         """텍스트 요약 (GPT 사용)"""
         if not text or len(text.strip()) < 50:
             return None
             
-        # 텍스트가 너무 길면 잘라서 요약
-        if len(text) > 4000:
-            text = text[:4000] + "..."
+        # 텍스트가 너무 길면 토큰 예산에 맞춰 문장 경계에서 잘라서 요약
+        text = self._fit_input(text, max_length)
         
-        print(f"요약 시도: {len(text)}자 텍스트")
+        logger.debug("요약 시도: %s자 텍스트", len(text))
         
         # GPT로 요약
         if self.openai_api_key:
             try:
                 result = self._summarize_with_openai(text, max_length)
                 if result:
-                    print("GPT 요약 성공")
+                    logger.debug("GPT 요약 성공")
                     return result
                 else:
-                    print("GPT 요약 결과가 비어있음")
+                    logger.warning("GPT 요약 결과가 비어있음")
             except Exception as e:
-                print(f"GPT 요약 실패: {e}")
+                logger.warning("GPT 요약 실패: %s", e)
         
         # API 키가 없으면 간단한 요약 시뮬레이션
-        print("GPT 요약 실패, 시뮬레이션 사용")
+        logger.warning("GPT 요약 실패, 시뮬레이션 사용")
         return self._simulate_summarization(text)
 
+    def stream_summary(self, text: str, max_length: int = 300) -> Iterator[str]:
+        """요약 결과를 GPT 스트리밍으로 토큰이 도착하는 대로 반환"""
+        if not text or len(text.strip()) < 50:
+            return
+        
+        original_text = text
+        # 텍스트가 너무 길면 토큰 예산에 맞춰 문장 경계에서 잘라서 요약
+        text = self._fit_input(text, max_length)
+        
+        if not self.openai_api_key:
+            yield self._simulate_summarization(text)
+            return
+        
+        memo_key = self._memo_key(text, max_length)
+        cached = self.memo.get(memo_key)
+        if cached is not None:
+            yield cached[0]
+            return
+        
+        parts = []
+        try:
+            payload = self._openai_summary_payload(text, max_length)
+            for delta in stream_chat_completion(self.http, self.openai_url, self.openai_api_key, payload,
+                                                operation='summarize'):
+                parts.append(delta)
+                yield delta
+        except Exception as e:
+            metrics.record_error('summarize', e)
+            logger.warning("GPT 스트리밍 요약 오류: %s", e)
+            if parts:
+                yield " [요약 실패]"
+            else:
+                # 아직 아무것도 보내지 않았으면 일반 요약으로 대체
+                summarized = self.summarize_text(original_text, max_length)
+                if summarized:
+                    yield summarized
+            return
+        
+        result = ''.join(parts).strip()
+        if result:
+            self.memo.set(memo_key, result)
+
+    def _summary_max_tokens(self, max_length: int) -> int:
+        """max_length자 한국어 요약에 필요한 출력 토큰 (한글은 대략 1자당 1토큰)"""
+        return min(self.max_output_tokens, int(max_length * 1.3) + 32)
+
+    def _fit_input(self, text: str, max_length: int) -> str:
+        """입력 토큰 예산을 넘으면 문장 경계에서 앞부분만 남김"""
+        prompt_tokens = message_tokens(SUMMARY_SYSTEM_PROMPT.format(max_length=max_length), '')
+        available = self.context_tokens - prompt_tokens - self._summary_max_tokens(max_length)
+        # 추정 오차를 감안해 컨텍스트 여유분의 80%까지만 사용
+        limit = min(self.max_input_tokens, int(available * 0.8))
+        truncated = truncate_to_tokens(text, limit)
+        return truncated if truncated == text else truncated + "..."
+
+    def _memo_key(self, text: str, max_length: int) -> str:
+        """요약 메모 캐시 키 (텍스트 해시 + 길이 + 모델 + 프롬프트 버전)"""
+        return text_cache_key(text, max_length, self.openai_model, SUMMARY_PROMPT_VERSION)
+
     def _summarize_with_openai(self, text: str, max_length: int) -> Optional[str]:
-        """OpenAI API 사용"""
+        """OpenAI API 사용 (같은 텍스트/길이/모델/프롬프트 버전이면 메모된 결과 사용)"""
+        memo_key = self._memo_key(text, max_length)
+        cached = self.memo.get(memo_key)
+        if cached is not None:
+            logger.debug("요약 메모 캐시 적중")
+            return cached[0]
+        
+        def request():
+            result = self._request_openai_summary(text, max_length)
+            if result:
+                self.memo.set(memo_key, result)
+            return result
+        
+        result, shared = self.inflight.do(memo_key, request)
+        if shared:
+            logger.debug("진행 중인 같은 요약 요청의 결과 사용")
+        return result
+
+    def _openai_summary_payload(self, text: str, max_length: int) -> Dict[str, Any]:
+        """OpenAI 요약 요청 본문"""
+        return {
+            'model': self.openai_model,
+            'messages': [
+                {
+                    'role': 'system',
+                    'content': SUMMARY_SYSTEM_PROMPT.format(max_length=max_length)
+                },
+                {
+                    'role': 'user',
+                    'content': text
+                }
+            ],
+            'max_tokens': self._summary_max_tokens(max_length),
+            'temperature': 0.3
+        }
+
+    def _request_openai_summary(self, text: str, max_length: int) -> Optional[str]:
+        """OpenAI 요약 API 호출"""
+        started = time.perf_counter()
+        data = self._openai_summary_payload(text, max_length)
         try:
-            print(f"GPT 요약 API 호출 - API 키 길이: {len(self.openai_api_key) if self.openai_api_key else 'None'}")
-            
-            headers = {
-                'Authorization': f'Bearer {self.openai_api_key}',
-                'Content-Type': 'application/json'
-            }
-            
-            data = {
-                'model': 'gpt-3.5-turbo',
-                'messages': [
-                    {
-                        'role': 'system',
-                        'content': f'다음 뉴스 기사를 {max_length}자 이내로 한국어로 요약해주세요. 핵심 내용만 간결하게 정리해주세요.'
-                    },
-                    {
-                        'role': 'user',
-                        'content': text
-                    }
-                ],
-                'max_tokens': max_length,
-                'temperature': 0.3
-            }
+            logger.debug("GPT 요약 API 호출: 입력 약 %d토큰", estimate_tokens(text))
             
-            response = requests.post(self.openai_url, headers=headers, json=data, timeout=60)
+            headers = openai_headers(self.openai_api_key)
+            with profiling.span('llm:summarize'):
+                response = self.http.post(self.openai_url, headers=headers, json=data, read_timeout=60)
             
-            print(f"GPT 요약 응답 상태: {response.status_code}")
+            logger.debug("GPT 요약 응답 상태: %s", response.status_code)
             
             if response.status_code == 200:
                 result = response.json()
-                return result['choices'][0]['message']['content'].strip()
+                output = result['choices'][0]['message']['content'].strip()
+                record_llm_request('summarize', '200', started, data, result.get('usage'), output)
+                return output
             else:
-                print(f"OpenAI API 오류: {response.status_code}")
-                print(f"오류 응답: {response.text[:200]}")
+                record_llm_request('summarize', str(response.status_code), started, data)
+                metrics.record_error('summarize', f'HTTP {response.status_code}')
+                logger.warning("OpenAI API 오류: %s %s", response.status_code, response.text[:200])
                 return None
                 
         except Exception as e:
-            print(f"OpenAI 요약 오류: {e}")
+            record_llm_request('summarize', 'error', started, data)
+            metrics.record_error('summarize', e)
+            logger.warning("OpenAI 요약 오류: %s", e)
             return None
 
     def _summarize_with_claude(self, text: str, max_length: int) -> Optional[str]:
@@ -299,17 +754,17 @@ class SummarizationService:
                 ]
             }
             
-            response = requests.post(self.claude_url, headers=headers, json=data, timeout=30)
+            response = self.http.post(self.claude_url, headers=headers, json=data, read_timeout=30)
             
             if response.status_code == 200:
                 result = response.json()
                 return result['content'][0]['text'].strip()
             else:
-                print(f"Claude API 오류: {response.status_code}")
+                logger.warning("Claude API 오류: %s", response.status_code)
                 return None
                 
         except Exception as e:
-            print(f"Claude 요약 오류: {e}")
+            logger.warning("Claude 요약 오류: %s", e)
             return None
 
     def _simulate_summarization(self, text: str) -> str:
@@ -321,90 +776,388 @@ class SummarizationService:
             return f"[요약 시뮬레이션] {first_sentence}... (요약 API 키가 필요합니다. 원문을 확인해주세요.)"
         return f"[요약 시뮬레이션] {text[:100]}... (요약 API 키가 필요합니다. 원문을 확인해주세요.)"
 
+class ScrapeError(Exception):
+    """스크래핑 실패 (스크래핑 결과 딕셔너리를 그대로 보관)"""
+
+    def __init__(self, result: Dict[str, Any]):
+        super().__init__(result.get('error'))
+        self.result = result
+
 # 통합 서비스 클래스
 class NewsProcessingService:
     def __init__(self):
+        from browser_pool import BrowserPool
+        from parse_pool import create_parse_pool
+        from scraper import NewsScraper
+
         self.translator = TranslationService()
         self.summarizer = SummarizationService()
+        
+        # 스크래핑과 LLM 호출이 함께 쓰는 HTTP 클라이언트
+        self.http = get_http_client()
+        
+        # 처리 결과 캐시 (같은 기사를 여러 독자가 열어도 파이프라인은 한 번만 실행)
+        self.result_cache = TTLCache(
+            namespace='article_results',
+            ttl=float(os.getenv('RESULT_CACHE_TTL', '3600')),
+            max_entries=int(os.getenv('RESULT_CACHE_SIZE', '256')),
+            db_path=cache_db_path()
+        )
+        
+        # 파이프라인 스테이지 실행용 스레드 풀
+        self._stage_executor = ThreadPoolExecutor(
+            max_workers=int(os.getenv('PIPELINE_WORKERS', '16')), thread_name_prefix='pipeline-stage'
+        )
+        # original: 원문 요약을 번역과 동시에 실행 / translation: 번역문을 요약 (번역 완료 후)
+        self.summary_source = os.getenv('SUMMARY_SOURCE', 'original')
+        
+        # 같은 기사(정규화 URL)에 대한 동시 요청은 파이프라인을 한 번만 실행
+        self.inflight = SingleFlight('articles')
+        
+        # 서비스가 소유하는 상시 실행 브라우저 풀
+        self.browser_pool = BrowserPool()
+        self.scraper = NewsScraper(browser_pool=self.browser_pool, http_client=self.http)
+        
+        # 정적 추출용 프로세스 풀 (PARSE_WORKERS=0 이면 요청 스레드에서 추출)
+        # 첫 요청이 워커 시작을 기다리지 않도록 지금 띄워 둔다
+        self.parse_pool = create_parse_pool(self.scraper.selector_groups())
+        if self.parse_pool:
+            self.parse_pool.start()
+            self.scraper.parse_pool = self.parse_pool
+        
+        # SCRAPER_ENGINE=async 이면 asyncio 엔진으로 여러 페이지를 동시에 렌더링
+        self.async_engine = None
+        if os.getenv('SCRAPER_ENGINE', 'pool') == 'async':
+            from async_scraper import AsyncScrapeEngine
+            self.async_engine = AsyncScrapeEngine(scraper=self.scraper)
 
-    def process_article(self, url: str) -> Dict[str, Any]:
-        """기사 전체 처리 (스크래핑 + 번역 + 요약)"""
+    def warm_up(self):
+        """무거운 리소스를 미리 준비 (파싱 풀, 브라우저 예열)"""
+        if self.parse_pool:
+            try:
+                self.parse_pool.warm()
+            except Exception as e:
+                logger.warning("파싱 풀 예열 실패: %s", e)
         try:
-            from scraper import NewsScraper
-            
-            scraper = NewsScraper()
+            if self.async_engine:
+                self.async_engine.warm()
+            else:
+                self.browser_pool.warm()
+        except Exception as e:
+            logger.warning("브라우저 예열 실패: %s", e)
+
+    def shutdown(self):
+        """서비스 리소스 정리"""
+        if self.async_engine:
+            self.async_engine.close()
+        self.browser_pool.close()
+        if self.parse_pool:
+            self.parse_pool.close()
+        self._stage_executor.shutdown(wait=False)
+        self.http.close()
+
+    def stats(self) -> Dict[str, Any]:
+        """서비스 내부 상태 (커넥션 풀, 캐시, 브라우저 풀)"""
+        return {
+            'http': self.http.stats(),
+            'result_cache': self.result_cache.stats(),
+            'translation_memo': self.translator.memo.stats(),
+            'summary_memo': self.summarizer.memo.stats(),
+            'coalescing': {
+                'articles': self.inflight.stats(),
+                'translations': self.translator.inflight.stats(),
+                'summaries': self.summarizer.inflight.stats()
+            },
+            'http_cache': self.scraper.http_cache.stats() if self.scraper.http_cache else None,
+            'browser_pool': self.browser_pool.stats(),
+            'parse_pool': self.parse_pool.stats() if self.parse_pool else None,
+            'resource_policy': self.scraper.resource_policy.describe()
+        }
+
+    def selector_stats(self, domain: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """도메인별 선택자 학습 통계 (적중률, 선택자별 점수)"""
+        if self.scraper.selector_stats is None:
+            return None
+        return self.scraper.selector_stats.stats(domain)
+
+    def scrape_article(self, url: str) -> Dict[str, Any]:
+        """설정된 엔진으로 기사 스크래핑"""
+        if self.async_engine:
+            return self.async_engine.scrape(url)
+        return self.scraper.scrape_article(url)
+
+    def process_article(self, url: str, use_cache: bool = True,
+                        on_progress: Optional[Callable[..., None]] = None) -> Dict[str, Any]:
+        """기사 전체 처리 (스크래핑 + 번역 + 요약), 결과는 정규화된 URL 기준으로 캐시
+
+        on_progress(진행률, 현재 단계, 부분 결과)는 스테이지가 시작/완료될 때마다 호출된다.
+        """
+        cache_key = normalize_url(url)
+        
+        if use_cache:
+            cached = self.result_cache.get(cache_key)
+            if cached is not None:
+                result, age = cached
+                logger.debug("처리 결과 캐시 적중: %s (%.0f초 전)", cache_key, age)
+                result = dict(result)
+                result['cache'] = {'hit': True, 'age': round(age, 1)}
+                return result
+        
+        def run():
+            result = self._run_pipeline(url, on_progress)
+            # 모든 단계가 실제 결과를 낸 경우만 캐시 (실패/시뮬레이션은 다음 요청에서 다시 시도)
+            if result.get('success'):
+                failed = failed_stages(result)
+                if failed:
+                    logger.info("일부 단계 실패로 처리 결과를 캐시하지 않음: %s (%s)", cache_key, ', '.join(failed))
+                else:
+                    self.result_cache.set(cache_key, dict(result))
+            return result
+        
+        # 같은 기사가 이미 처리 중이면 그 결과를 기다려서 사용
+        result, shared = self.inflight.do(cache_key, run)
+        if shared:
+            logger.debug("진행 중인 같은 기사 처리 결과 사용: %s", cache_key)
+        
+        result = dict(result)
+        result['cache'] = {'hit': False, 'age': 0, 'coalesced': shared}
+        return result
+
+    def process_article_stream(self, url: str, use_cache: bool = True) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """기사 처리 결과를 (이벤트, 데이터) 단위로 도착하는 대로 반환
+
+        이벤트 순서: status → original → translation/summary 조각(동시에 도착) → done
+        스크래핑에 실패하면 error 이벤트로 끝난다.
+        """
+        started = time.perf_counter()
+        cache_key = normalize_url(url)
+        
+        if use_cache:
+            cached = self.result_cache.get(cache_key)
+            if cached is not None:
+                result, age = cached
+                result = dict(result)
+                result['cache'] = {'hit': True, 'age': round(age, 1)}
+                yield 'original', result['original']
+                yield 'done', result
+                return
+        
+        yield 'status', {'progress': 0, 'current_step': '기사 스크래핑 중'}
+        scraped_data = self.scrape_article(url)
+        if not scraped_data['success']:
+            yield 'error', {
+                'success': False,
+                'error': scraped_data['error'],
+                'url': url,
+                'progress': 25,
+                'current_step': '스크래핑 실패'
+            }
+            return
+        
+        original = {
+            'title': scraped_data['title'],
+            'content': scraped_data['content'],
+            'url': url,
+            'metadata': scraped_data['metadata']
+        }
+        scrape_ms = round((time.perf_counter() - started) * 1000, 1)
+        yield 'original', original
+        
+        # 제목 번역/본문 번역/요약을 동시에 실행하고 조각이 도착하는 대로 큐로 전달
+        events = queue.Queue()
+        results = {}
+        
+        def pump(key: str, event: str, field: Optional[str], stream: Callable[[], Iterator[str]], failed: str):
+            parts = []
+            try:
+                for delta in stream():
+                    parts.append(delta)
+                    data = {'delta': delta}
+                    if field:
+                        data['field'] = field
+                    events.put((event, data))
+                results[key] = ''.join(parts).strip() or None
+            except Exception as e:
+                logger.warning("스트리밍 처리 오류 (%s): %s", key, e)
+                results[key] = failed
+            events.put(('_finished', key))
+        
+        def summarize_after_translation():
+            pump('translated_content', 'translation', 'content',
+                 lambda: self.translator.stream_translation(original['content']), "[번역 실패]")
+            translated_content = results['translated_content']
+            source = translated_content if translated_content and translated_content != "[번역 실패]" else original['content']
+            pump('summary', 'summary', None, lambda: self.summarizer.stream_summary(source), "[요약 실패]")
+        
+        self._stage_executor.submit(
+            pump, 'translated_title', 'translation', 'title',
+            lambda: self.translator.stream_translation(original['title']), "[번역 실패]"
+        )
+        if self.summary_source == 'translation':
+            self._stage_executor.submit(summarize_after_translation)
+        else:
+            self._stage_executor.submit(
+                pump, 'translated_content', 'translation', 'content',
+                lambda: self.translator.stream_translation(original['content']), "[번역 실패]"
+            )
+            self._stage_executor.submit(
+                pump, 'summary', 'summary', None,
+                lambda: self.summarizer.stream_summary(original['content']), "[요약 실패]"
+            )
+        
+        first_content_ms = None
+        remaining = 3
+        while remaining:
+            event, data = events.get()
+            if event == '_finished':
+                remaining -= 1
+                yield 'status', {'progress': 100 - 25 * remaining, 'current_step': f'{STREAM_LABELS[data]} 완료'}
+                continue
+            if first_content_ms is None:
+                first_content_ms = round((time.perf_counter() - started) * 1000, 1)
+            yield event, data
+        
+        result = {
+            'success': True,
+            'original': original,
+            'translated': {
+                'title': results['translated_title'],
+                'content': results['translated_content']
+            },
+            'summarized': {
+                'content': results['summary']
+            },
+            'timings': {
+                'scrape_ms': scrape_ms,
+                'first_content_ms': first_content_ms,
+                'total_ms': round((time.perf_counter() - started) * 1000, 1),
+                'summary_source': self.summary_source
+            },
+            'progress': 100,
+            'current_step': '완료'
+        }
+        # process_article과 같은 규칙: 모든 단계가 실제 결과를 낸 경우만 캐시
+        failed = failed_stages(result)
+        if failed:
+            logger.info("일부 단계 실패로 처리 결과를 캐시하지 않음: %s (%s)", cache_key, ', '.join(failed))
+        else:
+            self.result_cache.set(cache_key, dict(result))
+        result['cache'] = {'hit': False, 'age': 0}
+        yield 'done', result
+
+    def _build_pipeline(self, url: str) -> StageGraph:
+        """기사 처리 스테이지 그래프 구성
+
+        스크래핑 이후 본문 번역/제목 번역/요약은 서로 독립적으로 실행된다.
+        SUMMARY_SOURCE=translation 이면 요약은 본문 번역이 끝난 뒤 번역문으로 실행된다.
+        """
+        graph = StageGraph(self._stage_executor)
+        
+        def scrape(_):
+            logger.debug("1단계: 기사 스크래핑 시작...")
+            scraped_data = self.scrape_article(url)
+            if not scraped_data['success']:
+                raise ScrapeError(scraped_data)
+            logger.debug("1단계: 기사 스크래핑 완료")
+            return scraped_data
+        
+        def translate_content(inputs):
+            content = inputs['scrape']['content']
+            logger.debug("스크래핑된 내용 번역 시작: %s자", len(content))
+            translated_content = self.translator.translate_text(content)
+            logger.debug("본문 번역 완료: %s자", len(translated_content) if translated_content else 0)
+            return translated_content
+        
+        def translate_title(inputs):
+            translated_title = self.translator.translate_text(inputs['scrape']['title'])
+            logger.debug("제목 번역 완료: %s자", len(translated_title) if translated_title else 0)
+            return translated_title
+        
+        def summarize_original(inputs):
+            content = inputs['scrape']['content']
+            logger.debug("원문 요약 시작: %s자", len(content))
+            return self.summarizer.summarize_text(content)
+        
+        def summarize_translation(inputs):
+            translated_content = inputs['translate_content']
+            if translated_content and translated_content != "[번역 실패]":
+                logger.debug("번역된 내용 요약 시작: %s자", len(translated_content))
+                return self.summarizer.summarize_text(translated_content)
+            # 번역이 실패한 경우 원문을 요약
+            return summarize_original(inputs)
+        
+        graph.add('scrape', scrape)
+        graph.add('translate_content', translate_content, deps=['scrape'],
+                  fallback=lambda e: "[번역 실패]")
+        graph.add('translate_title', translate_title, deps=['scrape'],
+                  fallback=lambda e: "[번역 실패]")
+        if self.summary_source == 'translation':
+            graph.add('summarize', summarize_translation, deps=['scrape', 'translate_content'],
+                      fallback=lambda e: "[요약 실패]")
+        else:
+            graph.add('summarize', summarize_original, deps=['scrape'],
+                      fallback=lambda e: "[요약 실패]")
+        return graph
+
+    def _progress_listener(self, on_progress: Callable[..., None]) -> Callable[[str, str, Dict[str, Any]], None]:
+        """스테이지 이벤트를 진행률/부분 결과로 변환하는 리스너"""
+        completed = []
+        lock = threading.Lock()
+        
+        def listener(event: str, stage: str, results: Dict[str, Any]):
+            label = STAGE_LABELS.get(stage, stage)
+            if event == 'start':
+                on_progress(25 * len(completed), f'{label} 중')
+                return
             
-            # 1. 스크래핑 (25% 완료)
-            print("1단계: 기사 스크래핑 시작...")
-            scraped_data = scraper.scrape_article(url)
+            with lock:
+                completed.append(stage)
+                progress = 25 * len(completed)
             
-            if not scraped_data['success']:
+            value = results[stage]
+            if stage == 'scrape':
+                partial = {'original': {
+                    'title': value['title'],
+                    'content': value['content'],
+                    'url': value['url'],
+                    'metadata': value['metadata']
+                }}
+            elif stage == 'translate_content':
+                partial = {'translated': {'content': value}}
+            elif stage == 'translate_title':
+                partial = {'translated': {'title': value}}
+            else:
+                partial = {'summarized': {'content': value}}
+            on_progress(progress, f'{label} 완료', partial)
+        
+        return listener
+
+    def _run_pipeline(self, url: str, on_progress: Optional[Callable[..., None]] = None) -> Dict[str, Any]:
+        """스크래핑 + 번역 + 요약 실행"""
+        try:
+            graph = self._build_pipeline(url)
+            if on_progress:
+                graph.on_stage_event(self._progress_listener(on_progress))
+            run = graph.run()
+        except StageFailed as e:
+            if isinstance(e.error, ScrapeError):
                 return {
                     'success': False,
-                    'error': scraped_data['error'],
+                    'error': e.error.result['error'],
                     'url': url,
                     'progress': 25,
                     'current_step': '스크래핑 실패'
                 }
-            
-            print("1단계: 기사 스크래핑 완료 (25%)")
-            
-            # 2. 번역 (50% 완료)
-            translated_content = None
-            translated_title = None
-            try:
-                print("2단계: 기사 번역 시작...")
-                print(f"스크래핑된 내용 번역 시작: {len(scraped_data['content'])}자")
-                translated_content = self.translator.translate_text(scraped_data['content'])
-                translated_title = self.translator.translate_text(scraped_data['title'])
-                print(f"번역 완료 - 제목: {len(translated_title) if translated_title else 0}자, 내용: {len(translated_content) if translated_content else 0}자")
-                print("2단계: 기사 번역 완료 (50%)")
-            except Exception as e:
-                print(f"번역 오류: {e}")
-                translated_content = "[번역 실패]"
-                translated_title = "[번역 실패]"
-            
-            # 3. 요약 (75% 완료)
-            summarized_content = None
-            try:
-                print("3단계: 기사 요약 시작...")
-                if translated_content and translated_content != "[번역 실패]":
-                    print(f"번역된 내용 요약 시작: {len(translated_content)}자")
-                    summarized_content = self.summarizer.summarize_text(translated_content)
-                else:
-                    # 번역이 실패한 경우 원문을 요약
-                    print(f"원문 요약 시작: {len(scraped_data['content'])}자")
-                    summarized_content = self.summarizer.summarize_text(scraped_data['content'])
-                print(f"요약 완료: {len(summarized_content) if summarized_content else 0}자")
-                print("3단계: 기사 요약 완료 (75%)")
-            except Exception as e:
-                print(f"요약 오류: {e}")
-                summarized_content = "[요약 실패]"
-            
-            # 4. 완료 (100%)
-            print("4단계: 모든 처리 완료 (100%)")
-            
+            logger.error("전체 처리 오류: %s", e)
             return {
-                'success': True,
-                'original': {
-                    'title': scraped_data['title'],
-                    'content': scraped_data['content'],
-                    'url': url,
-                    'metadata': scraped_data['metadata']
-                },
-                'translated': {
-                    'title': translated_title,
-                    'content': translated_content
-                },
-                'summarized': {
-                    'content': summarized_content
-                },
-                'progress': 100,
-                'current_step': '완료'
+                'success': False,
+                'error': f"기사 처리 중 오류가 발생했습니다: {str(e.error)}",
+                'url': url,
+                'progress': 0,
+                'current_step': '오류 발생'
             }
-            
         except Exception as e:
-            print(f"전체 처리 오류: {e}")
+            logger.exception("전체 처리 오류: %s", e)
             return {
                 'success': False,
                 'error': f"기사 처리 중 오류가 발생했습니다: {str(e)}",
@@ -412,6 +1165,30 @@ class NewsProcessingService:
                 'progress': 0,
                 'current_step': '오류 발생'
             }
+        
+        results = run['results']
+        scraped_data = results['scrape']
+        logger.info("모든 처리 완료 (%sms)", run['timings']['total_ms'])
+        
+        return {
+            'success': True,
+            'original': {
+                'title': scraped_data['title'],
+                'content': scraped_data['content'],
+                'url': url,
+                'metadata': scraped_data['metadata']
+            },
+            'translated': {
+                'title': results['translate_title'],
+                'content': results['translate_content']
+            },
+            'summarized': {
+                'content': results['summarize']
+            },
+            'timings': dict(run['timings'], summary_source=self.summary_source),
+            'progress': 100,
+            'current_step': '완료'
+        }
 
 # 사용 예시
 if __name__ == "__main__":
@@ -419,6 +1196,7 @@ if __name__ == "__main__":
     
     test_url = "https://www.bbc.com/news/world-europe-67823456"
     result = service.process_article(test_url)
+    service.shutdown()
     
     if result['success']:
         print("처리 성공!")
@@ -0,0 +1,354 @@
+import contextvars
+import cProfile
+import hmac
+import io
+import json
+import logging
+import os
+import pstats
+import sqlite3
+import sys
+import threading
+import time
+import uuid
+from collections import Counter, OrderedDict
+from contextlib import contextmanager, nullcontext
+from typing import Optional, Dict, Any, Callable, Iterator, List
+from cache import cache_db_path
+
+logger = logging.getLogger(__name__)
+
+PROFILE_MODES = ('sample', 'cprofile')
+
+# 현재 실행 중인 요청의 프로파일 (프로파일링 중이 아니면 None)
+_current: contextvars.ContextVar = contextvars.ContextVar('profile', default=None)
+_NULL_SPAN = nullcontext()
+
+
+def authorized(token: Optional[str]) -> bool:
+    """관리자 토큰 확인 (ADMIN_TOKEN을 설정하지 않으면 항상 거부)"""
+    admin_token = os.getenv('ADMIN_TOKEN', '')
+    return bool(admin_token) and bool(token) and hmac.compare_digest(token.encode(), admin_token.encode())
+
+
+def parse_mode(value: Optional[str]) -> Optional[str]:
+    """X-Profile 헤더/profile 쿼리 값 → 프로파일러 종류 (1/true는 sample)"""
+    if not value:
+        return None
+    value = value.strip().lower()
+    if value in ('1', 'true', 'yes'):
+        return 'sample'
+    if value in ('0', 'false', 'no'):
+        return None
+    return value if value in PROFILE_MODES else 'sample'
+
+
+def span(name: str):
+    """현재 요청을 프로파일링 중이면 구간을 타임라인에 기록 (아니면 아무 일도 하지 않음)"""
+    profile = _current.get()
+    if profile is None:
+        return _NULL_SPAN
+    return profile.span(name)
+
+
+def bind(fn: Callable) -> Callable:
+    """다른 스레드에서 실행될 함수에 현재 프로파일을 넘김 (프로파일링 중이 아니면 fn 그대로)"""
+    if _current.get() is None:
+        return fn
+    context = contextvars.copy_context()
+    return lambda *args, **kwargs: context.run(fn, *args, **kwargs)
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    return f'{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})'
+
+
+class Profile:
+    """요청 하나의 프로파일 (구간 타임라인 + 호출 스택)
+
+    - sample: PROFILE_SAMPLE_INTERVAL마다 구간 안에 있는 스레드들의 스택을 수집 (collapsed stack)
+    - cprofile: 구간 안에 있는 스레드마다 cProfile을 켜서 함수별 시간을 정확히 측정
+    두 방식 모두 프로파일링 중인 요청이 실행되는 스레드만 본다 (다른 요청은 섞이지 않음).
+    """
+
+    def __init__(self, mode: str = 'sample', label: str = '', interval: Optional[float] = None):
+        self.id = uuid.uuid4().hex[:12]
+        self.mode = mode
+        self.label = label
+        self.interval = interval or float(os.getenv('PROFILE_SAMPLE_INTERVAL', '0.005'))
+        self.started = time.perf_counter()
+        self.created_at = time.time()
+        self.duration_ms: Optional[float] = None
+        self.spans: List[Dict[str, Any]] = []
+        self.samples: Counter = Counter()
+        self._lock = threading.Lock()
+        # 구간 안에 있는 스레드 → (중첩 깊이, 스레드 이름)
+        self._threads: Dict[int, List[Any]] = {}
+        self._profilers: List[cProfile.Profile] = []
+        self._thread_profilers: Dict[int, cProfile.Profile] = {}
+        self._stop = threading.Event()
+        self._sampler: Optional[threading.Thread] = None
+
+    @contextmanager
+    def span(self, name: str) -> Iterator[None]:
+        thread_id = threading.get_ident()
+        started = time.perf_counter()
+        self._enter_thread(thread_id)
+        try:
+            yield
+        finally:
+            finished = time.perf_counter()
+            self._exit_thread(thread_id)
+            with self._lock:
+                self.spans.append({
+                    'name': name,
+                    'thread': threading.current_thread().name,
+                    'start_ms': round((started - self.started) * 1000, 2),
+                    'duration_ms': round((finished - started) * 1000, 2)
+                })
+
+    def _enter_thread(self, thread_id: int):
+        with self._lock:
+            entry = self._threads.get(thread_id)
+            if entry is not None:
+                entry[0] += 1
+                return
+            self._threads[thread_id] = [1, threading.current_thread().name]
+        if self.mode == 'cprofile':
+            profiler = cProfile.Profile()
+            self._thread_profilers[thread_id] = profiler
+            profiler.enable()
+
+    def _exit_thread(self, thread_id: int):
+        with self._lock:
+            entry = self._threads[thread_id]
+            entry[0] -= 1
+            if entry[0]:
+                return
+            del self._threads[thread_id]
+        profiler = self._thread_profilers.pop(thread_id, None)
+        if profiler is not None:
+            profiler.disable()
+            with self._lock:
+                self._profilers.append(profiler)
+
+    def _sample_loop(self):
+        while not self._stop.wait(self.interval):
+            frames = sys._current_frames()
+            with self._lock:
+                threads = [(thread_id, entry[1]) for thread_id, entry in self._threads.items()]
+            for thread_id, thread_name in threads:
+                frame = frames.get(thread_id)
+                stack = []
+                while frame is not None:
+                    stack.append(_frame_label(frame))
+                    frame = frame.f_back
+                if stack:
+                    stack.append(thread_name)
+                    self.samples[';'.join(reversed(stack))] += 1
+
+    def start(self):
+        if self.mode == 'sample':
+            self._sampler = threading.Thread(target=self._sample_loop, name=f'profiler-{self.id}', daemon=True)
+            self._sampler.start()
+
+    def stop(self):
+        self.duration_ms = round((time.perf_counter() - self.started) * 1000, 1)
+        self._stop.set()
+        if self._sampler is not None:
+            self._sampler.join()
+
+    def collapsed(self) -> str:
+        """flamegraph.pl/speedscope에서 읽을 수 있는 collapsed stack 텍스트
+
+        cprofile 방식은 전체 스택이 없으므로 '호출자;함수 자체 시간(μs)' 2단계로 만든다.
+        """
+        if self.mode == 'sample':
+            return ''.join(f'{stack} {count}\n' for stack, count in self.samples.most_common())
+        stats = self._stats()
+        if stats is None:
+            return ''
+        lines = []
+        for func, (_, _, total_time, _, callers) in stats.stats.items():
+            label = pstats.func_std_string(func)
+            if not callers:
+                lines.append(f'{label} {int(total_time * 1e6)}')
+            for caller, caller_stats in callers.items():
+                self_time = caller_stats[2]
+                if self_time > 0:
+                    lines.append(f'{pstats.func_std_string(caller)};{label} {int(self_time * 1e6)}')
+        return '\n'.join(lines) + '\n'
+
+    def _stats(self) -> Optional[pstats.Stats]:
+        if not self._profilers:
+            return None
+        stats = pstats.Stats(self._profilers[0], stream=io.StringIO())
+        for profiler in self._profilers[1:]:
+            stats.add(profiler)
+        return stats
+
+    def top(self, limit: int = 20) -> List[Dict[str, Any]]:
+        """자체 시간이 긴 함수 목록 (sample: 스택 맨 위에 있던 횟수, cprofile: 자체 시간 ms)"""
+        if self.mode == 'sample':
+            leaves: Counter = Counter()
+            for stack, count in self.samples.items():
+                leaves[stack.rsplit(';', 1)[-1]] += count
+            total = sum(leaves.values()) or 1
+            return [
+                {'function': function, 'samples': count, 'percent': round(count * 100 / total, 1)}
+                for function, count in leaves.most_common(limit)
+            ]
+        stats = self._stats()
+        if stats is None:
+            return []
+        rows = sorted(stats.stats.items(), key=lambda item: -item[1][2])[:limit]
+        return [
+            {
+                'function': pstats.func_std_string(func),
+                'calls': calls,
+                'self_ms': round(total_time * 1000, 2),
+                'cumulative_ms': round(cumulative * 1000, 2)
+            }
+            for func, (_, calls, total_time, cumulative, _) in rows
+        ]
+
+    def report(self) -> Dict[str, Any]:
+        return {
+            'id': self.id,
+            'mode': self.mode,
+            'label': self.label,
+            'duration_ms': self.duration_ms,
+            'samples': sum(self.samples.values()) if self.mode == 'sample' else None,
+            'spans': sorted(self.spans, key=lambda item: item['start_ms']),
+            'top': self.top(),
+            'collapsed_url': f'/api/profiles/{self.id}?format=collapsed'
+        }
+
+
+class StoredProfile:
+    """공유 DB에서 읽은 프로파일 (Profile과 같은 report/collapsed 제공)"""
+
+    def __init__(self, report: Dict[str, Any], collapsed: str):
+        self._report = report
+        self._collapsed = collapsed
+
+    def report(self) -> Dict[str, Any]:
+        return self._report
+
+    def collapsed(self) -> str:
+        return self._collapsed
+
+
+class ProfileStore:
+    """최근 프로파일 보관 (오래된 것부터 삭제)
+
+    캐시 DB가 있으면 SQLite에도 저장해서, 여러 워커 프로세스로 실행할 때 프로파일을
+    만든 워커가 아닌 다른 워커에서도 조회할 수 있다. 모듈을 import 할 때 만들어지므로
+    DB 연결은 fork 후 프로세스마다 처음 쓸 때 연다.
+    """
+
+    def __init__(self, max_entries: Optional[int] = None, db_path: Optional[str] = None):
+        self.max_entries = max_entries or int(os.getenv('PROFILE_STORE_SIZE', '20'))
+        self.db_path = db_path if db_path is not None else cache_db_path()
+        self._lock = threading.Lock()
+        self._profiles: 'OrderedDict[str, Profile]' = OrderedDict()
+        self._db = None
+        self._db_pid = None
+
+    def _connection(self) -> Optional[sqlite3.Connection]:
+        """이 프로세스의 DB 연결 (_lock 안에서 호출, DB가 없거나 실패하면 None)"""
+        if not self.db_path:
+            return None
+        if self._db_pid != os.getpid():
+            self._db_pid = os.getpid()
+            try:
+                self._db = sqlite3.connect(self.db_path, check_same_thread=False, timeout=10)
+                self._db.execute('PRAGMA journal_mode=WAL')
+                self._db.execute(
+                    'CREATE TABLE IF NOT EXISTS profiles ('
+                    ' id TEXT PRIMARY KEY, created_at REAL NOT NULL, summary TEXT NOT NULL,'
+                    ' report TEXT NOT NULL, collapsed TEXT NOT NULL)'
+                )
+                self._db.commit()
+            except sqlite3.Error as e:
+                logger.warning("프로파일 DB 초기화 실패 (%s): %s", self.db_path, e)
+                self._db = None
+        return self._db
+
+    def add(self, profile: Profile):
+        with self._lock:
+            self._profiles[profile.id] = profile
+            while len(self._profiles) > self.max_entries:
+                self._profiles.popitem(last=False)
+            db = self._connection()
+            if db is None:
+                return
+            try:
+                db.execute(
+                    'INSERT OR REPLACE INTO profiles (id, created_at, summary, report, collapsed)'
+                    ' VALUES (?, ?, ?, ?, ?)',
+                    (profile.id, profile.created_at, json.dumps(self._summary(profile), ensure_ascii=False),
+                     json.dumps(profile.report(), ensure_ascii=False), profile.collapsed())
+                )
+                db.execute(
+                    'DELETE FROM profiles WHERE id NOT IN'
+                    ' (SELECT id FROM profiles ORDER BY created_at DESC LIMIT ?)',
+                    (self.max_entries,)
+                )
+                db.commit()
+            except sqlite3.Error as e:
+                logger.warning("프로파일 저장 실패: %s", e)
+
+    def get(self, profile_id: str):
+        """프로파일 조회 (이 프로세스에 없으면 공유 DB에서) - Profile 또는 StoredProfile"""
+        with self._lock:
+            profile = self._profiles.get(profile_id)
+            if profile is not None:
+                return profile
+            db = self._connection()
+            if db is None:
+                return None
+            try:
+                row = db.execute('SELECT report, collapsed FROM profiles WHERE id = ?', (profile_id,)).fetchone()
+            except sqlite3.Error as e:
+                logger.warning("프로파일 조회 실패: %s", e)
+                return None
+        return StoredProfile(json.loads(row[0]), row[1]) if row else None
+
+    def list(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            profiles = list(self._profiles.values())
+            db = self._connection()
+            if db is not None:
+                try:
+                    rows = db.execute(
+                        'SELECT summary FROM profiles ORDER BY created_at DESC LIMIT ?', (self.max_entries,)
+                    ).fetchall()
+                    return [json.loads(row[0]) for row in rows]
+                except sqlite3.Error as e:
+                    logger.warning("프로파일 목록 조회 실패: %s", e)
+        return [self._summary(p) for p in reversed(profiles)]
+
+    @staticmethod
+    def _summary(profile: Profile) -> Dict[str, Any]:
+        return {'id': profile.id, 'mode': profile.mode, 'label': profile.label,
+                'duration_ms': profile.duration_ms, 'created_at': profile.created_at}
+
+
+store = ProfileStore()
+
+
+@contextmanager
+def profile(mode: str = 'sample', label: str = '') -> Iterator[Profile]:
+    """with 블록 안의 실행(다른 스레드에 bind로 넘긴 작업 포함)을 프로파일링하고 저장"""
+    current = Profile(mode, label)
+    token = _current.set(current)
+    current.start()
+    try:
+        with current.span(label or 'request'):
+            yield current
+    finally:
+        _current.reset(token)
+        current.stop()
+        store.add(current)
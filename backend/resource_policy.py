@@ -0,0 +1,93 @@
+import os
+from urllib.parse import urlsplit
+from typing import Optional, Dict, Any, Iterable
+
+# 본문 추출에 쓰지 않는 리소스 종류 (Playwright request.resource_type)
+DEFAULT_BLOCKED_TYPES = 'image,media,font,texttrack,eventsource,websocket,manifest,other'
+
+# 광고/트래커 호스트 (하위 도메인 포함)
+DEFAULT_BLOCKED_HOSTS = ','.join([
+    'doubleclick.net', 'googlesyndication.com', 'googletagmanager.com', 'googletagservices.com',
+    'google-analytics.com', 'googleadservices.com', 'adservice.google.com', 'facebook.net',
+    'connect.facebook.net', 'scorecardresearch.com', 'amazon-adsystem.com', 'adnxs.com',
+    'criteo.com', 'criteo.net', 'taboola.com', 'outbrain.com', 'chartbeat.com', 'chartbeat.net',
+    'hotjar.com', 'newrelic.com', 'nr-data.net', 'quantserve.com', 'moatads.com', 'rubiconproject.com',
+    'pubmatic.com', 'casalemedia.com', 'krxd.net', 'omtrdc.net', 'demdex.net', 'segment.io',
+    'optimizely.com', 'permutive.com', 'bluekai.com', 'adsrvr.org', 'teads.tv', 'cookielaw.org',
+    'onetrust.com', 'imasdk.googleapis.com', 'jwpcdn.com', 'brightcove.net'
+])
+
+# 두 단계 공개 접미사 (example.co.uk 같은 도메인의 등록 도메인 계산용)
+SECOND_LEVEL_LABELS = frozenset(['co', 'com', 'ac', 'go', 'or', 'ne', 'net', 'org', 'gov', 'edu'])
+
+
+def _split_list(value: str) -> frozenset:
+    return frozenset(item.strip().lower() for item in value.split(',') if item.strip())
+
+
+def _host_matches(host: str, patterns: Iterable[str]) -> bool:
+    return any(host == pattern or host.endswith('.' + pattern) for pattern in patterns)
+
+
+def site_of(host: str) -> str:
+    """호스트의 등록 도메인 (www.bbc.co.uk → bbc.co.uk)"""
+    labels = host.split('.')
+    if len(labels) >= 3 and len(labels[-1]) == 2 and labels[-2] in SECOND_LEVEL_LABELS:
+        return '.'.join(labels[-3:])
+    return '.'.join(labels[-2:])
+
+
+class ResourcePolicy:
+    """Playwright 페이지에서 어떤 요청을 막을지 정하는 규칙
+
+    - BLOCK_RESOURCE_TYPES: 막을 리소스 종류 (이미지, 폰트, 동영상 등)
+    - BLOCK_HOSTS: 막을 호스트 (광고/트래커, 하위 도메인 포함)
+    - BLOCK_THIRD_PARTY=true 이면 기사와 다른 사이트의 요청을 모두 막음
+    - ALLOW_HOSTS: 위 규칙보다 우선해서 항상 허용할 호스트
+    문서 요청은 BLOCK_HOSTS에 있는 경우(광고 iframe 등)에만 막는다.
+    """
+
+    def __init__(self, enabled: Optional[bool] = None, blocked_types: Optional[str] = None,
+                 blocked_hosts: Optional[str] = None, allowed_hosts: Optional[str] = None,
+                 block_third_party: Optional[bool] = None):
+        if enabled is None:
+            enabled = os.getenv('RESOURCE_BLOCKING', 'true').lower() == 'true'
+        if block_third_party is None:
+            block_third_party = os.getenv('BLOCK_THIRD_PARTY', 'false').lower() == 'true'
+        self.enabled = enabled
+        self.block_third_party = block_third_party
+        self.blocked_types = _split_list(blocked_types or os.getenv('BLOCK_RESOURCE_TYPES', DEFAULT_BLOCKED_TYPES))
+        self.blocked_hosts = _split_list(blocked_hosts or os.getenv('BLOCK_HOSTS', DEFAULT_BLOCKED_HOSTS))
+        self.allowed_hosts = _split_list(allowed_hosts or os.getenv('ALLOW_HOSTS', ''))
+
+    def should_block(self, resource_type: str, url: str, page_url: str) -> bool:
+        """요청을 막아야 하면 True"""
+        if not self.enabled:
+            return False
+
+        host = (urlsplit(url).hostname or '').lower()
+        if not host:
+            # data:, blob: 등은 네트워크를 쓰지 않음
+            return False
+        if _host_matches(host, self.allowed_hosts):
+            return False
+        if _host_matches(host, self.blocked_hosts):
+            return True
+        # 문서(메인 페이지, 리다이렉트, iframe)는 종류/사이트 규칙을 적용하지 않음
+        if resource_type == 'document':
+            return False
+        if resource_type in self.blocked_types:
+            return True
+        if self.block_third_party:
+            page_host = (urlsplit(page_url).hostname or '').lower()
+            return bool(page_host) and site_of(host) != site_of(page_host)
+        return False
+
+    def describe(self) -> Dict[str, Any]:
+        return {
+            'enabled': self.enabled,
+            'blocked_types': sorted(self.blocked_types),
+            'blocked_hosts': len(self.blocked_hosts),
+            'allowed_hosts': sorted(self.allowed_hosts),
+            'block_third_party': self.block_third_party
+        }
@@ -1,12 +1,175 @@
 from playwright.sync_api import sync_playwright
-import requests
+from browser_pool import BROWSER_ARGS
+from static_extractor import StaticExtractor, SelectorPlan, clean_text, DENSITY_SCRIPT_ARGS
+from html_stream import ContainerWatcher, read_html
+from http_client import get_http_client
+from selector_stats import create_selector_stats, selector_domain
+from http_cache import create_http_cache, body_hash
+from cache import normalize_url
+from resource_policy import ResourcePolicy
+import metrics
+import profiling
 import json
+import logging
 import time
-import re
 from typing import Optional, Dict, Any
+import os
+
+logger = logging.getLogger(__name__)
+
+# 페이지 안에서 한 번에 실행되는 추출 스크립트
+# (선택자마다 query_selector_all/inner_text를 호출하면 요소마다 IPC 왕복이 발생하므로
+#  후보 평가를 모두 브라우저 안에서 끝내고 결과만 한 번에 돌려받는다)
+IN_PAGE_EXTRACT_SCRIPT = r"""
+(args) => {
+    // _clean_text와 같은 규칙으로 길이 판정
+    const clean = (t) => t
+        .replace(/\s+/g, ' ')
+        .replace(/[^\p{L}\p{N}_\s.,!?;:()\-"']/gu, '')
+        .trim();
+    const textOf = (el) => (el.innerText || '').trim();
+    const queryAll = (selector) => {
+        try { return Array.from(document.querySelectorAll(selector)); } catch (e) { return null; }
+    };
+    const queryOne = (selector) => {
+        try { return document.querySelector(selector); } catch (e) { return null; }
+    };
+
+    // static_extractor.extract_by_density와 같은 규칙 (한 번의 후위 순회, 레이아웃 계산 없이 textContent 기준)
+    const densityContent = (root) => {
+        const rules = args.density;
+        const skipTags = new Set(rules.skipTags);
+        const paragraphTags = new Set(rules.paragraphTags);
+        const leafTags = new Set(rules.leafTags);
+        const inlineTags = new Set(rules.inlineTags);
+        const negative = new RegExp(rules.negative, 'i');
+        const positive = new RegExp(rules.positive, 'i');
+        const weightOf = (el) => {
+            const names = (el.getAttribute('class') || '') + ' ' + (el.getAttribute('id') || '');
+            if (!names.trim()) return 1;
+            const isPositive = positive.test(names);
+            if (negative.test(names) && !isPositive) return 0;
+            return isPositive ? 1.5 : 1;
+        };
+        const paragraphs = [];
+        let best = [0, 0, 0];
+        const walk = (el, weight, parent, grand) => {
+            const frame = { text: 0, links: 0, score: 0, blocks: false, first: paragraphs.length, breaks: 0 };
+            for (const node of el.childNodes) {
+                if (node.nodeType === 3) { frame.text += node.nodeValue.trim().length; continue; }
+                if (node.nodeType !== 1) continue;
+                const tag = node.localName;
+                if (skipTags.has(tag)) continue;
+                const childWeight = node.attributes.length ? weightOf(node) : 1;
+                if (childWeight) walk(node, childWeight, frame, parent);
+            }
+            const tag = el.localName;
+            if (tag === 'a') frame.links = frame.text;
+            const isParagraph = paragraphTags.has(tag) || (leafTags.has(tag) && !frame.blocks);
+            if (isParagraph && frame.text >= rules.minParagraphChars
+                    && frame.links <= frame.text * rules.maxLinkDensity) {
+                paragraphs.push(el);
+                const segments = 1 + frame.breaks / 2;
+                const score = segments + Math.min(frame.text / 100, 3 * segments);
+                if (parent) parent.score += score;
+                if (grand) grand.score += score / 2;
+            }
+            if (frame.score && frame.text) {
+                const candidate = frame.score * (1 - frame.links / frame.text) * weight;
+                if (candidate > best[0]) best = [candidate, frame.first, paragraphs.length];
+            }
+            if (parent) {
+                parent.text += frame.text;
+                parent.links += frame.links;
+                if (tag === 'br') parent.breaks += 1;
+                else if (!inlineTags.has(tag)) parent.blocks = true;
+            }
+        };
+        walk(root, 1, null, null);
+        return paragraphs.slice(best[1], best[2]).map(textOf).filter((t) => t).join('\n\n');
+    };
+
+    const result = { title: null, titleSelector: null, content: '', strategy: 'none', selector: null, metadata: {} };
+
+    // 제목
+    for (const selector of args.titleSelectors) {
+        const el = queryOne(selector);
+        if (!el) continue;
+        const title = textOf(el);
+        if (title && title.length > 10) {
+            result.title = title;
+            result.titleSelector = selector;
+            break;
+        }
+    }
+    if (result.title === null) {
+        const meta = queryOne('meta[property="og:title"]');
+        if (meta) {
+            result.title = (meta.getAttribute('content') || '').trim();
+            result.titleSelector = 'meta[property="og:title"]';
+        }
+    }
+
+    // 본문: 콘텐츠 선택자 순서대로
+    const pickContent = () => {
+        for (const selector of args.contentSelectors) {
+            const elements = queryAll(selector);
+            if (!elements || !elements.length) continue;
+            const parts = elements.map(textOf).filter((t) => t.length > 50);
+            if (!parts.length) continue;
+            const joined = parts.join('\n\n');
+            if (clean(joined).length > 50) return ['selector', selector, joined];
+        }
+
+        // 선택자가 모두 실패하면 텍스트 밀도로 본문 블록 찾기
+        const joined = document.body ? densityContent(document.body) : '';
+        if (clean(joined).length > 50) return ['density', 'density', joined];
+
+        return ['none', null, ''];
+    };
+    [result.strategy, result.selector, result.content] = pickContent();
+
+    // 메타데이터
+    for (const selector of args.authorSelectors) {
+        const el = queryOne(selector);
+        if (el) { result.metadata.author = textOf(el); break; }
+    }
+    for (const selector of args.dateSelectors) {
+        const el = queryOne(selector);
+        if (el) { result.metadata.published_date = textOf(el); break; }
+    }
+    const img = queryOne('article img, .article img, .story img');
+    if (img) result.metadata.image_url = img.getAttribute('src') || '';
+
+    return result;
+}
+"""
+
+# 본문이 준비됐는지 확인하는 스크립트 (wait_for_function으로 주기적으로 실행)
+# 콘텐츠 선택자 요소에 충분한 텍스트가 생기거나, 본문 텍스트 길이가 연속으로 변하지 않으면 준비 완료
+PAGE_READY_SCRIPT = r"""
+(args) => {
+    for (const selector of args.selectors) {
+        let el = null;
+        try { el = document.querySelector(selector); } catch (e) { continue; }
+        if (el && (el.textContent || '').trim().length > args.minLength) return 'selector';
+    }
+    const length = document.body ? (document.body.textContent || '').length : 0;
+    const stable = length > args.minLength && window.__scrapeLastLength === length;
+    window.__scrapeLastLength = length;
+    window.__scrapeStablePolls = stable ? (window.__scrapeStablePolls || 0) + 1 : 0;
+    return window.__scrapeStablePolls >= args.stablePolls ? 'stable' : false;
+}
+"""
 
 class NewsScraper:
-    def __init__(self):
+    def __init__(self, browser_pool=None, http_client=None):
+        # 공유 브라우저 풀 (없으면 요청마다 브라우저를 새로 실행)
+        self.browser_pool = browser_pool
+        # 공유 HTTP 클라이언트 (호스트별 커넥션 재사용)
+        self.http = http_client or get_http_client()
+        # 정적 추출을 실행할 프로세스 풀 (서비스가 설정, 없으면 요청 스레드에서 직접 추출)
+        self.parse_pool = None
         self.user_agent = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         
         # 주요 뉴스 사이트별 콘텐츠 선택자
@@ -71,23 +234,64 @@ class NewsScraper:
             '.entry-title',
             '[data-testid="headline"]'
         ]
+        
+        # 메타데이터 선택자
+        self.author_selectors = ['.author', '.byline', '.writer', '[data-testid="author"]']
+        self.date_selectors = ['.date', '.published', '.timestamp', '[data-testid="date"]']
+        
+        # 정적 HTML 추출기 (선택자를 한 번 컴파일해 두고 재사용)
+        self.static_extractor = StaticExtractor(
+            self.content_selectors, self.title_selectors,
+            self.author_selectors, self.date_selectors
+        )
+        
+        # HTML 본문은 스트리밍으로 받으면서 크기를 제한한다. FETCH_EARLY_STOP_CHARS를 설정하면
+        # 우선순위가 가장 높은 본문 선택자의 영역이 닫히고 텍스트가 충분히 모였을 때 나머지는
+        # 받지 않는다 (기본 0: 본문 뒤의 조각/작성자/날짜를 잃을 수 있고 파싱이 요청 스레드에서
+        # 한 번 더 실행되므로 끝까지 받음)
+        self.fetch_max_bytes = int(os.getenv('FETCH_MAX_BYTES', str(5 * 1024 * 1024)))
+        self.early_stop_chars = int(os.getenv('FETCH_EARLY_STOP_CHARS', '2000'))
+        # 선택자별 조기 종료 판단용 계획 (처음 쓸 때 컴파일)
+        self._container_plans: Dict[str, SelectorPlan] = {}
+        
+        # 가져온 HTML을 검증자와 함께 저장해 두고 재요청은 조건부 요청으로 (HTTP_CACHE=false 이면 사용 안 함)
+        self.http_cache = create_http_cache()
+        
+        # 도메인별로 성공한 선택자를 학습해서 먼저 시도 (ADAPTIVE_SELECTORS=false 이면 고정 순서)
+        self.selector_stats = create_selector_stats()
+        
+        # Playwright에서 막을 리소스 (이미지/폰트/광고 등)
+        self.resource_policy = ResourcePolicy()
+        # 본문 준비 대기 (고정 대기 대신 콘텐츠가 나타나거나 텍스트 길이가 안정될 때까지)
+        self.ready_timeout = float(os.getenv('PAGE_READY_TIMEOUT', '10'))
+        # 페이지 이동 제한 시간(초)과 브라우저 풀에서 차례를 기다리는 최대 시간(초)
+        self.navigation_timeout = 30
+        self.render_queue_timeout = float(os.getenv('BROWSER_QUEUE_TIMEOUT', '30'))
+        self.ready_min_text = int(os.getenv('PAGE_READY_MIN_TEXT', '200'))
+        
+        # Playwright 추출 방식: script(페이지 내 단일 스크립트) 또는 legacy(선택자별 조회, 비교용)
+        self.page_extraction = os.getenv('PAGE_EXTRACTION', 'script')
 
     def scrape_article(self, url: str) -> Optional[Dict[str, Any]]:
         """뉴스 기사 스크래핑"""
-        print(f"스크래핑 시작: {url}")
+        logger.debug("스크래핑 시작: %s", url)
         
         # 먼저 requests로 시도해보기
         try:
             result = self._scrape_with_requests(url)
+            metrics.SCRAPES.inc(method='requests', result='success' if result['success'] else 'failure')
             if result['success']:
-                print("requests로 스크래핑 성공")
+                logger.debug("requests로 스크래핑 성공")
                 return result
         except Exception as e:
-            print(f"requests 스크래핑 실패: {e}")
+            metrics.SCRAPES.inc(method='requests', result='failure')
+            logger.warning("requests 스크래핑 실패: %s", e)
         
         # requests 실패 시 Playwright 사용
-        print("Playwright로 스크래핑 시도...")
-        return self._scrape_with_playwright(url)
+        logger.debug("Playwright로 스크래핑 시도...")
+        result = self._scrape_with_playwright(url)
+        metrics.SCRAPES.inc(method='playwright', result='success' if result['success'] else 'failure')
+        return result
     
     def _scrape_with_requests(self, url: str) -> Dict[str, Any]:
         """requests를 사용한 간단한 스크래핑"""
@@ -100,141 +304,410 @@ class NewsScraper:
                 'Connection': 'keep-alive',
             }
             
-            response = requests.get(url, headers=headers, timeout=30)
-            response.raise_for_status()
-            
-            from bs4 import BeautifulSoup
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # 제목 추출
-            title = self._extract_title_from_soup(soup)
-            
-            # 본문 추출
-            content = self._extract_content_from_soup(soup)
-            
-            # 메타데이터 추출
-            metadata = self._extract_metadata_from_soup(soup)
+            if self.http_cache is None:
+                with metrics.timed('fetch'), profiling.span('fetch'):
+                    response = self.http.get(url, headers=headers, read_timeout=30, stream=True)
+                    body, fetch_info = self._read_body(response, url)
+                result = self._extract_from_html(body, url)
+                result['extraction'] = dict(result.get('extraction') or {}, fetch=fetch_info)
+                return result
             
-            if content and len(content.strip()) > 50:
-                return {
-                    'success': True,
-                    'title': title,
-                    'content': content,
-                    'url': url,
-                    'metadata': metadata
-                }
-            else:
-                return {
-                    'success': False,
-                    'error': f'콘텐츠를 찾을 수 없습니다. 추출된 길이: {len(content) if content else 0}자',
-                    'url': url
-                }
+            return self._fetch_with_http_cache(url, headers)
                 
         except Exception as e:
+            metrics.record_error('fetch', e)
             return {
                 'success': False,
                 'error': f'requests 스크래핑 실패: {str(e)}',
                 'url': url
             }
     
+    def _fetch_with_http_cache(self, url: str, headers: Dict[str, str]) -> Dict[str, Any]:
+        """HTTP 캐시를 거쳐 가져오기 (max-age 안이면 재사용, 지나면 조건부 요청)"""
+        cache_key = normalize_url(url)
+        cached = self.http_cache.get(cache_key)
+        fetch_info = None
+        
+        if cached is not None and cached.fresh:
+            outcome, body = 'fresh', cached.body
+        else:
+            if cached is not None:
+                headers = dict(headers, **cached.conditional_headers())
+            with metrics.timed('fetch'), profiling.span('fetch'):
+                response = self.http.get(url, headers=headers, read_timeout=30, stream=True)
+                if response.status_code == 304 and cached is not None:
+                    response.close()
+                else:
+                    body, fetch_info = self._read_body(response, url)
+            
+            if response.status_code == 304 and cached is not None:
+                # 바뀌지 않음 - 저장된 본문 사용
+                self.http_cache.touch(cached, response)
+                outcome, body = 'revalidated', cached.body
+            else:
+                if self._partial(fetch_info):
+                    # 일부만 받은 본문은 저장하지 않음 (검증자와 함께 저장하면 다음 304 때
+                    # 일부만 추출한 결과가 그대로 재사용됨), 바뀐 이전 본문도 버림
+                    self.http_cache.delete(cache_key)
+                else:
+                    self.http_cache.store(cache_key, response, body)
+                outcome = 'modified' if cached is not None else 'miss'
+        self.http_cache.count(outcome)
+        
+        # 본문이 저장된 것과 같으면 추출 결과도 그대로 사용 (파싱 생략)
+        hash_value = body_hash(body)
+        if cached is not None and cached.result and cached.body_hash == hash_value:
+            self.http_cache.count('extraction_skipped')
+            result = dict(cached.result, url=url)
+            result['extraction'] = dict(result.get('extraction') or {}, skipped=True)
+        else:
+            result = self._extract_from_html(body, url)
+        
+        if result['success'] and outcome in ('miss', 'modified') and not self._partial(fetch_info):
+            self.http_cache.save_result(cache_key, hash_value, result)
+        
+        result['extraction'] = dict(result.get('extraction') or {}, http_cache=outcome)
+        if fetch_info is not None:
+            result['extraction']['fetch'] = fetch_info
+        return result
+
+    @staticmethod
+    def _partial(fetch_info: Optional[Dict[str, Any]]) -> bool:
+        """크기 제한이나 조기 종료로 본문을 끝까지 받지 않았는지"""
+        return fetch_info is not None and bool(fetch_info['truncated'] or fetch_info['early_stop'])
+
+    def _read_body(self, response, url: Optional[str] = None):
+        """응답 상태를 확인하고 본문을 크기 제한/조기 종료를 적용해 읽음 → (바이트, 읽은 정보)"""
+        try:
+            response.raise_for_status()
+        except Exception:
+            response.close()
+            raise
+        watcher = None
+        if self.early_stop_chars:
+            # 추출기가 가장 먼저 시도할 선택자만 감시 (다른 선택자의 매칭은 결과를 바꾸지 못함)
+            watcher = ContainerWatcher(self._container_plan(self._selector_order(url, 'content')[0]),
+                                       self.early_stop_chars)
+        body, fetch_info = read_html(response, self.fetch_max_bytes, watcher)
+        if fetch_info['truncated']:
+            metrics.FETCH_CUTOFFS.inc(reason='size_limit')
+            logger.warning("HTML이 %s바이트를 넘어 잘랐습니다: %s", self.fetch_max_bytes, response.url)
+        elif fetch_info['early_stop']:
+            metrics.FETCH_CUTOFFS.inc(reason='early_stop')
+            logger.debug("본문 컨테이너(%s) 확보 후 수신 중단: %s바이트", fetch_info['early_stop'], fetch_info['bytes'])
+        return body, fetch_info
+    
+    def _container_plan(self, selector: str) -> SelectorPlan:
+        plan = self._container_plans.get(selector)
+        if plan is None:
+            plan = self._container_plans.setdefault(selector, SelectorPlan({'content': [selector]}))
+        return plan
+    
+    def _extract_from_html(self, html, url: str) -> Dict[str, Any]:
+        """HTML 문서에서 기사 추출 (lxml 한 번 파싱 + 선택자 실행 계획)"""
+        started = time.perf_counter()
+        extractor = self.parse_pool or self.static_extractor
+        with profiling.span('parse'):
+            extraction = extractor.extract(
+                html,
+                title_order=self._selector_order(url, 'title'),
+                content_order=self._selector_order(url, 'content')
+            )
+        self._learn_selectors(url, extraction)
+        
+        title = extraction['title']
+        content = extraction['content']
+        elapsed = time.perf_counter() - started
+        metrics.observe('parse', elapsed)
+        extraction_info = {
+            'mode': 'static',
+            'strategy': extraction['strategy'],
+            'selector': extraction['selector'],
+            'elapsed_ms': round(elapsed * 1000, 1)
+        }
+        if 'worker_ms' in extraction:
+            # 프로세스 풀에서 추출한 경우 워커 안에서 걸린 시간 (나머지는 전송/대기)
+            extraction_info['worker_ms'] = extraction['worker_ms']
+            extraction_info['truncated'] = extraction['truncated']
+        
+        if content and len(content.strip()) > 50:
+            return {
+                'success': True,
+                'title': title,
+                'content': content,
+                'url': url,
+                'metadata': extraction['metadata'],
+                'extraction': extraction_info
+            }
+        else:
+            return {
+                'success': False,
+                'error': f'콘텐츠를 찾을 수 없습니다. 추출된 길이: {len(content) if content else 0}자',
+                'url': url,
+                'extraction': extraction_info
+            }
+    
     def _scrape_with_playwright(self, url: str) -> Dict[str, Any]:
         """Playwright를 사용한 스크래핑"""
-        browser = None
         try:
+            if self.browser_pool:
+                # 상시 실행 중인 브라우저에서 새 컨텍스트만 받아 사용 (대기 시간 포함)
+                with profiling.span('render'):
+                    return self.browser_pool.run(
+                        profiling.bind(lambda context: self._render_article(context, url)),
+                        timeout=self.navigation_timeout + self.ready_timeout + self.render_queue_timeout,
+                        **self._context_options()
+                    )
+
+            # 브라우저 풀이 없으면 일회용 브라우저 사용
             with sync_playwright() as p:
-                # 브라우저 설정 개선
-                browser = p.chromium.launch(
-                    headless=True,
-                    args=[
-                        '--no-sandbox',
-                        '--disable-setuid-sandbox',
-                        '--disable-dev-shm-usage',
-                        '--disable-accelerated-2d-canvas',
-                        '--no-first-run',
-                        '--no-zygote',
-                        '--disable-gpu'
-                    ]
-                )
-                
-                context = browser.new_context(
-                    user_agent=self.user_agent,
-                    viewport={'width': 1920, 'height': 1080}
-                )
-                
-                page = context.new_page()
-                
-                # 페이지 로드 (더 안전한 방식)
-                print("페이지 로딩 중...")
-                page.goto(url, wait_until='domcontentloaded', timeout=30000)
-                
-                # 페이지가 로드될 때까지 대기
+                browser = p.chromium.launch(headless=True, args=BROWSER_ARGS)
                 try:
-                    page.wait_for_load_state('load', timeout=10000)
-                except:
-                    print("load 상태 대기 실패, 계속 진행...")
-                
-                # 추가 대기
-                time.sleep(3)
-                
-                # 페이지가 여전히 유효한지 확인
-                try:
-                    page.title()  # 페이지가 살아있는지 확인
-                except:
-                    raise Exception("페이지가 닫혔습니다")
-                
-                # 제목 추출
-                title = self._extract_title(page)
-                print(f"추출된 제목: {title}")
-                
-                # 본문 추출
-                content = self._extract_content(page)
-                print(f"추출된 콘텐츠 길이: {len(content) if content else 0}")
-                
-                # 메타데이터 추출
-                meta_data = self._extract_metadata(page)
-                print(f"메타데이터: {meta_data}")
-                
-                if content and len(content.strip()) > 50:
-                    return {
-                        'success': True,
-                        'title': title,
-                        'content': content,
-                        'url': url,
-                        'metadata': meta_data
-                    }
-                else:
-                    return {
-                        'success': False,
-                        'error': f'콘텐츠를 찾을 수 없습니다. 추출된 길이: {len(content) if content else 0}자',
-                        'url': url
-                    }
+                    context = browser.new_context(**self._context_options())
+                    with profiling.span('render'):
+                        return self._render_article(context, url)
+                finally:
+                    # 브라우저가 아직 열려있다면 안전하게 닫기
+                    try:
+                        browser.close()
+                    except:
+                        pass
                     
         except Exception as e:
-            error_msg = str(e)
-            print(f"Playwright 오류: {error_msg}")
-            
-            if "Target page, context or browser has been closed" in error_msg:
-                error_msg = "페이지 로딩 중 오류가 발생했습니다. 다시 시도해주세요."
-            elif "timeout" in error_msg.lower():
-                error_msg = "페이지 로딩 시간이 초과되었습니다. 다시 시도해주세요."
-            elif "net::" in error_msg:
-                error_msg = "네트워크 오류가 발생했습니다. 인터넷 연결을 확인해주세요."
-            
+            metrics.record_error('render', e)
+            logger.warning("Playwright 오류: %s", e)
             return {
                 'success': False,
-                'error': error_msg,
+                'error': self._playwright_error_message(e),
                 'url': url
             }
-        finally:
-            # 브라우저가 아직 열려있다면 안전하게 닫기
-            if browser:
-                try:
-                    browser.close()
-                except:
-                    pass
 
-    def _extract_title(self, page) -> str:
-        """제목 추출"""
+    def _playwright_error_message(self, error: Exception) -> str:
+        """Playwright 예외를 사용자용 오류 메시지로 변환"""
+        error_msg = str(error)
+        
+        if "Target page, context or browser has been closed" in error_msg:
+            error_msg = "페이지 로딩 중 오류가 발생했습니다. 다시 시도해주세요."
+        elif isinstance(error, TimeoutError) or "timeout" in error_msg.lower():
+            error_msg = "페이지 로딩 시간이 초과되었습니다. 다시 시도해주세요."
+        elif "net::" in error_msg:
+            error_msg = "네트워크 오류가 발생했습니다. 인터넷 연결을 확인해주세요."
+        
+        return error_msg
+
+    def _context_options(self) -> Dict[str, Any]:
+        """스크래핑용 BrowserContext 옵션"""
+        return {
+            'user_agent': self.user_agent,
+            'viewport': {'width': 1920, 'height': 1080}
+        }
+
+    def _render_article(self, context, url: str) -> Dict[str, Any]:
+        """주어진 BrowserContext에서 페이지를 열어 기사 추출"""
+        started = time.perf_counter()
+        render = {'requests': 0, 'blocked': 0, 'bytes': 0}
+        
+        # 본문 추출에 필요 없는 요청은 보내지 않음
+        def handle_route(route):
+            request = route.request
+            if self.resource_policy.should_block(request.resource_type, request.url, url):
+                render['blocked'] += 1
+                route.abort()
+            else:
+                render['requests'] += 1
+                route.continue_()
+        
+        if self.resource_policy.enabled:
+            context.route('**/*', handle_route)
+        page = context.new_page()
+        self._track_transfer(context, page, render)
+        
+        # 페이지 로드 (더 안전한 방식)
+        logger.debug("페이지 로딩 중...")
+        with profiling.span('page:goto'):
+            page.goto(url, wait_until='domcontentloaded', timeout=self.navigation_timeout * 1000)
+        
+        # 본문이 준비될 때까지 대기
+        try:
+            with profiling.span('page:wait_ready'):
+                ready = page.wait_for_function(
+                    PAGE_READY_SCRIPT, arg=self._ready_script_args(url),
+                    timeout=self.ready_timeout * 1000, polling=250
+                )
+            render['ready'] = ready.json_value()
+        except Exception:
+            logger.debug("본문 준비 대기 시간 초과, 계속 진행...")
+            render['ready'] = 'timeout'
+        
+        # 페이지가 여전히 유효한지 확인
+        try:
+            page.title()  # 페이지가 살아있는지 확인
+        except:
+            raise Exception("페이지가 닫혔습니다")
+        
+        with profiling.span('page:extract'):
+            if self.page_extraction == 'legacy':
+                extraction = self._extract_legacy(page, url)
+            else:
+                extraction = self._extract_in_page(page, url)
+        
+        render['elapsed_ms'] = round((time.perf_counter() - started) * 1000, 1)
+        return self._build_page_result(extraction, url, render)
+
+    def _track_transfer(self, context, page, render: Dict[str, Any]):
+        """CDP 네트워크 이벤트로 페이지가 받은 바이트 수 집계 (Chromium 전용)"""
+        def on_loading_finished(event):
+            render['bytes'] += int(event.get('encodedDataLength') or 0)
+        
+        try:
+            session = context.new_cdp_session(page)
+            session.on('Network.loadingFinished', on_loading_finished)
+            session.send('Network.enable')
+        except Exception as e:
+            logger.debug("전송량 집계 실패: %s", e)
+            render['bytes'] = None
+
+    def _ready_script_args(self, url: str) -> Dict[str, Any]:
+        """본문 준비 확인 스크립트에 넘길 값"""
+        return {
+            'selectors': self._selector_order(url, 'content'),
+            'minLength': self.ready_min_text,
+            'stablePolls': 2
+        }
+
+    def _build_page_result(self, extraction: Dict[str, Any], url: str,
+                           render: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """페이지 추출 결과를 스크래핑 결과 딕셔너리로 변환"""
+        title = extraction['title']
+        content = extraction['content']
+        self._learn_selectors(url, extraction)
+        logger.debug("추출된 제목: %s", title)
+        logger.debug("추출된 콘텐츠 길이: %s (%s: %s)",
+                     len(content) if content else 0, extraction['strategy'], extraction['selector'])
+        if render:
+            metrics.observe('render', render['elapsed_ms'] / 1000)
+            logger.debug("렌더링: %sms, %s바이트, 요청 %s개 (차단 %s개, 준비: %s)", render.get('elapsed_ms'),
+                         render.get('bytes'), render['requests'], render['blocked'], render.get('ready'))
+        
+        # 어떤 전략으로 추출했는지 (기존 방식과 성능 비교용)
+        extraction_info = {
+            'mode': extraction['mode'],
+            'strategy': extraction['strategy'],
+            'selector': extraction['selector'],
+            'elapsed_ms': extraction['elapsed_ms']
+        }
+        
+        if content and len(content.strip()) > 50:
+            result = {
+                'success': True,
+                'title': title,
+                'content': content,
+                'url': url,
+                'metadata': extraction['metadata'],
+                'extraction': extraction_info
+            }
+        else:
+            result = {
+                'success': False,
+                'error': f'콘텐츠를 찾을 수 없습니다. 추출된 길이: {len(content) if content else 0}자',
+                'url': url,
+                'extraction': extraction_info
+            }
+        
+        # 페이지 렌더링 시간/전송량/차단한 요청 수
+        if render:
+            result['render'] = render
+        return result
+
+    def selector_groups(self) -> Dict[str, Any]:
+        """정적 추출기 선택자 목록 (파싱 풀 워커에서 같은 추출기를 만들 때 사용)"""
+        return {
+            'content': self.content_selectors,
+            'title': self.title_selectors,
+            'author': self.author_selectors,
+            'date': self.date_selectors
+        }
+
+    def _selector_order(self, url: Optional[str], kind: str):
+        """도메인에서 성공했던 선택자를 앞에 둔 선택자 목록"""
+        selectors = self.title_selectors if kind == 'title' else self.content_selectors
+        if self.selector_stats is None or not url:
+            return selectors
+        return self.selector_stats.order(selector_domain(url), kind, selectors)
+
+    def _learn_selectors(self, url: str, extraction: Dict[str, Any]):
+        """어떤 선택자로 추출했는지 지표와 도메인별 통계에 기록"""
+        strategy = extraction['strategy']
+        metrics.SELECTOR_HITS.inc(kind='content', strategy=strategy, selector=extraction['selector'] or '')
+        if 'title_selector' in extraction:
+            metrics.SELECTOR_HITS.inc(kind='title', strategy='selector', selector=extraction['title_selector'] or '')
+        
+        if self.selector_stats is None or not url:
+            return
+        domain = selector_domain(url)
+        
+        # 본문: 선택자로 찾았으면 길이를 품질로, 텍스트 밀도(legacy는 p/div/body) 대체 전략이면 학습된 선택자의 실패로 기록
+        # (아무것도 못 찾은 경우는 JS 렌더링 전 페이지일 수 있으므로 기록하지 않음)
+        if strategy == 'selector':
+            quality = min(1.0, len(extraction['content'] or '') / 1000)
+            self.selector_stats.record(domain, 'content', extraction['selector'], quality)
+        elif strategy != 'none':
+            self.selector_stats.record(domain, 'content', None)
+        
+        if 'title_selector' in extraction:
+            title_selector = extraction['title_selector']
+            self.selector_stats.record(
+                domain, 'title', title_selector if title_selector in self.title_selectors else None
+            )
+
+    def _in_page_script_args(self, url: Optional[str] = None) -> Dict[str, Any]:
+        """페이지 내 추출 스크립트에 넘길 선택자 목록 (url이 있으면 도메인별 학습 순서)"""
+        return {
+            'titleSelectors': self._selector_order(url, 'title'),
+            'contentSelectors': self._selector_order(url, 'content'),
+            'authorSelectors': self.author_selectors,
+            'dateSelectors': self.date_selectors,
+            'density': DENSITY_SCRIPT_ARGS
+        }
+
+    def _finish_in_page_extraction(self, raw: Dict[str, Any], started: float) -> Dict[str, Any]:
+        """페이지 내 스크립트 결과 정리"""
+        content = raw.get('content') or ''
+        return {
+            'mode': 'script',
+            'title': raw.get('title') or "제목을 찾을 수 없습니다",
+            'title_selector': raw.get('titleSelector'),
+            'content': self._clean_text(content) if content else '',
+            'metadata': raw.get('metadata') or {},
+            'strategy': raw.get('strategy', 'none'),
+            'selector': raw.get('selector'),
+            'elapsed_ms': round((time.perf_counter() - started) * 1000, 1)
+        }
+
+    def _extract_in_page(self, page, url: Optional[str] = None) -> Dict[str, Any]:
+        """제목/본문/메타데이터를 page.evaluate 한 번으로 추출"""
+        started = time.perf_counter()
+        raw = page.evaluate(IN_PAGE_EXTRACT_SCRIPT, self._in_page_script_args(url))
+        return self._finish_in_page_extraction(raw, started)
+
+    def _extract_legacy(self, page, url: Optional[str] = None) -> Dict[str, Any]:
+        """선택자별 조회 방식 추출 (비교용)"""
+        started = time.perf_counter()
+        title = self._extract_title_legacy(page)
+        content, strategy, selector = self._extract_content_legacy(page, self._selector_order(url, 'content'))
+        metadata = self._extract_metadata_legacy(page)
+        return {
+            'mode': 'legacy',
+            'title': title,
+            'content': content,
+            'metadata': metadata,
+            'strategy': strategy,
+            'selector': selector,
+            'elapsed_ms': round((time.perf_counter() - started) * 1000, 1)
+        }
+
+    def _extract_title_legacy(self, page) -> str:
+        """제목 추출 (선택자별 조회)"""
         for selector in self.title_selectors:
             try:
                 element = page.query_selector(selector)
@@ -255,15 +728,16 @@ class NewsScraper:
             
         return "제목을 찾을 수 없습니다"
 
-    def _extract_content(self, page) -> str:
-        """본문 추출"""
-        print("콘텐츠 추출 시작...")
+    def _extract_content_legacy(self, page, selectors=None):
+        """본문 추출 (선택자별 조회) - (본문, 전략, 선택자) 반환"""
+        logger.debug("콘텐츠 추출 시작...")
+        selectors = selectors or self.content_selectors
         
-        for i, selector in enumerate(self.content_selectors):
+        for i, selector in enumerate(selectors):
             try:
-                print(f"선택자 {i+1}/{len(self.content_selectors)} 시도: {selector}")
+                logger.debug("선택자 %s/%s 시도: %s", i+1, len(selectors), selector)
                 elements = page.query_selector_all(selector)
-                print(f"  - 찾은 요소 수: {len(elements)}")
+                logger.debug("  - 찾은 요소 수: %s", len(elements))
                 
                 if elements:
                     content_parts = []
@@ -272,25 +746,25 @@ class NewsScraper:
                             text = element.inner_text().strip()
                             if text and len(text) > 50:  # 최소 50자 이상
                                 content_parts.append(text)
-                                print(f"  - 요소 {j+1}: {len(text)}자 텍스트 추출")
+                                logger.debug("  - 요소 %s: %s자 텍스트 추출", j+1, len(text))
                         except Exception as e:
-                            print(f"  - 요소 {j+1} 추출 실패: {e}")
+                            logger.debug("  - 요소 %s 추출 실패: %s", j+1, e)
                             continue
                     
                     if content_parts:
                         full_content = '\n\n'.join(content_parts)
                         # 텍스트 정리
                         full_content = self._clean_text(full_content)
-                        print(f"  - 정리 후 총 길이: {len(full_content)}자")
+                        logger.debug("  - 정리 후 총 길이: %s자", len(full_content))
                         if len(full_content) > 50:  # 최종 검증
-                            print(f"선택자 '{selector}'로 콘텐츠 추출 성공!")
-                            return full_content
+                            logger.debug("선택자 '%s'로 콘텐츠 추출 성공!", selector)
+                            return full_content, 'selector', selector
                         else:
-                            print(f"  - 콘텐츠가 너무 짧음: {len(full_content)}자")
+                            logger.debug("  - 콘텐츠가 너무 짧음: %s자", len(full_content))
                 else:
-                    print(f"  - 요소를 찾지 못함")
+                    logger.debug("  - 요소를 찾지 못함")
             except Exception as e:
-                print(f"  - 선택자 '{selector}' 오류: {e}")
+                logger.debug("  - 선택자 '%s' 오류: %s", selector, e)
                 continue
         
         # 기본 콘텐츠 선택자가 실패한 경우 일반적인 태그들 시도
@@ -311,10 +785,10 @@ class NewsScraper:
                     full_content = '\n\n'.join(content_parts)
                     full_content = self._clean_text(full_content)
                     if len(full_content) > 50:
-                        print(f"p 태그에서 콘텐츠 추출 성공: {len(full_content)}자")
-                        return full_content
+                        logger.debug("p 태그에서 콘텐츠 추출 성공: %s자", len(full_content))
+                        return full_content, 'p', 'p'
         except Exception as e:
-            print(f"p 태그 추출 오류: {e}")
+            logger.debug("p 태그 추출 오류: %s", e)
         
         # div 태그에서도 시도
         try:
@@ -334,10 +808,10 @@ class NewsScraper:
                     longest_content = max(content_parts, key=len)
                     longest_content = self._clean_text(longest_content)
                     if len(longest_content) > 100:
-                        print(f"div 태그에서 콘텐츠 추출 성공: {len(longest_content)}자")
-                        return longest_content
+                        logger.debug("div 태그에서 콘텐츠 추출 성공: %s자", len(longest_content))
+                        return longest_content, 'div', 'div'
         except Exception as e:
-            print(f"div 태그 추출 오류: {e}")
+            logger.debug("div 태그 추출 오류: %s", e)
         
         # 전체 페이지 텍스트에서 추출 시도
         try:
@@ -346,122 +820,27 @@ class NewsScraper:
                 full_text = body_text.inner_text()
                 full_text = self._clean_text(full_text)
                 if len(full_text) > 200:
-                    print(f"body에서 콘텐츠 추출 성공: {len(full_text)}자")
-                    return full_text
+                    logger.debug("body에서 콘텐츠 추출 성공: %s자", len(full_text))
+                    return full_text, 'body', 'body'
         except Exception as e:
-            print(f"body 추출 오류: {e}")
-        
-        return ""
-
-    def _extract_title_from_soup(self, soup) -> str:
-        """BeautifulSoup을 사용한 제목 추출"""
-        for selector in self.title_selectors:
-            try:
-                element = soup.select_one(selector)
-                if element:
-                    title = element.get_text().strip()
-                    if title and len(title) > 10:
-                        return title
-            except:
-                continue
-        
-        # 메타 태그에서 제목 추출
-        try:
-            meta_title = soup.find('meta', property='og:title')
-            if meta_title:
-                return meta_title.get('content', '').strip()
-        except:
-            pass
-            
-        return "제목을 찾을 수 없습니다"
-
-    def _extract_content_from_soup(self, soup) -> str:
-        """BeautifulSoup을 사용한 본문 추출"""
-        for selector in self.content_selectors:
-            try:
-                elements = soup.select(selector)
-                if elements:
-                    content_parts = []
-                    for element in elements:
-                        text = element.get_text().strip()
-                        if text and len(text) > 50:
-                            content_parts.append(text)
-                    
-                    if content_parts:
-                        full_content = '\n\n'.join(content_parts)
-                        full_content = self._clean_text(full_content)
-                        if len(full_content) > 50:
-                            return full_content
-            except:
-                continue
-        
-        # p 태그들에서 텍스트 추출
-        try:
-            paragraphs = soup.find_all('p')
-            if paragraphs:
-                content_parts = []
-                for p in paragraphs:
-                    text = p.get_text().strip()
-                    if text and len(text) > 30:
-                        content_parts.append(text)
-                
-                if content_parts:
-                    full_content = '\n\n'.join(content_parts)
-                    full_content = self._clean_text(full_content)
-                    if len(full_content) > 50:
-                        return full_content
-        except:
-            pass
+            logger.debug("body 추출 오류: %s", e)
         
-        return ""
+        return "", 'none', None
 
-    def _extract_metadata_from_soup(self, soup) -> Dict[str, str]:
-        """BeautifulSoup을 사용한 메타데이터 추출"""
+    def _extract_metadata_legacy(self, page) -> Dict[str, str]:
+        """메타데이터 추출 (선택자별 조회)"""
         metadata = {}
         
         try:
             # 작성자
-            author_selectors = ['.author', '.byline', '.writer', '[data-testid="author"]']
-            for selector in author_selectors:
-                element = soup.select_one(selector)
-                if element:
-                    metadata['author'] = element.get_text().strip()
-                    break
-            
-            # 발행일
-            date_selectors = ['.date', '.published', '.timestamp', '[data-testid="date"]']
-            for selector in date_selectors:
-                element = soup.select_one(selector)
-                if element:
-                    metadata['published_date'] = element.get_text().strip()
-                    break
-            
-            # 이미지
-            img_element = soup.find('img')
-            if img_element:
-                metadata['image_url'] = img_element.get('src', '')
-                
-        except:
-            pass
-            
-        return metadata
-
-    def _extract_metadata(self, page) -> Dict[str, str]:
-        """메타데이터 추출"""
-        metadata = {}
-        
-        try:
-            # 작성자
-            author_selectors = ['.author', '.byline', '.writer', '[data-testid="author"]']
-            for selector in author_selectors:
+            for selector in self.author_selectors:
                 element = page.query_selector(selector)
                 if element:
                     metadata['author'] = element.inner_text().strip()
                     break
             
             # 발행일
-            date_selectors = ['.date', '.published', '.timestamp', '[data-testid="date"]']
-            for selector in date_selectors:
+            for selector in self.date_selectors:
                 element = page.query_selector(selector)
                 if element:
                     metadata['published_date'] = element.inner_text().strip()
@@ -479,16 +858,7 @@ class NewsScraper:
 
     def _clean_text(self, text: str) -> str:
         """텍스트 정리"""
-        # 불필요한 공백 제거
-        text = re.sub(r'\s+', ' ', text)
-        
-        # 특수 문자 정리
-        text = re.sub(r'[^\w\s.,!?;:()\-"\']', '', text)
-        
-        # 연속된 줄바꿈 제거
-        text = re.sub(r'\n\s*\n', '\n\n', text)
-        
-        return text.strip()
+        return clean_text(text)
 
 # 사용 예시
 if __name__ == "__main__":
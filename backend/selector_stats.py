@@ -0,0 +1,253 @@
+import logging
+import os
+import sqlite3
+import threading
+import time
+from urllib.parse import urlsplit
+from typing import Optional, Dict, Any, List, Tuple
+
+from cache import cache_db_path
+
+logger = logging.getLogger(__name__)
+
+
+def selector_domain(url: str) -> str:
+    """선택자 통계를 묶을 도메인 (www. 제거)"""
+    host = (urlsplit(url).hostname or '').lower()
+    return host[4:] if host.startswith('www.') else host
+
+
+class SelectorStats:
+    """도메인별로 어떤 선택자가 추출에 성공했는지 학습해서 선택자 순서를 정함
+
+    선택자마다 성공할 때 결과 품질(0~1)만큼 점수를 더하고, 점수는 half_life 초마다
+    절반으로 줄어든다. 학습된 선택자가 실패하면 점수를 절반으로 깎으므로 사이트
+    개편 후에는 새 선택자가 금방 앞으로 온다.
+
+    db_path가 있으면 SQLite가 기준 데이터다. 변경은 증분 UPSERT로 기록해서 여러 워커
+    프로세스가 동시에 기록해도 서로 덮어쓰지 않고, 프로세스마다 들고 있는 사본은
+    refresh 초가 지나면 다시 읽어서 다른 워커가 학습한 내용도 반영한다.
+    """
+
+    def __init__(self, db_path: Optional[str] = None, half_life: Optional[float] = None,
+                 min_score: Optional[float] = None, refresh: Optional[float] = None):
+        self.half_life = half_life or float(os.getenv('SELECTOR_STATS_HALF_LIFE', str(7 * 24 * 3600)))
+        self.min_score = min_score or float(os.getenv('SELECTOR_MIN_SCORE', '0.5'))
+        # DB에서 다시 읽기 전까지 사본을 쓰는 시간(초)
+        self.refresh = refresh if refresh is not None else float(os.getenv('SELECTOR_STATS_REFRESH', '10'))
+
+        # (도메인, 종류) → {선택자: [점수, 갱신 시각, 성공 횟수]}
+        self._scores: Dict[Tuple[str, str], Dict[str, List[float]]] = {}
+        # (도메인, 종류) → [학습된 선택자가 있던 추출 수, 그 선택자가 맞은 수]
+        self._lookups: Dict[Tuple[str, str], List[int]] = {}
+        # (도메인, 종류) → DB에서 읽은 시각
+        self._loaded_at: Dict[Tuple[str, str], float] = {}
+        self._lock = threading.Lock()
+
+        self._db = None
+        if db_path:
+            try:
+                self._db = sqlite3.connect(db_path, check_same_thread=False, timeout=10)
+                self._db.execute('PRAGMA journal_mode=WAL')
+                # UPSERT 안에서 감쇠를 계산 (점수, 경과 초) → 감쇠된 점수
+                self._db.create_function('decay', 2, self._decay_score, deterministic=True)
+                self._db.execute(
+                    'CREATE TABLE IF NOT EXISTS selector_stats ('
+                    ' domain TEXT NOT NULL, kind TEXT NOT NULL, selector TEXT NOT NULL,'
+                    ' score REAL NOT NULL, updated_at REAL NOT NULL, successes INTEGER NOT NULL,'
+                    ' PRIMARY KEY (domain, kind, selector))'
+                )
+                self._db.execute(
+                    'CREATE TABLE IF NOT EXISTS selector_lookups ('
+                    ' domain TEXT NOT NULL, kind TEXT NOT NULL, lookups INTEGER NOT NULL,'
+                    ' hits INTEGER NOT NULL, PRIMARY KEY (domain, kind))'
+                )
+                self._db.commit()
+            except sqlite3.Error as e:
+                logger.warning("선택자 통계 DB 초기화 실패 (%s): %s", db_path, e)
+                self._db = None
+
+    def order(self, domain: str, kind: str, selectors: List[str]) -> List[str]:
+        """학습된 선택자를 점수 순으로 앞에 두고 나머지는 원래 순서대로"""
+        now = time.time()
+        with self._lock:
+            scores = self._domain_scores(domain, kind)
+            learned = sorted(
+                (
+                    (self._decayed(entry, now), selector)
+                    for selector, entry in scores.items()
+                    if selector in selectors
+                ),
+                reverse=True
+            )
+        preferred = [selector for score, selector in learned if score >= self.min_score]
+        if not preferred:
+            return selectors
+        return preferred + [selector for selector in selectors if selector not in preferred]
+
+    def record(self, domain: str, kind: str, selector: Optional[str], quality: float = 1.0):
+        """추출 결과 기록 (selector가 None이면 어떤 선택자로도 찾지 못한 것)"""
+        now = time.time()
+        quality = max(0.0, min(quality, 1.0))
+        with self._lock:
+            scores = self._domain_scores(domain, kind)
+            best = self._best(scores, now)
+            missed = best is not None and best != selector
+
+            # 이 프로세스의 사본에도 바로 반영 (DB에는 같은 변경을 증분으로 기록)
+            if best is not None:
+                # 학습된 선택자가 있었던 추출의 적중 여부
+                counts = self._lookups.setdefault((domain, kind), [0, 0])
+                counts[0] += 1
+                if not missed:
+                    counts[1] += 1
+                else:
+                    entry = scores[best]
+                    entry[0] = self._decayed(entry, now) / 2
+                    entry[1] = now
+
+            if selector is not None:
+                entry = scores.setdefault(selector, [0.0, now, 0])
+                entry[0] = self._decayed(entry, now) + quality
+                entry[1] = now
+                entry[2] += 1
+
+            if self._db is not None and (selector is not None or best is not None):
+                self._db_record(domain, kind, best, missed, selector, quality, now)
+
+    def stats(self, domain: Optional[str] = None) -> Dict[str, Any]:
+        """학습된 선택자 적중률 (domain을 주면 해당 도메인의 선택자별 점수 포함)"""
+        now = time.time()
+        with self._lock:
+            if domain is not None:
+                for kind in ('content', 'title'):
+                    self._domain_scores(domain, kind)
+            totals = [0, 0]
+            domains: Dict[str, Dict[str, Any]] = {}
+            for (name, kind), (lookups, hits) in self._all_lookups().items():
+                totals[0] += lookups
+                totals[1] += hits
+                if domain is None or name == domain:
+                    domains.setdefault(name, {})[kind] = {
+                        'lookups': lookups,
+                        'hits': hits,
+                        'hit_rate': round(hits / lookups, 3) if lookups else None
+                    }
+
+            data = {
+                'half_life': self.half_life,
+                'persistent': self._db is not None,
+                'lookups': totals[0],
+                'hits': totals[1],
+                'hit_rate': round(totals[1] / totals[0], 3) if totals[0] else None,
+                'domains': domains
+            }
+            if domain is not None:
+                data['selectors'] = {
+                    kind: sorted(
+                        (
+                            {
+                                'selector': selector,
+                                'score': round(self._decayed(entry, now), 3),
+                                'successes': entry[2]
+                            }
+                            for selector, entry in self._scores.get((domain, kind), {}).items()
+                        ),
+                        key=lambda item: item['score'],
+                        reverse=True
+                    )
+                    for kind in ('content', 'title')
+                }
+            return data
+
+    def _decayed(self, entry: List[float], now: float) -> float:
+        return self._decay_score(entry[0], now - entry[1])
+
+    def _decay_score(self, score: float, elapsed: float) -> float:
+        return score * 0.5 ** (max(0.0, elapsed) / self.half_life)
+
+    def _best(self, scores: Dict[str, List[float]], now: float) -> Optional[str]:
+        best, best_score = None, self.min_score
+        for selector, entry in scores.items():
+            score = self._decayed(entry, now)
+            if score >= best_score:
+                best, best_score = selector, score
+        return best
+
+    def _domain_scores(self, domain: str, kind: str) -> Dict[str, List[float]]:
+        """도메인 통계 (DB가 있으면 refresh 초마다 다시 읽음, 잠금을 잡은 상태에서 호출)"""
+        key = (domain, kind)
+        if self._db is not None:
+            now = time.monotonic()
+            loaded_at = self._loaded_at.get(key)
+            if loaded_at is None or now - loaded_at >= self.refresh:
+                self._loaded_at[key] = now
+                self._db_load(domain, kind)
+        return self._scores.setdefault(key, {})
+
+    def _all_lookups(self) -> Dict[Tuple[str, str], List[int]]:
+        """모든 도메인의 적중 횟수 (DB가 있으면 모든 워커의 합계, 잠금을 잡은 상태에서 호출)"""
+        if self._db is None:
+            return self._lookups
+        try:
+            rows = self._db.execute('SELECT domain, kind, lookups, hits FROM selector_lookups').fetchall()
+        except sqlite3.Error as e:
+            logger.warning("선택자 통계 조회 실패: %s", e)
+            return self._lookups
+        return {(domain, kind): [lookups, hits] for domain, kind, lookups, hits in rows}
+
+    def _db_load(self, domain: str, kind: str):
+        try:
+            rows = self._db.execute(
+                'SELECT selector, score, updated_at, successes FROM selector_stats WHERE domain = ? AND kind = ?',
+                (domain, kind)
+            ).fetchall()
+            lookups = self._db.execute(
+                'SELECT lookups, hits FROM selector_lookups WHERE domain = ? AND kind = ?',
+                (domain, kind)
+            ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning("선택자 통계 조회 실패: %s", e)
+            return
+        self._scores[(domain, kind)] = {
+            selector: [score, updated_at, successes] for selector, score, updated_at, successes in rows
+        }
+        self._lookups[(domain, kind)] = list(lookups) if lookups is not None else [0, 0]
+
+    def _db_record(self, domain: str, kind: str, best: Optional[str], missed: bool,
+                   selector: Optional[str], quality: float, now: float):
+        """변경을 증분으로 기록 (감쇠/합산은 DB에 있는 최신 값 기준)"""
+        try:
+            if best is not None:
+                self._db.execute(
+                    'INSERT INTO selector_lookups (domain, kind, lookups, hits) VALUES (?, ?, 1, ?)'
+                    ' ON CONFLICT (domain, kind) DO UPDATE SET'
+                    ' lookups = lookups + 1, hits = hits + excluded.hits',
+                    (domain, kind, 0 if missed else 1)
+                )
+            if missed:
+                self._db.execute(
+                    'UPDATE selector_stats SET score = decay(score, ? - updated_at) / 2, updated_at = ?'
+                    ' WHERE domain = ? AND kind = ? AND selector = ?',
+                    (now, now, domain, kind, best)
+                )
+            if selector is not None:
+                self._db.execute(
+                    'INSERT INTO selector_stats (domain, kind, selector, score, updated_at, successes)'
+                    ' VALUES (?, ?, ?, ?, ?, 1)'
+                    ' ON CONFLICT (domain, kind, selector) DO UPDATE SET'
+                    ' score = decay(score, excluded.updated_at - updated_at) + excluded.score,'
+                    ' updated_at = excluded.updated_at, successes = successes + 1',
+                    (domain, kind, selector, quality, now)
+                )
+            self._db.commit()
+        except sqlite3.Error as e:
+            self._db.rollback()
+            logger.warning("선택자 통계 저장 실패: %s", e)
+
+
+def create_selector_stats() -> Optional[SelectorStats]:
+    """환경변수 설정에 따른 선택자 통계 (ADAPTIVE_SELECTORS=false 이면 None)"""
+    if os.getenv('ADAPTIVE_SELECTORS', 'true').lower() != 'true':
+        return None
+    return SelectorStats(db_path=cache_db_path())
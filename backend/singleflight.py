@@ -0,0 +1,97 @@
+import logging
+import os
+import threading
+from typing import Optional, Dict, Any, Callable, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class _Call:
+    """진행 중인 호출 하나 (리더가 결과를 채우고 done을 알림)"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value: Any = None
+        self.error: Optional[Exception] = None
+        self.cancelled = False
+
+
+class SingleFlight:
+    """같은 키로 동시에 들어온 호출을 하나로 합침 (single-flight)
+
+    먼저 들어온 호출(리더)만 fn을 실행하고, 나머지(팔로워)는 리더의 결과를 기다려
+    그대로 받는다. 결과는 보관하지 않으므로 리더가 끝난 뒤 들어온 호출은 다시 실행한다.
+    - 리더가 예외를 던지면 기다리던 팔로워도 같은 예외를 받는다 (실패는 캐시하지 않음)
+    - 리더가 중단되면(GeneratorExit, KeyboardInterrupt 등) 팔로워 중 하나가 새 리더가 된다
+    - 팔로워가 timeout 초 안에 결과를 받지 못하면 기다리지 않고 직접 실행한다
+    """
+
+    def __init__(self, name: str, timeout: Optional[float] = None):
+        self.name = name
+        self.timeout = timeout if timeout is not None else float(os.getenv('COALESCE_TIMEOUT', '120'))
+        self._calls: Dict[str, _Call] = {}
+        self._lock = threading.Lock()
+        self._leaders = 0
+        self._coalesced = 0
+        self._timeouts = 0
+        self._retries = 0
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Tuple[Any, bool]:
+        """(결과, 다른 호출의 결과를 공유받았는지) 반환"""
+        while True:
+            with self._lock:
+                call = self._calls.get(key)
+                leader = call is None
+                if leader:
+                    call = _Call()
+                    self._calls[key] = call
+                    self._leaders += 1
+
+            if leader:
+                return self._lead(key, call, fn), False
+
+            if not call.done.wait(self.timeout):
+                # 리더가 너무 오래 걸리면 더 기다리지 않고 직접 실행
+                with self._lock:
+                    self._timeouts += 1
+                logger.warning("요청 합치기 대기 시간 초과 (%s), 직접 실행", self.name)
+                return fn(), False
+
+            if call.cancelled:
+                # 리더가 중단됨 - 다시 시도해서 새 리더를 정함
+                with self._lock:
+                    self._retries += 1
+                continue
+
+            with self._lock:
+                self._coalesced += 1
+            if call.error is not None:
+                raise call.error
+            return call.value, True
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'name': self.name,
+                'in_flight': len(self._calls),
+                'leaders': self._leaders,
+                'coalesced': self._coalesced,
+                'timeouts': self._timeouts,
+                'retries': self._retries
+            }
+
+    def _lead(self, key: str, call: _Call, fn: Callable[[], Any]) -> Any:
+        try:
+            call.value = fn()
+            return call.value
+        except Exception as e:
+            call.error = e
+            raise
+        except BaseException:
+            call.cancelled = True
+            raise
+        finally:
+            with self._lock:
+                if self._calls.get(key) is call:
+                    del self._calls[key]
+            call.done.set()
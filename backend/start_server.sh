@@ -39,6 +39,11 @@ EOF
     echo "📝 .env 파일이 생성되었습니다. OpenAI API 키만 설정하면 됩니다!"
 fi
 
-# 서버 실행
-echo "🎯 서버를 실행합니다..."
+# 서버 실행 (./start_server.sh prod 이면 gunicorn 멀티 워커)
+if [ "$1" == "prod" ]; then
+    echo "🎯 운영 서버(gunicorn)를 실행합니다..."
+    exec gunicorn -c gunicorn.conf.py wsgi:app
+fi
+
+echo "🎯 개발 서버를 실행합니다..."
 python app.py
\ No newline at end of file
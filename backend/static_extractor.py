@@ -0,0 +1,493 @@
+from bs4 import UnicodeDammit
+import lxml.html
+import re
+from typing import Optional, Dict, Any, List, Tuple
+
+# _clean_text 정규식 (모듈 로드 시 한 번만 컴파일)
+WHITESPACE_RE = re.compile(r'\s+')
+SPECIAL_CHARS_RE = re.compile(r'[^\w\s.,!?;:()\-"\']')
+
+# BeautifulSoup.get_text()가 본문 텍스트로 취급하지 않는 태그
+# (script/style/template 안의 문자열과 루비 주석은 제외된다)
+NON_TEXT_TAGS = frozenset(['script', 'style', 'template', 'rt', 'rp'])
+
+XML_DECLARATION_RE = re.compile(r'^\s*<\?xml[^>]*\?>')
+
+# 텍스트 밀도 추출기: 본문이 아닌 영역으로 보고 하위 트리를 통째로 건너뛰는 태그
+BOILERPLATE_TAGS = frozenset(['nav', 'header', 'footer', 'aside', 'form', 'button', 'select', 'noscript', 'iframe', 'svg'])
+# 항상 문단으로 보는 태그와, 안에 블록 요소가 없을 때만 문단으로 보는 태그
+PARAGRAPH_TAGS = frozenset(['p', 'pre'])
+LEAF_BLOCK_TAGS = frozenset(['div', 'section', 'article', 'main', 'blockquote', 'li', 'td', 'dd', 'body'])
+# 블록 여부 판단에서 무시하는 인라인 태그
+INLINE_TAGS = frozenset([
+    'a', 'abbr', 'b', 'bdi', 'br', 'cite', 'code', 'em', 'font', 'i', 'img', 'kbd', 'mark', 'q',
+    's', 'small', 'span', 'strong', 'sub', 'sup', 'time', 'u', 'wbr'
+])
+# class/id 이름으로 본문/군더더기 영역 가중치
+NEGATIVE_NAME_RE = re.compile(
+    r'comment|footer|footnote|nav|menu|sidebar|related|recommend|share|social|promo|sponsor|'
+    r'advert|\bads?\b|ad-|banner|subscribe|newsletter|popup|modal|cookie|breadcrumb|widget|tags?\b',
+    re.IGNORECASE
+)
+POSITIVE_NAME_RE = re.compile(r'article|content|story|body|post|entry|text|main', re.IGNORECASE)
+# 문단 최소 길이(문자)와 링크 텍스트 비율 상한
+MIN_PARAGRAPH_CHARS = 25
+MAX_PARAGRAPH_LINK_DENSITY = 0.5
+
+# 선택자 토큰: 태그, .클래스, #아이디, [속성] / [속성="값"], 결합자
+_SELECTOR_TOKEN_RE = re.compile(r'''
+    (?P<combinator>\s*>\s*|\s+)
+  | (?P<tag>\*|[a-zA-Z][\w-]*)
+  | \.(?P<cls>[\w-]+)
+  | \#(?P<id>[\w-]+)
+  | \[\s*(?P<attr>[\w-]+)\s*(?:=\s*(?:"(?P<dq>[^"]*)"|'(?P<sq>[^']*)'|(?P<bare>[\w-]+))\s*)?\]
+''', re.VERBOSE)
+
+
+def clean_text(text: str) -> str:
+    """텍스트 정리 (NewsScraper._clean_text와 동일한 결과)"""
+    # 불필요한 공백 제거 (줄바꿈도 함께 접히므로 연속 줄바꿈 정리는 따로 필요 없음)
+    text = WHITESPACE_RE.sub(' ', text)
+
+    # 특수 문자 정리
+    text = SPECIAL_CHARS_RE.sub('', text)
+
+    return text.strip()
+
+
+def element_text(element) -> str:
+    """BeautifulSoup의 get_text()와 같은 규칙으로 요소 텍스트 수집"""
+    parts = []
+    stack = [element]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            parts.append(item)
+            continue
+
+        # 주석/처리 명령은 tag가 문자열이 아님 (tail은 부모가 이미 넣어 둠)
+        if not isinstance(item.tag, str) or item.tag in NON_TEXT_TAGS:
+            continue
+
+        if item.text:
+            parts.append(item.text)
+        for child in reversed(item):
+            if child.tail:
+                stack.append(child.tail)
+            stack.append(child)
+    return ''.join(parts)
+
+
+# 페이지 내 추출 스크립트의 텍스트 밀도 추출기에 넘길 규칙 (두 구현이 같은 기준을 쓰도록)
+DENSITY_SCRIPT_ARGS = {
+    'skipTags': sorted(NON_TEXT_TAGS | BOILERPLATE_TAGS),
+    'paragraphTags': sorted(PARAGRAPH_TAGS),
+    'leafTags': sorted(LEAF_BLOCK_TAGS),
+    'inlineTags': sorted(INLINE_TAGS),
+    'negative': NEGATIVE_NAME_RE.pattern,
+    'positive': POSITIVE_NAME_RE.pattern,
+    'minParagraphChars': MIN_PARAGRAPH_CHARS,
+    'maxLinkDensity': MAX_PARAGRAPH_LINK_DENSITY
+}
+
+
+def _name_weight(element) -> float:
+    """class/id 이름에 따른 가중치 (군더더기 0, 본문 1.5, 그 외 1)"""
+    names = (element.get('class') or '') + ' ' + (element.get('id') or '')
+    if not names.strip():
+        return 1.0
+    positive = POSITIVE_NAME_RE.search(names)
+    if NEGATIVE_NAME_RE.search(names) and not positive:
+        return 0.0
+    return 1.5 if positive else 1.0
+
+
+def extract_by_density(root) -> str:
+    """선택자 없이 텍스트 밀도로 본문 블록을 찾아 문단 텍스트 반환 (못 찾으면 빈 문자열)
+
+    트리를 한 번만 후위 순회하면서 요소마다 텍스트 길이, 링크 텍스트 길이, 하위 문단을
+    누적한다. 링크 비율이 낮은 문단은 부모에 점수 전체, 조부모에 절반을 더하고
+    (<br>로 나뉜 텍스트 블록은 줄바꿈 두 개마다 문단 하나로 친다),
+    점수 × (1 - 링크 비율) × class/id 가중치가 가장 높은 블록의 문단들을 본문으로 쓴다.
+    nav/footer/aside 등과 군더더기 이름(comment, related, share...)의 하위 트리는 건너뛴다.
+    """
+    paragraphs = []
+    # 요소별 누적값: [텍스트 길이, 링크 텍스트 길이, 점수, 블록 자식 여부, 첫 문단 번호, br 자식 수, 이름 가중치]
+    frames = [[0, 0, 0.0, False, 0, 0, 1.0]]
+    best = (0.0, 0, 0)
+    stack = [(root, False)]
+
+    while stack:
+        element, exiting = stack.pop()
+        if exiting:
+            frame = frames.pop()
+            text_len, link_len, score, has_blocks, first, breaks, weight = frame
+            parent = frames[-1]
+            tag = element.tag
+            if tag == 'a':
+                link_len = text_len
+
+            is_paragraph = tag in PARAGRAPH_TAGS or (tag in LEAF_BLOCK_TAGS and not has_blocks)
+            if (is_paragraph and text_len >= MIN_PARAGRAPH_CHARS
+                    and link_len <= text_len * MAX_PARAGRAPH_LINK_DENSITY):
+                paragraphs.append(element)
+                segments = 1 + breaks / 2
+                paragraph_score = segments + min(text_len / 100, 3 * segments)
+                parent[2] += paragraph_score
+                if len(frames) > 1:
+                    frames[-2][2] += paragraph_score / 2
+
+            if score and text_len:
+                candidate = score * (1 - link_len / text_len) * weight
+                if candidate > best[0]:
+                    best = (candidate, first, len(paragraphs))
+
+            parent[0] += text_len
+            parent[1] += link_len
+            if tag == 'br':
+                parent[5] += 1
+            elif tag not in INLINE_TAGS:
+                parent[3] = True
+            if element.tail:
+                parent[0] += len(element.tail.strip())
+            continue
+
+        tag = element.tag
+        weight = 0.0
+        if isinstance(tag, str) and tag not in NON_TEXT_TAGS and tag not in BOILERPLATE_TAGS:
+            weight = _name_weight(element) if element.attrib else 1.0
+        if weight == 0.0:
+            # 건너뛰는 요소도 뒤따르는 텍스트(tail)는 부모의 것
+            if element.tail:
+                frames[-1][0] += len(element.tail.strip())
+            continue
+
+        frames.append([len(element.text.strip()) if element.text else 0, 0, 0.0, False, len(paragraphs), 0, weight])
+        stack.append((element, True))
+        for child in reversed(element):
+            stack.append((child, False))
+
+    _, first, last = best
+    parts = [element_text(paragraph).strip() for paragraph in paragraphs[first:last]]
+    return clean_text('\n\n'.join(part for part in parts if part))
+
+
+class _Compound:
+    """결합자 사이의 단순 선택자 하나 (예: article, .content, meta[property="og:title"])"""
+
+    __slots__ = ('tag', 'classes', 'element_id', 'attrs')
+
+    def __init__(self):
+        self.tag = None
+        self.classes = []
+        self.element_id = None
+        self.attrs = []
+
+    def index_key(self) -> Tuple[str, Optional[str]]:
+        """단일 트리 순회에서 후보를 빠르게 고르기 위한 색인 키"""
+        if self.element_id:
+            return ('id', self.element_id)
+        if self.classes:
+            return ('class', self.classes[0])
+        if self.tag:
+            return ('tag', self.tag)
+        if self.attrs:
+            return ('attr', self.attrs[0][0])
+        return ('*', None)
+
+    def matches(self, element) -> bool:
+        if self.tag and element.tag != self.tag:
+            return False
+        if self.element_id and element.get('id') != self.element_id:
+            return False
+        if self.classes:
+            element_classes = (element.get('class') or '').split()
+            for cls in self.classes:
+                if cls not in element_classes:
+                    return False
+        for name, value in self.attrs:
+            actual = element.get(name)
+            if actual is None or (value is not None and actual != value):
+                return False
+        return True
+
+
+class _CompiledSelector:
+    """결합자로 연결된 단순 선택자 목록 (오른쪽부터 매칭)"""
+
+    __slots__ = ('compounds', 'combinators')
+
+    def __init__(self, compounds: List[_Compound], combinators: List[str]):
+        self.compounds = compounds
+        self.combinators = combinators  # combinators[i]는 compounds[i-1]과 compounds[i] 사이
+
+    def matches(self, element) -> bool:
+        return self._matches_at(element, len(self.compounds) - 1)
+
+    def _matches_at(self, element, i: int) -> bool:
+        if not self.compounds[i].matches(element):
+            return False
+        if i == 0:
+            return True
+
+        parent = element.getparent()
+        if self.combinators[i] == '>':
+            return parent is not None and self._matches_at(parent, i - 1)
+
+        while parent is not None:
+            if self._matches_at(parent, i - 1):
+                return True
+            parent = parent.getparent()
+        return False
+
+
+def compile_selector(selector: str) -> List[_CompiledSelector]:
+    """CSS 선택자를 컴파일 (쉼표로 구분된 목록은 여러 개로 분리)"""
+    compiled = []
+    for alternative in selector.split(','):
+        alternative = alternative.strip()
+        compounds = [_Compound()]
+        combinators = [None]
+        pos = 0
+        while pos < len(alternative):
+            match = _SELECTOR_TOKEN_RE.match(alternative, pos)
+            if not match:
+                raise ValueError(f'지원하지 않는 선택자입니다: {selector}')
+            pos = match.end()
+
+            current = compounds[-1]
+            if match.group('combinator') is not None:
+                compounds.append(_Compound())
+                combinators.append('>' if '>' in match.group('combinator') else ' ')
+            elif match.group('tag'):
+                current.tag = None if match.group('tag') == '*' else match.group('tag').lower()
+            elif match.group('cls'):
+                current.classes.append(match.group('cls'))
+            elif match.group('id'):
+                current.element_id = match.group('id')
+            elif match.group('attr'):
+                value = match.group('dq')
+                if value is None:
+                    value = match.group('sq')
+                if value is None:
+                    value = match.group('bare')
+                current.attrs.append((match.group('attr').lower(), value))
+        compiled.append(_CompiledSelector(compounds, combinators))
+    return compiled
+
+
+class SelectorPlan:
+    """여러 선택자 목록을 한 번의 트리 순회로 평가하는 실행 계획
+
+    중복 선택자는 처음 나온 순서만 남기고, 각 선택자의 마지막 단순 선택자를
+    태그/클래스/아이디/속성별로 색인해 요소마다 해당 후보만 검사한다.
+    """
+
+    def __init__(self, groups: Dict[str, List[str]]):
+        self.groups: Dict[str, List[str]] = {}
+        self._index: Dict[Tuple[str, Optional[str]], List[Tuple[int, _CompiledSelector]]] = {}
+        self._selector_ids: Dict[str, int] = {}
+
+        for name, selectors in groups.items():
+            unique = list(dict.fromkeys(selectors))
+            self.groups[name] = unique
+            for selector in unique:
+                if selector in self._selector_ids:
+                    continue
+                selector_id = len(self._selector_ids)
+                self._selector_ids[selector] = selector_id
+                for compiled in compile_selector(selector):
+                    key = compiled.compounds[-1].index_key()
+                    self._index.setdefault(key, []).append((selector_id, compiled))
+
+    def run(self, root) -> 'PlanResult':
+        """문서를 한 번 순회하며 모든 선택자의 매칭 요소를 문서 순서대로 수집"""
+        matches: List[List[Any]] = [[] for _ in self._selector_ids]
+        for element in root.iter():
+            if not isinstance(element.tag, str):
+                continue
+            for selector_id in self._match_ids(element):
+                matches[selector_id].append(element)
+        return PlanResult(self, matches)
+
+    def matches_any(self, element) -> bool:
+        """요소가 계획의 선택자 중 하나에 매칭되는지 (증분 파싱 중인 트리에도 사용)"""
+        return isinstance(element.tag, str) and bool(self._match_ids(element))
+
+    def _match_ids(self, element) -> set:
+        """요소에 매칭되는 선택자 번호 (색인에서 해당 요소의 후보만 검사)"""
+        index = self._index
+        candidates = []
+        entries = index.get(('tag', element.tag))
+        if entries:
+            candidates.extend(entries)
+        attrib = element.attrib
+        if attrib:
+            class_attr = attrib.get('class')
+            if class_attr:
+                for cls in class_attr.split():
+                    entries = index.get(('class', cls))
+                    if entries:
+                        candidates.extend(entries)
+            element_id = attrib.get('id')
+            if element_id:
+                entries = index.get(('id', element_id))
+                if entries:
+                    candidates.extend(entries)
+            for name in attrib:
+                entries = index.get(('attr', name))
+                if entries:
+                    candidates.extend(entries)
+        entries = index.get(('*', None))
+        if entries:
+            candidates.extend(entries)
+
+        matched = set()
+        for selector_id, compiled in candidates:
+            if selector_id in matched:
+                continue
+            if compiled.matches(element):
+                matched.add(selector_id)
+        return matched
+
+
+class PlanResult:
+    """SelectorPlan 실행 결과"""
+
+    def __init__(self, plan: SelectorPlan, matches: List[List[Any]]):
+        self.plan = plan
+        self.matches = matches
+
+    def select(self, selector: str) -> List[Any]:
+        """선택자에 매칭된 요소 목록 (문서 순서)"""
+        return self.matches[self.plan._selector_ids[selector]]
+
+    def select_one(self, selector: str):
+        elements = self.select(selector)
+        return elements[0] if elements else None
+
+
+def parse_html(html) -> Optional[Any]:
+    """HTML 바이트/문자열을 lxml 트리로 한 번만 파싱"""
+    if isinstance(html, bytes):
+        # 선언된 인코딩을 우선 사용하고, 없으면 UTF-8 → windows-1252 순으로 시도
+        html = UnicodeDammit(html, is_html=True).unicode_markup or ''
+    # lxml은 인코딩 선언이 있는 문자열을 거부하므로 제거
+    html = XML_DECLARATION_RE.sub('', html, count=1)
+    if not html.strip():
+        return None
+    try:
+        return lxml.html.document_fromstring(html)
+    except (lxml.etree.ParserError, ValueError):
+        return None
+
+
+class StaticExtractor:
+    """정적 HTML에서 제목/본문/메타데이터를 추출
+
+    lxml로 한 번 파싱하고, 제목/본문/메타데이터 선택자를 하나의 SelectorPlan으로
+    묶어 한 번의 트리 순회로 평가한다. 선택 규칙은 기존 BeautifulSoup 추출과 같다.
+    """
+
+    OG_TITLE_SELECTOR = 'meta[property="og:title"]'
+
+    def __init__(self, content_selectors: List[str], title_selectors: List[str],
+                 author_selectors: List[str], date_selectors: List[str]):
+        self.plan = SelectorPlan({
+            'title': title_selectors,
+            'content': content_selectors,
+            'author': author_selectors,
+            'date': date_selectors,
+            'fallback': [self.OG_TITLE_SELECTOR, 'img']
+        })
+
+    def extract(self, html, title_order: Optional[List[str]] = None,
+                content_order: Optional[List[str]] = None) -> Dict[str, Any]:
+        """HTML에서 추출한 결과 (title, title_selector, content, metadata, strategy, selector)
+
+        title_order/content_order로 선택자 시도 순서를 바꿀 수 있다 (계획에 있는 선택자만).
+        """
+        root = parse_html(html)
+        if root is None:
+            return {
+                'title': "제목을 찾을 수 없습니다",
+                'title_selector': None,
+                'content': '',
+                'metadata': {},
+                'strategy': 'none',
+                'selector': None
+            }
+
+        result = self.plan.run(root)
+        title, title_selector = self._extract_title(result, title_order or self.plan.groups['title'])
+        content, strategy, selector = self._extract_content(root, result, content_order or self.plan.groups['content'])
+        return {
+            'title': title,
+            'title_selector': title_selector,
+            'content': content,
+            'metadata': self._extract_metadata(result),
+            'strategy': strategy,
+            'selector': selector
+        }
+
+    def _extract_title(self, result: PlanResult, selectors: List[str]):
+        for selector in selectors:
+            element = result.select_one(selector)
+            if element is not None:
+                title = element_text(element).strip()
+                if title and len(title) > 10:
+                    return title, selector
+
+        # 메타 태그에서 제목 추출
+        meta_title = result.select_one(self.OG_TITLE_SELECTOR)
+        if meta_title is not None:
+            return (meta_title.get('content') or '').strip(), self.OG_TITLE_SELECTOR
+
+        return "제목을 찾을 수 없습니다", None
+
+    def _extract_content(self, root, result: PlanResult, selectors: List[str]):
+        for selector in selectors:
+            elements = result.select(selector)
+            if not elements:
+                continue
+            content_parts = []
+            for element in elements:
+                text = element_text(element).strip()
+                if text and len(text) > 50:
+                    content_parts.append(text)
+
+            if content_parts:
+                full_content = clean_text('\n\n'.join(content_parts))
+                if len(full_content) > 50:
+                    return full_content, 'selector', selector
+
+        # 선택자가 모두 실패하면 텍스트 밀도로 본문 블록 찾기
+        full_content = extract_by_density(root)
+        if len(full_content) > 50:
+            return full_content, 'density', 'density'
+
+        return "", 'none', None
+
+    def _extract_metadata(self, result: PlanResult) -> Dict[str, str]:
+        metadata = {}
+
+        # 작성자
+        for selector in self.plan.groups['author']:
+            element = result.select_one(selector)
+            if element is not None:
+                metadata['author'] = element_text(element).strip()
+                break
+
+        # 발행일
+        for selector in self.plan.groups['date']:
+            element = result.select_one(selector)
+            if element is not None:
+                metadata['published_date'] = element_text(element).strip()
+                break
+
+        # 이미지
+        img_element = result.select_one('img')
+        if img_element is not None:
+            metadata['image_url'] = img_element.get('src', '')
+
+        return metadata
@@ -0,0 +1,8 @@
+import os
+import sys
+
+# 백엔드 모듈은 패키지가 아니라 backend/ 바로 아래에 있음
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# 테스트가 backend/cache.sqlite3 를 건드리지 않도록 디스크 캐시를 끔
+os.environ['CACHE_DB_PATH'] = ''
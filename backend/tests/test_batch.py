@@ -0,0 +1,93 @@
+import threading
+import time
+from urllib.parse import urlsplit
+
+import pytest
+
+from batch import BatchProcessor
+
+
+class FakeService:
+    """process_article 흉내 - 도메인별 동시 처리 수의 최댓값을 기록"""
+
+    def __init__(self, delay: float = 0.05):
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.active = {}
+        self.peak = {}
+        self.calls = []
+
+    def process_article(self, url, use_cache=True):
+        domain = urlsplit(url).netloc
+        with self.lock:
+            self.calls.append(url)
+            self.active[domain] = self.active.get(domain, 0) + 1
+            self.peak[domain] = max(self.peak.get(domain, 0), self.active[domain])
+        time.sleep(self.delay)
+        with self.lock:
+            self.active[domain] -= 1
+        return {'success': True, 'title': url}
+
+
+@pytest.fixture
+def service():
+    return FakeService()
+
+
+@pytest.fixture
+def processor(service):
+    processor = BatchProcessor(service, workers=8, per_domain=2)
+    yield processor
+    processor.shutdown()
+
+
+def test_results_carry_original_input_indices(processor, service):
+    urls = [
+        'https://a.example.com/1',
+        'https://b.example.com/1',
+        'https://a.example.com/1?utm_source=x',
+        'https://c.example.com/1',
+    ]
+
+    results = {result['index']: result for result in processor.process(urls)}
+
+    assert sorted(results) == [0, 1, 3]
+    assert results[0]['indices'] == [0, 2]
+    assert results[3]['url'] == 'https://c.example.com/1'
+    assert len(service.calls) == 3
+
+
+def test_invalid_entries_are_per_item_errors(processor, service):
+    urls = ['https://a.example.com/1', '', None, 42, '   ', 'https://a.example.com/1']
+
+    items, invalid = processor.dedupe(urls)
+    results = list(processor.process(urls))
+
+    assert [item['index'] for item in invalid] == [1, 2, 3, 4]
+    assert processor.duplicates(items) == 1
+    errors = [result for result in results if not result['success']]
+    assert [(result['index'], result['url']) for result in errors] == [(1, ''), (2, None), (3, 42), (4, '   ')]
+    assert [result['indices'] for result in results if result['success']] == [[0, 5]]
+
+
+def test_per_domain_limit_is_respected(processor, service):
+    urls = [f'https://{domain}.example.com/{i}' for domain in ('a', 'b') for i in range(6)]
+
+    results = list(processor.process(urls))
+
+    assert len(results) == 12 and all(result['success'] for result in results)
+    assert service.peak == {'a.example.com': 2, 'b.example.com': 2}
+
+
+def test_per_domain_limit_is_shared_between_batches(processor, service):
+    batches = [[f'https://a.example.com/{batch}-{i}' for i in range(4)] for batch in range(3)]
+    threads = [threading.Thread(target=lambda urls=urls: list(processor.process(urls))) for urls in batches]
+
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(10)
+
+    assert len(service.calls) == 12
+    assert service.peak['a.example.com'] == 2
+    assert processor.stats()['active_by_domain'] == {}
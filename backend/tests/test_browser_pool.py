@@ -0,0 +1,100 @@
+import threading
+
+import pytest
+
+import browser_pool
+from browser_pool import BrowserPool
+
+
+class FakeBrowser:
+    def is_connected(self):
+        return True
+
+    def new_context(self, **options):
+        return FakeContext()
+
+    def close(self):
+        pass
+
+
+class FakeContext:
+    def close(self):
+        pass
+
+
+class FakePlaywright:
+    def __init__(self):
+        self.chromium = self
+
+    def launch(self, **kwargs):
+        return FakeBrowser()
+
+    def stop(self):
+        pass
+
+
+class FakeStarter:
+    """sync_playwright() 흉내 - 처음 failures번은 드라이버 시작 실패"""
+
+    def __init__(self, failures: int = 0):
+        self.failures = failures
+        self.starts = 0
+
+    def __call__(self):
+        return self
+
+    def start(self):
+        self.starts += 1
+        if self.starts <= self.failures:
+            raise RuntimeError('driver not found')
+        return FakePlaywright()
+
+
+@pytest.fixture
+def pool():
+    pool = BrowserPool(size=1, max_pages=0, max_memory_mb=0)
+    yield pool
+    pool.close(timeout=1)
+
+
+def test_driver_start_is_retried_on_next_task(monkeypatch, pool):
+    starter = FakeStarter(failures=1)
+    monkeypatch.setattr(browser_pool, 'sync_playwright', starter)
+    pool.start()
+
+    assert pool.run(lambda context: 'rendered', timeout=5) == 'rendered'
+    assert starter.starts == 2
+
+
+def test_driver_failure_is_reported_to_each_task(monkeypatch, pool):
+    monkeypatch.setattr(browser_pool, 'sync_playwright', FakeStarter(failures=10))
+    pool.start()
+
+    with pytest.raises(RuntimeError, match='driver not found'):
+        pool.run(lambda context: 'rendered', timeout=5)
+
+
+def test_run_times_out_and_cancels_queued_task(monkeypatch, pool):
+    monkeypatch.setattr(browser_pool, 'sync_playwright', FakeStarter())
+    release = threading.Event()
+    ran = []
+    pool.start()
+    pool.submit(lambda context: release.wait(5))
+
+    with pytest.raises(TimeoutError):
+        pool.run(lambda context: ran.append(True), timeout=0.2)
+    release.set()
+
+    assert pool.run(lambda context: 'next', timeout=5) == 'next'
+    assert ran == []
+
+
+def test_run_uses_default_task_timeout(monkeypatch, pool):
+    monkeypatch.setattr(browser_pool, 'sync_playwright', FakeStarter())
+    release = threading.Event()
+    pool.task_timeout = 0.2
+    pool.start()
+
+    with pytest.raises(TimeoutError):
+        pool.run(lambda context: release.wait(5))
+    release.set()
@@ -0,0 +1,19 @@
+from bench.extraction import render_fixture, score
+from static_extractor import StaticExtractor, extract_by_density, parse_html
+
+
+def test_density_fallback_finds_article_without_selectors():
+    extractor = StaticExtractor(['.no-such-selector'], ['h1'], [], [])
+    for index in range(30):
+        html, expected = render_fixture(index)
+        extraction = extractor.extract(html)
+
+        assert extraction['strategy'] == 'density'
+        assert score(extraction['content'], expected)['f1'] > 0.9
+
+
+def test_density_skips_boilerplate_only_page():
+    root = parse_html('<html><body><nav>' + '<a href="/x">Section link</a> ' * 50 + '</nav>'
+                      '<footer><p>Copyright notice and legal text for the site.</p></footer></body></html>')
+
+    assert extract_by_density(root) == ''
@@ -0,0 +1,185 @@
+import pytest
+
+from html_stream import ContainerWatcher, read_html
+from scraper import NewsScraper
+from static_extractor import SelectorPlan, StaticExtractor
+
+
+def _paragraphs(word: str, count: int) -> str:
+    return ''.join(f'<p>{word} paragraph {i} with enough words to look like a real sentence.</p>' for i in range(count))
+
+
+def _page(body: str) -> bytes:
+    comments = ''.join(f'<div class="comment"><p>{"comment text " * 20}</p></div>' for _ in range(200))
+    return (f'<html><head><title>t</title></head><body>{body}'
+            f'<div class="comments">{comments}</div></body></html>').encode()
+
+
+class FakeResponse:
+    """stream=True 응답 흉내 (작은 청크로 나눠 보냄)"""
+
+    def __init__(self, body: bytes, chunk: int = 4096):
+        self.body = body
+        self.chunk = chunk
+        self.url = 'https://news.example.com/a'
+        self.closed = False
+        self.status_code = 200
+        self.headers = {'ETag': '"v1"'}
+
+    def raise_for_status(self):
+        pass
+
+    def iter_content(self, chunk_size=None):
+        for i in range(0, len(self.body), self.chunk):
+            yield self.body[i:i + self.chunk]
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def scraper(monkeypatch):
+    monkeypatch.setenv('ADAPTIVE_SELECTORS', 'false')
+    monkeypatch.setenv('HTTP_CACHE', 'false')
+    monkeypatch.setenv('FETCH_EARLY_STOP_CHARS', '2000')
+    return NewsScraper()
+
+
+def _extract(scraper, html: bytes):
+    return scraper.static_extractor.extract(html)['content']
+
+
+def test_split_body_is_read_to_the_end_of_its_region(scraper):
+    html = _page(
+        '<article>'
+        f'<div class="content">{_paragraphs("first", 40)}</div>'
+        '<div class="ad">advertisement</div>'
+        f'<div class="content">{_paragraphs("second", 40)}</div>'
+        '</article>'
+    )
+    body, info = scraper._read_body(FakeResponse(html))
+
+    assert info['early_stop']
+    assert len(body) < len(html)
+    assert _extract(scraper, body) == _extract(scraper, html)
+    assert 'second paragraph 39' in _extract(scraper, body)
+
+
+def test_lower_priority_container_closing_first_does_not_stop(scraper):
+    # 사이드바가 뒤쪽 선택자에 맞고 먼저 닫혀도, 첫 번째 선택자의 본문을 받기 전에는 멈추지 않음
+    html = _page(
+        f'<div class="main-content">{_paragraphs("sidebar", 40)}</div>'
+        f'<article><div class="content">{_paragraphs("article", 40)}</div></article>'
+    )
+    body, info = scraper._read_body(FakeResponse(html))
+
+    content = _extract(scraper, body)
+    assert content == _extract(scraper, html)
+    assert 'article paragraph 39' in content
+    assert 'sidebar' not in content
+
+
+def test_page_without_top_selector_is_read_fully(scraper):
+    html = _page(f'<div class="article-body">{_paragraphs("body", 40)}</div>')
+    body, info = scraper._read_body(FakeResponse(html))
+
+    assert info['early_stop'] is None
+    assert body == html
+
+
+def test_early_stop_is_on_by_default(monkeypatch):
+    monkeypatch.setenv('ADAPTIVE_SELECTORS', 'false')
+    monkeypatch.setenv('HTTP_CACHE', 'false')
+    monkeypatch.delenv('FETCH_EARLY_STOP_CHARS', raising=False)
+    scraper = NewsScraper()
+    html = _page(f'<article><div class="content">{_paragraphs("body", 40)}</div></article>')
+
+    body, info = scraper._read_body(FakeResponse(html))
+
+    assert scraper.early_stop_chars == 2000
+    assert info['early_stop'] and len(body) < len(html)
+    assert _extract(scraper, body) == _extract(scraper, html)
+
+
+def test_early_stop_can_be_disabled(monkeypatch):
+    monkeypatch.setenv('ADAPTIVE_SELECTORS', 'false')
+    monkeypatch.setenv('HTTP_CACHE', 'false')
+    monkeypatch.setenv('FETCH_EARLY_STOP_CHARS', '0')
+    scraper = NewsScraper()
+    html = _page(f'<article><div class="content">{_paragraphs("body", 40)}</div></article>')
+
+    body, info = scraper._read_body(FakeResponse(html))
+
+    assert body == html and info['early_stop'] is None
+
+
+def test_watcher_collects_split_fragments_of_learned_selector():
+    # 도메인에서 .article-body 를 학습한 경우 - 나뉜 두 조각을 모두 받은 뒤에만 멈춤
+    html = _page(
+        '<div class="story">'
+        f'<div class="article-body">{_paragraphs("first", 40)}</div>'
+        '<div class="related"><a href="/x">related story</a></div>'
+        f'<div class="article-body">{_paragraphs("second", 40)}</div>'
+        '</div>'
+    )
+    watcher = ContainerWatcher(SelectorPlan({'content': ['.article-body']}), 2000)
+    body, info = read_html(FakeResponse(html), 10 * 1024 * 1024, watcher)
+
+    extractor = StaticExtractor(['.article-body'], ['h1'], [], [])
+    assert info['early_stop'] == 'div.article-body'
+    assert extractor.extract(body)['content'] == extractor.extract(html)['content']
+
+
+def test_watcher_does_not_stop_on_short_region():
+    html = _page(f'<article><div class="content">{_paragraphs("short", 3)}</div></article>')
+    watcher = ContainerWatcher(SelectorPlan({'content': ['article .content']}), 2000)
+
+    body, info = read_html(FakeResponse(html), 10 * 1024 * 1024, watcher)
+
+    assert info['early_stop'] is None
+    assert body == html
+
+
+def test_size_limit_truncates():
+    html = _page('')
+    body, info = read_html(FakeResponse(html), 1000)
+
+    assert info['truncated'] and len(body) == 1000
+
+
+class FakeHttp:
+    def __init__(self, body: bytes):
+        self.body = body
+
+    def get(self, url, headers=None, **kwargs):
+        return FakeResponse(self.body)
+
+
+@pytest.mark.parametrize('early_stop, max_bytes', [('2000', 5 * 1024 * 1024), ('0', 20000)])
+def test_partial_body_is_not_stored_in_http_cache(monkeypatch, tmp_path, early_stop, max_bytes):
+    monkeypatch.setenv('ADAPTIVE_SELECTORS', 'false')
+    monkeypatch.setenv('CACHE_DB_PATH', str(tmp_path / 'cache.db'))
+    monkeypatch.setenv('FETCH_EARLY_STOP_CHARS', early_stop)
+    monkeypatch.setenv('FETCH_MAX_BYTES', str(max_bytes))
+    scraper = NewsScraper()
+    scraper.http = FakeHttp(_page(f'<h1>A headline that is long enough</h1>'
+                                  f'<article><div class="content">{_paragraphs("body", 60)}</div></article>'))
+
+    result = scraper._fetch_with_http_cache('https://news.example.com/a', {})
+
+    assert result['success']
+    assert result['extraction']['fetch']['truncated'] or result['extraction']['fetch']['early_stop']
+    assert scraper.http_cache.get('https://news.example.com/a') is None
+
+
+def test_complete_body_is_stored_in_http_cache(monkeypatch, tmp_path):
+    monkeypatch.setenv('ADAPTIVE_SELECTORS', 'false')
+    monkeypatch.setenv('CACHE_DB_PATH', str(tmp_path / 'cache.db'))
+    monkeypatch.setenv('FETCH_EARLY_STOP_CHARS', '0')
+    scraper = NewsScraper()
+    scraper.http = FakeHttp(_page(f'<h1>A headline that is long enough</h1>'
+                                  f'<article><div class="content">{_paragraphs("body", 60)}</div></article>'))
+
+    scraper._fetch_with_http_cache('https://news.example.com/a', {})
+
+    assert scraper.http_cache.get('https://news.example.com/a').result['success']
@@ -0,0 +1,110 @@
+import pytest
+
+from bench.fake_news import render_article
+from scraper import NewsScraper
+
+URL = 'https://news.example.com/story'
+
+
+class FakeResponse:
+    def __init__(self, status_code: int, body: bytes = b'', headers=None):
+        self.status_code = status_code
+        self.body = body
+        self.headers = headers or {}
+        self.url = URL
+
+    def raise_for_status(self):
+        pass
+
+    def iter_content(self, chunk_size=None):
+        yield self.body
+
+    def close(self):
+        pass
+
+
+class FakeServer:
+    """ETag 조건부 요청을 처리하는 서버 흉내"""
+
+    def __init__(self, body: bytes, etag: str = '"v1"', cache_control: str = ''):
+        self.body = body
+        self.etag = etag
+        self.cache_control = cache_control
+        self.requests = []
+
+    def get(self, url, headers=None, **kwargs):
+        headers = headers or {}
+        self.requests.append(headers)
+        response_headers = {'ETag': self.etag, 'Cache-Control': self.cache_control}
+        if headers.get('If-None-Match') == self.etag:
+            return FakeResponse(304, headers=response_headers)
+        return FakeResponse(200, self.body, response_headers)
+
+
+@pytest.fixture
+def scraper(monkeypatch, tmp_path):
+    monkeypatch.setenv('ADAPTIVE_SELECTORS', 'false')
+    monkeypatch.setenv('CACHE_DB_PATH', str(tmp_path / 'cache.db'))
+    monkeypatch.setenv('FETCH_EARLY_STOP_CHARS', '0')
+    monkeypatch.setenv('HTTP_CACHE_DEFAULT_MAX_AGE', '0')
+    return NewsScraper()
+
+
+def fetch(scraper):
+    return scraper._fetch_with_http_cache(URL, {})
+
+
+def test_revalidation_reuses_body_and_extraction(scraper):
+    scraper.http = FakeServer(render_article('npr', 0))
+
+    first = fetch(scraper)
+    second = fetch(scraper)
+
+    assert first['extraction']['http_cache'] == 'miss'
+    assert second['extraction']['http_cache'] == 'revalidated'
+    assert second['extraction']['skipped']
+    assert scraper.http.requests[1] == {'If-None-Match': '"v1"'}
+    assert (second['title'], second['content']) == (first['title'], first['content'])
+    assert scraper.http_cache.stats()['extraction_skipped'] == 1
+
+
+def test_changed_body_is_extracted_again(scraper):
+    scraper.http = FakeServer(render_article('npr', 0))
+    fetch(scraper)
+
+    scraper.http.body = render_article('npr', 1)
+    scraper.http.etag = '"v2"'
+    result = fetch(scraper)
+
+    assert result['extraction']['http_cache'] == 'modified'
+    assert 'skipped' not in result['extraction']
+    assert scraper.http_cache.get(URL).etag == '"v2"'
+
+
+def test_same_body_with_new_validator_skips_extraction(scraper):
+    scraper.http = FakeServer(render_article('npr', 0))
+    fetch(scraper)
+
+    scraper.http.etag = '"v2"'
+    result = fetch(scraper)
+
+    assert result['extraction']['http_cache'] == 'modified'
+    assert result['extraction']['skipped']
+
+
+def test_fresh_entry_is_used_without_request(scraper):
+    scraper.http = FakeServer(render_article('npr', 0), cache_control='max-age=300')
+    fetch(scraper)
+
+    result = fetch(scraper)
+
+    assert result['extraction']['http_cache'] == 'fresh'
+    assert len(scraper.http.requests) == 1
+
+
+def test_no_store_response_is_not_cached(scraper):
+    scraper.http = FakeServer(render_article('npr', 0), cache_control='no-store')
+    fetch(scraper)
+
+    assert scraper.http_cache.get(URL) is None
+    assert fetch(scraper)['extraction']['http_cache'] == 'miss'
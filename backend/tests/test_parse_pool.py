@@ -0,0 +1,39 @@
+import pytest
+
+from bench.fake_news import render_article
+from parse_pool import ParsePool, default_pool_size
+from scraper import NewsScraper
+
+
+def test_default_size_is_split_across_web_workers(monkeypatch):
+    monkeypatch.setattr('os.cpu_count', lambda: 8)
+    monkeypatch.setenv('WEB_CONCURRENCY', '4')
+    assert default_pool_size() == 2
+
+    monkeypatch.setenv('WEB_CONCURRENCY', '16')
+    assert default_pool_size() == 1
+
+    monkeypatch.delenv('WEB_CONCURRENCY')
+    assert default_pool_size() == 8
+
+
+@pytest.fixture(scope='module')
+def pool():
+    scraper = NewsScraper()
+    pool = ParsePool(scraper.selector_groups(), size=1, max_chars=500)
+    pool.warm()
+    yield scraper, pool
+    pool.close()
+
+
+def test_pool_matches_in_thread_extraction(pool):
+    scraper, parse_pool = pool
+    html = render_article('npr', 1)
+
+    extraction = parse_pool.extract(html)
+    expected = scraper.static_extractor.extract(html)
+
+    assert extraction['content'] == expected['content'][:500]
+    assert extraction['truncated'] == (len(expected['content']) > 500)
+    assert {key: extraction[key] for key in ('title', 'metadata', 'strategy', 'selector')} == \
+        {key: expected[key] for key in ('title', 'metadata', 'strategy', 'selector')}
@@ -0,0 +1,99 @@
+import pytest
+
+from processor import NewsProcessingService, failed_stages
+
+URL = 'https://news.example.com/story?utm_source=x'
+
+
+@pytest.fixture
+def service(monkeypatch):
+    monkeypatch.delenv('OPENAI_API_KEY', raising=False)
+    monkeypatch.setenv('PARSE_WORKERS', '0')
+    service = NewsProcessingService()
+    service.scrape_article = lambda url: {
+        'success': True,
+        'title': 'A headline that is long enough',
+        'content': 'The article body sentence goes here. ' * 20,
+        'url': url,
+        'metadata': {}
+    }
+    yield service
+    service.shutdown()
+
+
+def use_fake_llm(service, translation='번역된 텍스트', summary='요약된 텍스트'):
+    service.translator.translate_text = lambda text, *args, **kwargs: translation
+    service.summarizer.summarize_text = lambda text, *args, **kwargs: summary
+    service.translator.stream_translation = lambda text, *args, **kwargs: iter([translation])
+    service.summarizer.stream_summary = lambda text, *args, **kwargs: iter([summary])
+
+
+def cached(service):
+    return service.result_cache.get('https://news.example.com/story')
+
+
+def test_successful_result_is_cached(service):
+    use_fake_llm(service)
+
+    result = service.process_article(URL)
+    again = service.process_article(URL)
+
+    assert result['success'] and cached(service) is not None
+    assert again['cache']['hit']
+
+
+def test_simulated_result_is_not_cached(service):
+    # API 키가 없으면 번역/요약 시뮬레이션 결과가 나옴
+    result = service.process_article(URL)
+
+    assert result['success']
+    assert result['translated']['title'].startswith('[번역 시뮬레이션]')
+    assert cached(service) is None
+
+
+@pytest.mark.parametrize('translation, summary', [
+    ('[번역 실패]', '요약된 텍스트'),
+    ('첫 청크 번역 [청크 2 번역 실패]', '요약된 텍스트'),
+    ('번역된 텍스트', '[요약 실패]'),
+])
+def test_failed_stage_is_not_cached(service, translation, summary):
+    use_fake_llm(service, translation, summary)
+
+    assert service.process_article(URL)['success']
+    assert cached(service) is None
+
+
+def test_stage_exception_is_not_cached(service):
+    use_fake_llm(service)
+
+    def broken(text, *args, **kwargs):
+        raise RuntimeError('API down')
+    service.summarizer.summarize_text = broken
+
+    result = service.process_article(URL)
+
+    assert result['summarized']['content'] == '[요약 실패]'
+    assert cached(service) is None
+
+
+def test_failed_stages_reports_each_stage():
+    result = {
+        'translated': {'title': '[번역 시뮬레이션] Title...', 'content': '본문 번역'},
+        'summarized': {'content': None}
+    }
+
+    assert failed_stages(result) == ['translate_title']
+
+
+def test_stream_caches_only_complete_results(service):
+    use_fake_llm(service, translation='[번역 실패]')
+    events = list(service.process_article_stream(URL))
+
+    assert events[-1][0] == 'done'
+    assert cached(service) is None
+
+    use_fake_llm(service)
+    list(service.process_article_stream(URL))
+
+    assert cached(service) is not None
+    assert list(service.process_article_stream(URL))[-1][1]['cache']['hit']
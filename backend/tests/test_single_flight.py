@@ -0,0 +1,118 @@
+import threading
+import time
+
+import pytest
+
+from singleflight import SingleFlight
+
+
+def run_concurrently(flight: SingleFlight, key: str, fn, count: int):
+    """count개 스레드에서 같은 키로 do()를 호출하고 (결과, 공유 여부) 또는 예외를 모음"""
+    results = []
+    lock = threading.Lock()
+
+    def call():
+        try:
+            outcome = flight.do(key, fn)
+        except Exception as e:
+            outcome = e
+        with lock:
+            results.append(outcome)
+
+    threads = [threading.Thread(target=call) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    return threads, results
+
+
+def settle():
+    """시작한 스레드들이 do()에 들어가 리더를 기다리기 시작할 때까지 잠시 대기"""
+    time.sleep(0.1)
+
+
+def test_concurrent_calls_run_once_and_share_result():
+    flight = SingleFlight('test')
+    release = threading.Event()
+    calls = []
+
+    def fn():
+        calls.append(1)
+        release.wait(5)
+        return 'article'
+
+    threads, results = run_concurrently(flight, 'key', fn, 5)
+    settle()
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert calls == [1]
+    assert sorted(shared for _, shared in results) == [False, True, True, True, True]
+    assert all(value == 'article' for value, _ in results)
+    assert flight.stats()['coalesced'] == 4 and flight.stats()['in_flight'] == 0
+
+
+def test_leader_error_is_shared_but_not_cached():
+    flight = SingleFlight('test')
+    release = threading.Event()
+
+    def fail():
+        release.wait(5)
+        raise ValueError('upstream failed')
+
+    threads, results = run_concurrently(flight, 'key', fail, 3)
+    settle()
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert all(isinstance(result, ValueError) for result in results)
+    # 실패는 보관하지 않으므로 다음 호출은 다시 실행
+    assert flight.do('key', lambda: 'ok') == ('ok', False)
+
+
+def test_different_keys_are_not_merged():
+    flight = SingleFlight('test')
+
+    assert flight.do('a', lambda: 1) == (1, False)
+    assert flight.do('b', lambda: 2) == (2, False)
+    assert flight.stats()['leaders'] == 2
+
+
+def test_follower_runs_itself_after_timeout():
+    flight = SingleFlight('test', timeout=0.1)
+    release = threading.Event()
+    leader = threading.Thread(target=lambda: flight.do('key', lambda: release.wait(5)))
+    leader.start()
+    settle()
+
+    assert flight.do('key', lambda: 'own') == ('own', False)
+    assert flight.stats()['timeouts'] == 1
+    release.set()
+    leader.join(5)
+
+
+def test_cancelled_leader_hands_over_to_follower():
+    flight = SingleFlight('test')
+    release = threading.Event()
+
+    def interrupted():
+        release.wait(5)
+        raise KeyboardInterrupt
+
+    def lead():
+        with pytest.raises(KeyboardInterrupt):
+            flight.do('key', interrupted)
+
+    leader = threading.Thread(target=lead)
+    leader.start()
+    settle()
+    threads, results = run_concurrently(flight, 'key', lambda: 'retried', 1)
+    settle()
+    release.set()
+    leader.join(5)
+    for thread in threads:
+        thread.join(5)
+
+    assert results == [('retried', False)]
+    assert flight.stats()['retries'] == 1
@@ -0,0 +1,112 @@
+import pytest
+from bs4 import BeautifulSoup
+
+from bench.fake_news import render_article
+from scraper import NewsScraper
+from static_extractor import StaticExtractor, clean_text, element_text, parse_html
+
+
+@pytest.fixture(scope='module')
+def scraper():
+    return NewsScraper()
+
+
+def soup_extract(scraper, html: bytes):
+    """기존 BeautifulSoup 추출 (선택자 경로) - 비교 기준"""
+    soup = BeautifulSoup(html, 'html.parser')
+
+    title = "제목을 찾을 수 없습니다"
+    for selector in scraper.title_selectors:
+        element = soup.select_one(selector)
+        if element:
+            text = element.get_text().strip()
+            if text and len(text) > 10:
+                title = text
+                break
+    else:
+        meta_title = soup.find('meta', property='og:title')
+        if meta_title:
+            title = meta_title.get('content', '').strip()
+
+    content = ''
+    for selector in scraper.content_selectors:
+        parts = [text for text in (e.get_text().strip() for e in soup.select(selector)) if len(text) > 50]
+        if parts and len(clean_text('\n\n'.join(parts))) > 50:
+            content = clean_text('\n\n'.join(parts))
+            break
+
+    metadata = {}
+    for key, selectors in (('author', scraper.author_selectors), ('published_date', scraper.date_selectors)):
+        for selector in selectors:
+            element = soup.select_one(selector)
+            if element:
+                metadata[key] = element.get_text().strip()
+                break
+    img = soup.find('img')
+    if img:
+        metadata['image_url'] = img.get('src', '')
+    return title, content, metadata
+
+
+EDGE_CASES = [
+    # script/style/템플릿 안의 텍스트, 엔티티, 주석, br
+    '<html><head><title>Edge</title></head><body><h1>Short</h1><h2 class="headline">A longer headline here</h2>'
+    '<div class="article-body"><p>Caf&eacute; prices &amp; wages rose&nbsp;again this week, officials said today.</p>'
+    '<script>var hidden = "not text";</script><style>.x{color:red}</style><!-- comment -->'
+    '<p>Second<br>line of the story with <b>bold</b> and <a href="/l">a link</a> inside it.</p>'
+    '<template><p>template text</p></template></div></body></html>',
+    # 여러 요소에 매칭, 짧은 조각은 제외
+    '<html><body><h1>Multiple matching elements page</h1>'
+    '<div class="story-content">Too short.</div>'
+    '<div class="story-content">The first long fragment of the story that easily passes fifty characters.</div>'
+    '<div class="story-content">The second long fragment of the story that also passes fifty characters.</div>'
+    '<span class="byline">Reporter Name</span><time class="published">2025-02-03</time></body></html>',
+    # 자손 결합자와 속성 선택자, og:title 대체
+    '<html><head><meta property="og:title" content="Meta title fallback"></head><body>'
+    '<article><div class="content"><p>Descendant selector content that is definitely longer than fifty chars.</p></div></article>'
+    '<div data-testid="author">Someone</div><img src="/a.jpg"></body></html>',
+    '<html><body><div data-testid="article-content">Attribute selector body text that is longer than fifty characters for sure.</div>'
+    '<div class="l-container"><div class="zn-body__paragraph">CNN style paragraph that is longer than fifty characters as well.</div></div>'
+    '</body></html>',
+]
+
+
+@pytest.mark.parametrize('layout', ['npr', 'bbc', 'reuters', 'generic'])
+@pytest.mark.parametrize('index', range(5))
+def test_matches_beautifulsoup_on_fixture_layouts(scraper, layout, index):
+    html = render_article(layout, index)
+    extraction = scraper.static_extractor.extract(html)
+
+    assert (extraction['title'], extraction['content'], extraction['metadata']) == soup_extract(scraper, html)
+    assert extraction['strategy'] == 'selector'
+
+
+@pytest.mark.parametrize('html', EDGE_CASES)
+def test_matches_beautifulsoup_on_edge_cases(scraper, html):
+    html = html.encode('utf-8')
+    extraction = scraper.static_extractor.extract(html)
+
+    assert (extraction['title'], extraction['content'], extraction['metadata']) == soup_extract(scraper, html)
+
+
+def test_element_text_matches_get_text():
+    html = EDGE_CASES[0]
+    root = parse_html(html)
+    body = root.find('body')
+
+    assert element_text(body) == BeautifulSoup(html, 'html.parser').body.get_text()
+
+
+def test_content_order_changes_selector_priority():
+    extractor = StaticExtractor(['.a', '.b'], ['h1'], [], [])
+    html = ('<html><body><div class="a">' + 'first selector text ' * 5 + '</div>'
+            '<div class="b">' + 'second selector text ' * 5 + '</div></body></html>')
+
+    assert extractor.extract(html)['selector'] == '.a'
+    assert extractor.extract(html, content_order=['.b', '.a'])['selector'] == '.b'
+
+
+def test_unparseable_input():
+    extraction = StaticExtractor(['.a'], ['h1'], [], []).extract(b'   ')
+
+    assert extraction['strategy'] == 'none' and extraction['content'] == ''
@@ -0,0 +1,99 @@
+import pytest
+
+from tokens import TokenBudget, chunk_text, estimate_tokens, model_limits, split_sentences, truncate_to_tokens
+
+
+def article(paragraphs: int, sentences: int = 6) -> str:
+    return '\n\n'.join(
+        ' '.join(f'Paragraph {p} sentence {s} reports on the economy and markets today.' for s in range(sentences))
+        for p in range(paragraphs)
+    )
+
+
+def test_estimate_counts_korean_denser_than_english():
+    assert estimate_tokens('') == 0
+    assert estimate_tokens('경제 뉴스') > estimate_tokens('news')
+    assert estimate_tokens('word.') == estimate_tokens('word') + 1
+
+
+def test_chunks_stay_within_budget_and_keep_all_text():
+    text = article(20)
+
+    chunks = chunk_text(text, 120)
+
+    assert len(chunks) > 1
+    assert all(estimate_tokens(chunk) <= 120 for chunk in chunks)
+    assert ' '.join(' '.join(chunks).split()) == ' '.join(text.split())
+
+
+def test_paragraph_boundaries_are_kept():
+    text = article(6, sentences=2)
+
+    for chunk in chunk_text(text, 80):
+        for paragraph in chunk.split('\n\n'):
+            assert paragraph.startswith('Paragraph') and paragraph.endswith('.')
+
+
+def test_long_paragraph_is_split_at_sentences():
+    text = article(1, sentences=30)
+
+    chunks = chunk_text(text, 60)
+
+    assert len(chunks) > 1
+    assert all(chunk.endswith('today.') for chunk in chunks)
+
+
+def test_oversized_sentence_is_split_by_words():
+    sentence = ' '.join(['word'] * 300) + '.'
+
+    chunks = chunk_text(sentence, 50)
+
+    assert len(chunks) > 1 and all(estimate_tokens(chunk) <= 50 for chunk in chunks)
+
+
+def test_abbreviations_do_not_end_sentences():
+    assert split_sentences('Mr. Smith met Dr. Lee on Jan. 5. They spoke for J. R. Doe.') == \
+        ['Mr. Smith met Dr. Lee on Jan. 5.', 'They spoke for J. R. Doe.']
+
+
+def test_truncate_keeps_leading_sentences():
+    text = article(3)
+
+    truncated = truncate_to_tokens(text, 40)
+
+    assert text.startswith(truncated) and estimate_tokens(truncated) <= 40
+    assert truncate_to_tokens('short text', 40) == 'short text'
+
+
+def test_model_limits_use_longest_prefix_and_env_override(monkeypatch):
+    monkeypatch.delenv('OPENAI_CONTEXT_TOKENS', raising=False)
+    monkeypatch.delenv('OPENAI_MAX_OUTPUT_TOKENS', raising=False)
+    assert model_limits('gpt-4o-mini-2024-07-18') == (128000, 16384)
+    assert model_limits('gpt-4-0613') == (8192, 4096)
+
+    monkeypatch.setenv('OPENAI_MAX_OUTPUT_TOKENS', '1000')
+    assert model_limits('gpt-4o') == (128000, 1000)
+
+
+@pytest.fixture
+def budget(monkeypatch):
+    monkeypatch.setenv('OPENAI_CONTEXT_TOKENS', '2000')
+    monkeypatch.setenv('OPENAI_MAX_OUTPUT_TOKENS', '1000')
+    return TokenBudget('gpt-3.5-turbo', 'Translate to Korean.', output_ratio=2.0, safety=1.2)
+
+
+def test_budget_input_limit_leaves_room_for_output(budget):
+    # 출력 한도 1000 / (2.0 * 1.2) 가 컨텍스트 기준보다 작음
+    assert budget.max_input_tokens == int(1000 / 2.4)
+    assert budget.fits('short text')
+    assert not budget.fits(article(20))
+
+
+def test_budget_chunks_fit_and_max_tokens_is_bounded(budget):
+    chunks = budget.chunk(article(20))
+
+    assert len(chunks) > 1 and all(budget.fits(chunk) for chunk in chunks)
+    for chunk in chunks:
+        max_tokens = budget.max_tokens_for(chunk)
+        assert max_tokens <= 1000
+        assert max_tokens + estimate_tokens(chunk) <= 2000
@@ -0,0 +1,120 @@
+import re
+
+import pytest
+
+from processor import TranslationService
+
+SEGMENT_RE = re.compile(r'<<<(\d+)>>>\n(.*?)(?=\n\n<<<\d+>>>|\Z)', re.DOTALL)
+
+
+class FakeResponse:
+    def __init__(self, status_code: int, body=None):
+        self.status_code = status_code
+        self._body = body
+        self.text = '' if body is None else str(body)
+
+    def json(self):
+        return self._body
+
+
+class FakeHttp:
+    """chat completions 흉내 - handler(요청 본문 텍스트)가 (상태 코드, 출력) 또는 예외를 반환"""
+
+    def __init__(self, handler):
+        self.handler = handler
+        self.requests = []
+
+    def post(self, url, headers=None, json=None, read_timeout=None, **kwargs):
+        text = json['messages'][-1]['content']
+        self.requests.append(text)
+        status, output = self.handler(text)
+        if status != 200:
+            return FakeResponse(status, 'error')
+        return FakeResponse(200, {'choices': [{'message': {'content': output}, 'finish_reason': 'stop'}]})
+
+
+def translate_all(text: str) -> str:
+    """묶음이면 번호마다, 아니면 통째로 '번역:' 을 붙임"""
+    segments = SEGMENT_RE.findall(text)
+    if not segments:
+        return f'번역: {text}'
+    return '\n\n'.join(f'<<<{n}>>>\n번역: {body}' for n, body in segments)
+
+
+@pytest.fixture
+def service(monkeypatch):
+    monkeypatch.setenv('OPENAI_API_KEY', 'test-key')
+    monkeypatch.setenv('TRANSLATION_BATCH_SIZE', '40')
+    return TranslationService()
+
+
+def texts(count: int):
+    return [f'Headline number {i} about the economy' for i in range(count)]
+
+
+def test_batch_is_sent_as_one_request(service):
+    service.http = FakeHttp(lambda text: (200, translate_all(text)))
+
+    results = service.translate_batch(texts(40))
+
+    assert len(service.http.requests) == 1
+    assert results == [f'번역: Headline number {i} about the economy' for i in range(40)]
+
+
+def test_http_error_fails_batch_without_splitting(service):
+    service.http = FakeHttp(lambda text: (503, None))
+
+    results = service.translate_batch(texts(40))
+
+    assert results == [None] * 40
+    assert len(service.http.requests) == 1
+
+
+def test_transport_error_fails_batch_without_splitting(service):
+    def handler(text):
+        raise TimeoutError('read timed out')
+    service.http = FakeHttp(handler)
+
+    assert service.translate_batch(texts(10)) == [None] * 10
+    assert len(service.http.requests) == 1
+
+
+def test_count_mismatch_splits_until_parsable(service):
+    def handler(text):
+        segments = SEGMENT_RE.findall(text)
+        if len(segments) > 10:
+            # 모델이 번호 하나를 빠뜨린 응답
+            return 200, '\n\n'.join(f'<<<{n}>>>\n번역: {body}' for n, body in segments[:-1])
+        return 200, translate_all(text)
+    service.http = FakeHttp(handler)
+
+    results = service.translate_batch(texts(40))
+
+    assert results == [f'번역: Headline number {i} about the economy' for i in range(40)]
+    # 40 → 20 + 20 → 10 x 4 (실패한 요청 3번 + 성공 4번)
+    assert len(service.http.requests) == 7
+
+
+def test_duplicates_and_memo_skip_requests(service):
+    service.http = FakeHttp(lambda text: (200, translate_all(text)))
+
+    first = service.translate_batch(['Same headline text here'] * 3 + ['Other headline text here'])
+    second = service.translate_batch(['Same headline text here', 'Other headline text here'])
+
+    assert first[:3] == ['번역: Same headline text here'] * 3
+    assert second == ['번역: Same headline text here', '번역: Other headline text here']
+    assert len(service.http.requests) == 1
+
+
+def test_blank_texts_are_passed_through(service):
+    service.http = FakeHttp(lambda text: (200, translate_all(text)))
+
+    assert service.translate_batch(['', '   ', None]) == ['', '   ', None]
+    assert service.http.requests == []
+
+
+def test_parse_batch_rejects_duplicates_and_gaps(service):
+    assert service._parse_batch('<<<1>>>\n하나\n\n<<<2>>>\n둘', 2) == ['하나', '둘']
+    assert service._parse_batch('<<<1>>>\n하나\n\n<<<1>>>\n또 하나', 2) is None
+    assert service._parse_batch('<<<1>>>\n하나\n\n<<<3>>>\n셋', 2) is None
+    assert service._parse_batch('<<<1>>>\n\n<<<2>>>\n둘', 2) is None
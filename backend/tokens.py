@@ -0,0 +1,208 @@
+import math
+import os
+import re
+from typing import Optional, List, Tuple
+
+# 문자 종류별 토큰 추정 (cl100k 계열 토크나이저 기준 대략값)
+# - 영문/숫자 단어: 약 4자당 1토큰
+# - 한글/한자/가나: 대부분 1자당 1토큰 이상
+# - 그 밖의 문자(키릴, 데바나가리 등): 약 2자당 1토큰
+# - 문장 부호/기호: 1개당 1토큰
+LATIN_RE = re.compile(r"[A-Za-z0-9_']+")
+CJK_RE = re.compile(r'[\u1100-\u11ff\u3040-\u30ff\u3130-\u318f\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af\uf900-\ufaff]')
+OTHER_LETTER_RE = re.compile(r"[^\sA-Za-z0-9_'\u1100-\u11ff\u3040-\u30ff\u3130-\u318f\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af\uf900-\ufaff\W]+")
+SYMBOL_RE = re.compile(r"[^\w\s]")
+
+# 문단/문장 분리
+PARAGRAPH_RE = re.compile(r'\n\s*\n|\r\n\s*\r\n')
+SENTENCE_BREAK_RE = re.compile(r'(?<=[.!?…。！？"\'”’)\]])\s+|(?<=[。！？])(?=\S)')
+SENTENCE_TERMINALS = '.!?…。！？'
+CLOSING_CHARS = '"\'”’)]'
+# 마침표가 있어도 문장 끝이 아닌 약어
+ABBREVIATIONS = frozenset([
+    'mr', 'mrs', 'ms', 'dr', 'prof', 'sr', 'jr', 'st', 'vs', 'etc', 'inc', 'ltd', 'co', 'corp',
+    'jan', 'feb', 'mar', 'apr', 'jun', 'jul', 'aug', 'sep', 'sept', 'oct', 'nov', 'dec',
+    'gen', 'gov', 'sen', 'rep', 'lt', 'col', 'sgt', 'capt', 'no', 'fig', 'al', 'e.g', 'i.e', 'u.s', 'u.k', 'u.n'
+])
+
+# 메시지 하나에 붙는 형식 토큰 (role 등)
+MESSAGE_OVERHEAD_TOKENS = 4
+
+# 모델별 (컨텍스트 토큰, 최대 출력 토큰) - 앞부분이 일치하는 가장 긴 이름 사용
+MODEL_LIMITS = {
+    'gpt-3.5-turbo': (16385, 4096),
+    'gpt-4': (8192, 4096),
+    'gpt-4-turbo': (128000, 4096),
+    'gpt-4o': (128000, 16384),
+    'gpt-4o-mini': (128000, 16384),
+    'gpt-4.1': (1047576, 32768),
+}
+
+
+def estimate_tokens(text: str) -> int:
+    """텍스트의 토큰 수 추정 (외부 토크나이저 없이 문자 종류별로 계산)"""
+    if not text:
+        return 0
+    latin = sum(math.ceil(len(word) / 4) for word in LATIN_RE.findall(text))
+    cjk = len(CJK_RE.findall(text))
+    other = sum(math.ceil(len(word) / 2) for word in OTHER_LETTER_RE.findall(text))
+    symbols = len(SYMBOL_RE.findall(text))
+    return latin + cjk + other + symbols
+
+
+def message_tokens(*contents: str) -> int:
+    """chat completions 메시지들의 입력 토큰 추정"""
+    return sum(estimate_tokens(content) + MESSAGE_OVERHEAD_TOKENS for content in contents) + 3
+
+
+def model_limits(model: str) -> Tuple[int, int]:
+    """(컨텍스트 토큰, 최대 출력 토큰) - OPENAI_CONTEXT_TOKENS/OPENAI_MAX_OUTPUT_TOKENS로 덮어쓰기 가능"""
+    context, output = 16385, 4096
+    matched = ''
+    for name, limits in MODEL_LIMITS.items():
+        if model.startswith(name) and len(name) > len(matched):
+            matched = name
+            context, output = limits
+    context = int(os.getenv('OPENAI_CONTEXT_TOKENS') or context)
+    output = int(os.getenv('OPENAI_MAX_OUTPUT_TOKENS') or output)
+    return context, min(output, context)
+
+
+def split_paragraphs(text: str) -> List[str]:
+    """빈 줄 기준 문단 분리 (빈 줄이 없으면 줄바꿈 기준)"""
+    paragraphs = [p.strip() for p in PARAGRAPH_RE.split(text) if p.strip()]
+    if len(paragraphs) <= 1:
+        paragraphs = [p.strip() for p in text.splitlines() if p.strip()]
+    return paragraphs
+
+
+def split_sentences(paragraph: str) -> List[str]:
+    """문장 분리 (약어/소수점/이니셜 뒤나 소문자로 이어지는 곳에서는 나누지 않음)"""
+    pieces = [piece for piece in SENTENCE_BREAK_RE.split(paragraph) if piece]
+    sentences: List[str] = []
+    buffer = ''
+    for i, piece in enumerate(pieces):
+        buffer = f'{buffer} {piece}' if buffer else piece
+        end = buffer.rstrip(CLOSING_CHARS)
+        if not end or end[-1] not in SENTENCE_TERMINALS:
+            continue
+        following = pieces[i + 1] if i + 1 < len(pieces) else ''
+        if following[:1].islower():
+            continue
+        if end.endswith('.'):
+            # "Mr." 한 글자 이니셜("J.") 뒤에서는 문장을 이어 붙임
+            last_word = end.rsplit(None, 1)[-1].rstrip('.').lower()
+            if last_word in ABBREVIATIONS or (len(last_word) == 1 and last_word.isalpha()):
+                continue
+        sentences.append(buffer)
+        buffer = ''
+    if buffer:
+        sentences.append(buffer)
+    return sentences
+
+
+def _split_oversized(sentence: str, max_tokens: int) -> List[str]:
+    """예산보다 긴 문장을 단어(없으면 글자) 단위로 자름"""
+    words = sentence.split(' ')
+    units = words if len(words) > 1 else list(sentence)
+    separator = ' ' if len(words) > 1 else ''
+    pieces: List[str] = []
+    current: List[str] = []
+    current_tokens = 0
+    for unit in units:
+        unit_tokens = estimate_tokens(unit) + (1 if separator else 0)
+        if current and current_tokens + unit_tokens > max_tokens:
+            pieces.append(separator.join(current))
+            current, current_tokens = [], 0
+        current.append(unit)
+        current_tokens += unit_tokens
+    if current:
+        pieces.append(separator.join(current))
+    return pieces
+
+
+def chunk_text(text: str, max_tokens: int) -> List[str]:
+    """문단 → 문장 순으로 경계를 지키면서 max_tokens 이하의 청크로 채워 담음
+
+    문단 경계는 빈 줄로 유지하고, 한 문단이 예산을 넘으면 문장 단위로 나눈다.
+    """
+    chunks: List[str] = []
+    current: List[str] = []
+    current_tokens = 0
+
+    def flush():
+        nonlocal current, current_tokens
+        if current:
+            chunks.append(''.join(current).strip())
+        current, current_tokens = [], 0
+
+    for paragraph in split_paragraphs(text):
+        paragraph_tokens = estimate_tokens(paragraph) + 2
+        if current_tokens + paragraph_tokens <= max_tokens:
+            current.append(('\n\n' if current else '') + paragraph)
+            current_tokens += paragraph_tokens
+            continue
+
+        if paragraph_tokens <= max_tokens:
+            flush()
+            current.append(paragraph)
+            current_tokens = paragraph_tokens
+            continue
+
+        # 문단이 예산보다 크면 문장 단위로
+        separator = '\n\n' if current else ''
+        for sentence in split_sentences(paragraph):
+            for piece in (_split_oversized(sentence, max_tokens)
+                          if estimate_tokens(sentence) > max_tokens else [sentence]):
+                piece_tokens = estimate_tokens(piece) + 1
+                if current and current_tokens + piece_tokens > max_tokens:
+                    flush()
+                    separator = ''
+                current.append((separator or (' ' if current else '')) + piece)
+                separator = ''
+                current_tokens += piece_tokens
+    flush()
+    return [chunk for chunk in chunks if chunk]
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """max_tokens 안에 들어가도록 문장 경계에서 앞부분만 남김"""
+    if estimate_tokens(text) <= max_tokens:
+        return text
+    chunks = chunk_text(text, max_tokens)
+    return chunks[0] if chunks else ''
+
+
+class TokenBudget:
+    """모델 컨텍스트/출력 한도 안에서 요청 하나에 담을 입력과 max_tokens 계산
+
+    output_ratio는 입력 토큰 대비 예상 출력 토큰 비율이다 (영어 → 한국어 번역은 출력이 더 길다).
+    """
+
+    def __init__(self, model: str, system_prompt: str, output_ratio: float,
+                 safety: Optional[float] = None):
+        self.context_tokens, self.max_output_tokens = model_limits(model)
+        self.prompt_tokens = message_tokens(system_prompt)
+        self.output_ratio = output_ratio
+        # 추정 오차를 감안한 여유 비율
+        self.safety = safety or float(os.getenv('TOKEN_SAFETY_MARGIN', '1.2'))
+
+    @property
+    def max_input_tokens(self) -> int:
+        """출력이 잘리지 않고 컨텍스트에도 들어가는 입력 토큰 상한"""
+        by_output = self.max_output_tokens / (self.output_ratio * self.safety)
+        by_context = (self.context_tokens - self.prompt_tokens) / (1 + self.output_ratio * self.safety)
+        return max(1, int(min(by_output, by_context)))
+
+    def max_tokens_for(self, text: str) -> int:
+        """이 입력에 필요한 max_tokens (예상 출력 + 여유, 출력 한도와 남은 컨텍스트 이내)"""
+        input_tokens = estimate_tokens(text) + MESSAGE_OVERHEAD_TOKENS
+        needed = int(input_tokens * self.output_ratio * self.safety) + 64
+        remaining = self.context_tokens - self.prompt_tokens - input_tokens
+        return max(1, min(needed, self.max_output_tokens, remaining))
+
+    def fits(self, text: str) -> bool:
+        return estimate_tokens(text) <= self.max_input_tokens
+
+    def chunk(self, text: str) -> List[str]:
+        return chunk_text(text, self.max_input_tokens)
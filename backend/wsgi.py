@@ -0,0 +1,12 @@
+"""운영용 WSGI 진입점
+
+    gunicorn -c gunicorn.conf.py wsgi:app
+
+서비스(브라우저 풀, 커넥션 풀 등)는 import 시점에 만들지 않고, gunicorn.conf.py의
+post_fork 훅에서 워커 프로세스마다 만든다.
+"""
+import os
+
+os.environ.setdefault('LAZY_SERVICES', 'true')
+
+from app import app  # noqa: E402